@@ -5,14 +5,18 @@ Single-file native app. No browser needed.
 Uses SendInput with hardware scan codes (game-compatible).
 
 Requirements: pip install PyQt6 opencv-python mediapipe numpy
+Optional:     pip install numba orjson vgamepad  (JIT gesture kernels, faster profile I/O, virtual gamepad)
 """
 
-import sys, os, json, math, time, subprocess, threading, ctypes
+import sys, os, re, json, math, time, subprocess, threading, ctypes, queue
+from concurrent.futures import ThreadPoolExecutor
 # Disable MSMF hardware transforms to allow shared camera access
 os.environ["OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS"] = "0"
 from ctypes import wintypes
 from datetime import datetime
 from collections import deque
+from functools import lru_cache, partial
+from operator import attrgetter
 
 _missing = []
 try: import cv2
@@ -23,8 +27,10 @@ try: import numpy as np
 except ImportError: _missing.append("numpy")
 try:
     from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QMutex, QMutexLocker, QByteArray
-    from PyQt6.QtGui import QImage, QPixmap, QKeySequence, QPainter as _QPainter, QIcon
+    from PyQt6.QtCore import (Qt, QThread, pyqtSignal, pyqtSlot, QMutex, QMutexLocker, QByteArray,
+                              QRect, QRectF, QTimer, QMetaObject)
+    from PyQt6.QtGui import (QImage, QPixmap, QKeySequence, QPainter, QPainter as _QPainter, QIcon,
+                             QColor, QPen, QBrush, QPainterPath)
     from PyQt6.QtSvg import QSvgRenderer
 except ImportError: _missing.append("PyQt6")
 
@@ -36,9 +42,29 @@ try:
 except ImportError:
     vg = None
 
+# Optional: numba JIT for the per-frame gesture kernels (falls back to plain Python)
+_numba_available = False
+try:
+    from numba import njit
+    _numba_available = True
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs: return args[0]
+        return lambda fn: fn
+
+# Optional: orjson for profile export / import / auto-save (falls back to the json module)
+_orjson_available = False
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    orjson = None
+
 if _missing:
     print(f"Missing: pip install {' '.join(_missing)}")
     input("Press Enter..."); sys.exit(1)
+if not _numba_available: print("[NUMBA] Not installed; gesture kernels run as plain Python")
 
 user32 = ctypes.windll.user32
 INPUT_MOUSE, INPUT_KEYBOARD = 0, 1
@@ -62,6 +88,9 @@ class INPUT_UNION(ctypes.Union):
 class INPUT(ctypes.Structure):
     _fields_ = [("type",ctypes.c_ulong),("union",INPUT_UNION)]
 
+# dwExtraInfo for every injected event; one shared pointer instead of a fresh c_ulong per event
+_EXTRA_INFO = ctypes.pointer(ctypes.c_ulong(0))
+
 def send_input(*inputs):
     n = len(inputs); arr = (INPUT * n)(*inputs)
     user32.SendInput(n, arr, ctypes.sizeof(INPUT))
@@ -85,24 +114,59 @@ EXTENDED_VK = {0x25,0x26,0x27,0x28,0x2D,0x2E,0x24,0x23,0x21,0x22,0x90,0x2C,0x5D}
 MODIFIER_VK = {'ctrl':0xA2,'control':0xA2,'alt':0xA4,'shift':0xA0,
                'meta':0x5B,'win':0x5B,'windows':0x5B,'cmd':0x5B,'super':0x5B}
 
+@lru_cache(maxsize=256)
+def _scan_for_vk(vk):
+    """Scancode for a virtual key (MapVirtualKeyW is a syscall; the mapping is fixed per layout)."""
+    return user32.MapVirtualKeyW(vk, 0)
+
 def make_key_input(vk, key_up=False):
-    scan = user32.MapVirtualKeyW(vk, 0)
+    scan = _scan_for_vk(vk)
     flags = KEYEVENTF_SCANCODE
     if vk in EXTENDED_VK: flags |= KEYEVENTF_EXTENDEDKEY
     if key_up: flags |= KEYEVENTF_KEYUP
     inp = INPUT(); inp.type = INPUT_KEYBOARD
     inp.union.ki.wVk = 0; inp.union.ki.wScan = scan; inp.union.ki.dwFlags = flags
-    inp.union.ki.time = 0; inp.union.ki.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
+    inp.union.ki.time = 0; inp.union.ki.dwExtraInfo = _EXTRA_INFO
     return inp
 
 def make_mouse_input(flags, mouse_data=0):
     inp = INPUT(); inp.type = INPUT_MOUSE
     inp.union.mi.dx = 0; inp.union.mi.dy = 0; inp.union.mi.mouseData = mouse_data
     inp.union.mi.dwFlags = flags; inp.union.mi.time = 0
-    inp.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
+    inp.union.mi.dwExtraInfo = _EXTRA_INFO
     return inp
 
+# Reusable INPUT template for single mouse events: fields are mutated in place under
+# _INPUT_LOCK (actions fire from several worker threads) instead of allocating per event
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+_INPUT_LOCK = threading.Lock()
+_MOUSE_INPUT = INPUT(); _MOUSE_INPUT.type = INPUT_MOUSE
+_MOUSE_INPUT.union.mi.dwExtraInfo = _EXTRA_INFO
+def _input_array(*inputs): return (INPUT * len(inputs))(*inputs)
+# Fixed click/scroll sequences, built once and sent as-is (never mutated, so no lock needed)
+_MOUSE_ACTION_INPUTS = {
+    'left_click': _input_array(make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP)),
+    'right_click': _input_array(make_mouse_input(MOUSEEVENTF_RIGHTDOWN), make_mouse_input(MOUSEEVENTF_RIGHTUP)),
+    'double_click': _input_array(make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP),
+                                 make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP)),
+    'middle_click': _input_array(make_mouse_input(MOUSEEVENTF_MIDDLEDOWN), make_mouse_input(MOUSEEVENTF_MIDDLEUP)),
+    'scroll_up': _input_array(make_mouse_input(MOUSEEVENTF_WHEEL, WHEEL_DELTA * 3)),
+    'scroll_down': _input_array(make_mouse_input(MOUSEEVENTF_WHEEL, ctypes.c_ulong(-WHEEL_DELTA * 3).value)),
+}
+
+def send_input_array(arr):
+    """Send a prebuilt INPUT array in one SendInput call (injected atomically)."""
+    user32.SendInput(len(arr), arr, _INPUT_SIZE)
+
+def send_mouse(flags, mouse_data=0, dx=0, dy=0):
+    """Send one mouse event through the shared _MOUSE_INPUT template."""
+    with _INPUT_LOCK:
+        mi = _MOUSE_INPUT.union.mi; mi.dx = dx; mi.dy = dy; mi.mouseData = mouse_data; mi.dwFlags = flags
+        user32.SendInput(1, ctypes.byref(_MOUSE_INPUT), _INPUT_SIZE)
+
+@lru_cache(maxsize=512)
 def parse_key(key_str):
+    """'ctrl+shift+a' -> (modifier vk tuple, vk). Cached: bindings are few and fire repeatedly."""
     parts = key_str.split('+'); key_part = parts[-1].strip()
     mods = [MODIFIER_VK[p.strip().lower()] for p in parts[:-1] if p.strip().lower() in MODIFIER_VK]
     kl = key_part.lower()
@@ -110,66 +174,58 @@ def parse_key(key_str):
     if vk == 0 and len(key_part) == 1:
         vk = VK_CODES.get(key_part.lower(), 0)
         if vk == 0: vk = user32.VkKeyScanW(ord(key_part)) & 0xFF
-    return mods, vk
+    return tuple(mods), vk
+
+@lru_cache(maxsize=256)
+def key_chord_inputs(key_bind):
+    """Prebuilt (press, release) INPUT arrays for a key chord: mods + key down, then key + mods up.
+    None if the key doesn't resolve. Each half is one SendInput call."""
+    mods, vk = parse_key(key_bind)
+    if vk == 0: return None
+    down = [make_key_input(m) for m in mods] + [make_key_input(vk)]
+    up = [make_key_input(vk, True)] + [make_key_input(m, True) for m in reversed(mods)]
+    return _input_array(*down), _input_array(*up)
 
 def execute_key_press(key_bind):
     if not key_bind: return
-    mods, vk = parse_key(key_bind)
-    if vk == 0: return
-    for m in mods: send_input(make_key_input(m))
-    send_input(make_key_input(vk))
-    time.sleep(0.05)
-    send_input(make_key_input(vk, True))
-    for m in reversed(mods): send_input(make_key_input(m, True))
+    chord = key_chord_inputs(key_bind)
+    if chord is None: return
+    send_input_array(chord[0])
+    time.sleep(0.05)  # keep the key down long enough for apps that poll key state
+    send_input_array(chord[1])
 
 _drag_active = False
 def execute_mouse_action(t):
     global _drag_active
-    if t == 'left_click': send_input(make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP))
-    elif t == 'right_click': send_input(make_mouse_input(MOUSEEVENTF_RIGHTDOWN), make_mouse_input(MOUSEEVENTF_RIGHTUP))
-    elif t == 'double_click': send_input(make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP), make_mouse_input(MOUSEEVENTF_LEFTDOWN), make_mouse_input(MOUSEEVENTF_LEFTUP))
-    elif t == 'middle_click': send_input(make_mouse_input(MOUSEEVENTF_MIDDLEDOWN), make_mouse_input(MOUSEEVENTF_MIDDLEUP))
-    elif t == 'scroll_up': send_input(make_mouse_input(MOUSEEVENTF_WHEEL, WHEEL_DELTA * 3))
-    elif t == 'scroll_down': send_input(make_mouse_input(MOUSEEVENTF_WHEEL, ctypes.c_ulong(-WHEEL_DELTA * 3).value))
+    arr = _MOUSE_ACTION_INPUTS.get(t)
+    if arr is not None: send_input_array(arr)
     elif t == 'drag_toggle':
-        if _drag_active: send_input(make_mouse_input(MOUSEEVENTF_LEFTUP)); _drag_active = False
-        else: send_input(make_mouse_input(MOUSEEVENTF_LEFTDOWN)); _drag_active = True
+        if _drag_active: send_mouse(MOUSEEVENTF_LEFTUP); _drag_active = False
+        else: send_mouse(MOUSEEVENTF_LEFTDOWN); _drag_active = True
 
 def execute_mouse_move_relative(dx, dy):
     """Move mouse cursor by dx, dy pixels (relative)."""
     if dx == 0 and dy == 0: return
-    inp = INPUT(); inp.type = INPUT_MOUSE
-    inp.union.mi.dx = int(dx); inp.union.mi.dy = int(dy)
-    inp.union.mi.mouseData = 0; inp.union.mi.dwFlags = MOUSEEVENTF_MOVE
-    inp.union.mi.time = 0; inp.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
-    send_input(inp)
+    send_mouse(MOUSEEVENTF_MOVE, 0, int(dx), int(dy))
 
 def execute_mouse_move_absolute(nx, ny):
     """Move mouse cursor to absolute position. nx, ny: 0.0-1.0 normalized screen coords."""
     # MOUSEEVENTF_ABSOLUTE uses 0-65535 coordinate space
     ax = max(0, min(65535, int(nx * 65535)))
     ay = max(0, min(65535, int(ny * 65535)))
-    inp = INPUT(); inp.type = INPUT_MOUSE
-    inp.union.mi.dx = ax; inp.union.mi.dy = ay
-    inp.union.mi.mouseData = 0; inp.union.mi.dwFlags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
-    inp.union.mi.time = 0; inp.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
-    send_input(inp)
+    send_mouse(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE, 0, ax, ay)
 
 def execute_key_down(key_bind):
     """Press key(s) down and hold them."""
     if not key_bind: return
-    mods, vk = parse_key(key_bind)
-    if vk == 0: return
-    for m in mods: send_input(make_key_input(m))
-    send_input(make_key_input(vk))
+    chord = key_chord_inputs(key_bind)
+    if chord: send_input_array(chord[0])
 
 def execute_key_up(key_bind):
     """Release held key(s)."""
     if not key_bind: return
-    mods, vk = parse_key(key_bind)
-    if vk == 0: return
-    send_input(make_key_input(vk, True))
-    for m in reversed(mods): send_input(make_key_input(m, True))
+    chord = key_chord_inputs(key_bind)
+    if chord: send_input_array(chord[1])
 
 _MOUSE_DOWN_FLAGS = {
     'left_click': MOUSEEVENTF_LEFTDOWN, 'right_click': MOUSEEVENTF_RIGHTDOWN,
@@ -183,12 +239,12 @@ _MOUSE_UP_FLAGS = {
 def execute_mouse_down(action_type):
     """Press mouse button down (for hold/toggle modes)."""
     f = _MOUSE_DOWN_FLAGS.get(action_type)
-    if f: send_input(make_mouse_input(f))
+    if f: send_mouse(f)
 
 def execute_mouse_up(action_type):
     """Release mouse button (for hold/toggle modes)."""
     f = _MOUSE_UP_FLAGS.get(action_type)
-    if f: send_input(make_mouse_input(f))
+    if f: send_mouse(f)
 
 def execute_hold_start(action_type, key_bind='', gamepad_btn=''):
     """Start a sustained hold (key down or mouse down or gamepad button down)."""
@@ -202,8 +258,18 @@ def execute_hold_stop(action_type, key_bind='', gamepad_btn=''):
     elif action_type == 'gamepad_button' and gamepad_btn: execute_gamepad_button_up(gamepad_btn)
     elif action_type in _MOUSE_UP_FLAGS: execute_mouse_up(action_type)
 
+# Key values may contain the macro delimiters; they are backslash-escaped when a macro string is built
+_MACRO_ESCAPES = {';': r'\;', ':': r'\:', '\\': r'\\'}
+_MACRO_ESC_RE = re.compile('[' + re.escape(''.join(_MACRO_ESCAPES)) + ']')
+_MACRO_UNESC_RE = re.compile(r'\\(.)')
+_MACRO_PART_RE = re.compile(r'(?:\\.|[^\\;]|\\$)+')  # a step up to the next unescaped ';'
+
+def _esc(s): return _MACRO_ESC_RE.sub(lambda m: _MACRO_ESCAPES[m.group(0)], s)
+def _unesc(s): return _MACRO_UNESC_RE.sub(r'\1', s) if '\\' in s else s
+
+@lru_cache(maxsize=128)
 def parse_macro(macro_str):
-    """Parse macro string into list of steps.
+    """Parse macro string into a tuple of steps (cached: macros are edited rarely, fired often).
     Format: step;step;step  (semicolon-separated)
     Steps:
       key:W           - press and release key W
@@ -212,33 +278,65 @@ def parse_macro(macro_str):
       mouse:left_click - left click
       mouse:scroll_up  - scroll up
       delay:100        - wait 100ms
+    Key values escape ';', ':' and '\\' with a backslash.
     """
     steps = []
-    for part in macro_str.split(';'):
+    parts = _MACRO_PART_RE.findall(macro_str) if '\\' in macro_str else macro_str.split(';')
+    for part in parts:
         part = part.strip()
         if not part: continue
         if part.startswith('key:'):
-            steps.append(('key', part[4:].strip()))
+            steps.append(('key', _unesc(part[4:].strip())))
         elif part.startswith('hold:'):
             # hold:key:duration_ms
             rest = part[5:]
             pieces = rest.rsplit(':', 1)
             if len(pieces) == 2:
-                try: steps.append(('hold', pieces[0].strip(), int(pieces[1].strip())))
+                try: steps.append(('hold', _unesc(pieces[0].strip()), int(pieces[1].strip())))
                 except ValueError: pass
             else:
-                steps.append(('key', rest.strip()))
+                steps.append(('key', _unesc(rest.strip())))
         elif part.startswith('mouse:'):
             steps.append(('mouse', part[6:].strip()))
         elif part.startswith('delay:'):
             try: steps.append(('delay', int(part[6:].strip())))
             except ValueError: pass
-    return steps
+    return tuple(steps)
+
+# Profiles before this version split macros on every ';' and stored key values unescaped
+MACRO_ESCAPE_VERSION = (0, 8, 0)
+
+def _profile_version(cfg):
+    try: return tuple(int(x) for x in str(cfg.get('version', '0')).split('.'))
+    except ValueError: return (0,)
+
+def _migrate_macro(macro_str):
+    """Re-escape an old-format macro string so parse_macro reads it the way the old parser did."""
+    if not macro_str or not _MACRO_ESC_RE.search(macro_str.replace(';', '')): return macro_str
+    out = []
+    for part in macro_str.split(';'):
+        p = part.strip()
+        if p.startswith('key:'): part = 'key:' + _esc(p[4:].strip())
+        elif p.startswith('hold:'):
+            pieces = p[5:].rsplit(':', 1)
+            part = 'hold:' + _esc(pieces[0].strip()) + (':' + pieces[1] if len(pieces) == 2 else '')
+        out.append(part)
+    return ';'.join(out)
+
+def _migrate_cfg_macros(node):
+    """Copy of a pre-0.8.0 profile with every 'macro' value (cards, chains, libraries, PT) re-escaped."""
+    if isinstance(node, dict):
+        return {k: _migrate_macro(v) if k == 'macro' and isinstance(v, str) else _migrate_cfg_macros(v) for k, v in node.items()}
+    if isinstance(node, list): return [_migrate_cfg_macros(v) for v in node]
+    return node
 
 def execute_macro(macro_str):
     """Execute a macro sequence."""
     if not macro_str: return
-    steps = parse_macro(macro_str)
+    execute_macro_steps(parse_macro(macro_str))
+
+def execute_macro_steps(steps):
+    """Execute already-parsed macro steps (see parse_macro)."""
     prev_type = None
     for step in steps:
         # Auto-insert 50ms delay between consecutive mouse or key actions
@@ -251,13 +349,11 @@ def execute_macro(macro_str):
         elif step[0] == 'delay':
             time.sleep(step[1] / 1000.0)
         elif step[0] == 'hold':
-            mods, vk = parse_key(step[1])
-            if vk:
-                for m in mods: send_input(make_key_input(m))
-                send_input(make_key_input(vk))
+            chord = key_chord_inputs(step[1])
+            if chord:
+                send_input_array(chord[0])
                 time.sleep(step[2] / 1000.0)
-                send_input(make_key_input(vk, True))
-                for m in reversed(mods): send_input(make_key_input(m, True))
+                send_input_array(chord[1])
         prev_type = step[0]
 
 def execute_action(action_type, key_bind='', command='', macro='', gamepad_btn='', gamepad_axis_id=''):
@@ -278,46 +374,32 @@ def execute_action(action_type, key_bind='', command='', macro='', gamepad_btn='
             except: print(f"[LAUNCH] Failed to launch: {command} - {e}")
     else: execute_mouse_action(action_type)
 
+def execute_action_batch(batch):
+    """Run one frame's actions in fire order on a single worker; chords from one frame never interleave."""
+    for args in batch: execute_action(*args)
+
+winmm = ctypes.windll.winmm
+_sound_aliases = {}  # file path -> MCI alias (device stays open for the app's lifetime)
+_sound_lock = threading.Lock()
+
 def play_sound_file(filename):
-    """Play an MP3/WAV file using PowerShell MediaPlayer (reliable on all Windows)."""
+    """Play an MP3/WAV file via MCI (winmm). The file is opened once under an alias;
+    later calls just restart it, so a trigger costs one mciSendString call."""
     fpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
-    print(f"[SOUND] Attempting to play: {fpath}")
-    if not os.path.exists(fpath):
-        print(f"[SOUND] ERROR: File not found: {fpath}")
-        return
-    print(f"[SOUND] File exists, size: {os.path.getsize(fpath)} bytes")
-    fpath_ps = fpath.replace("'", "''")
-    ps_cmd = (
-        f"try {{"
-        f"  Add-Type -AssemblyName PresentationCore;"
-        f"  $p=New-Object System.Windows.Media.MediaPlayer;"
-        f"  $p.Open([Uri]'{fpath_ps}');"
-        f"  Start-Sleep -Milliseconds 500;"
-        f"  $p.Play();"
-        f"  Start-Sleep -Seconds 10;"
-        f"  $p.Close()"
-        f"}} catch {{"
-        f"  $_ | Out-File -FilePath '{fpath_ps}.error.log'"
-        f"}}"
-    )
-    cmd = ['powershell', '-WindowStyle', 'Hidden', '-Command', ps_cmd]
-    print(f"[SOUND] Running: {' '.join(cmd[:3])}...")
-    try:
-        proc = subprocess.Popen(cmd, creationflags=0x08000000,
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        print(f"[SOUND] PowerShell PID: {proc.pid}")
-        # Check result in background
-        def _check():
-            out, err = proc.communicate(timeout=15)
-            if proc.returncode != 0:
-                print(f"[SOUND] PowerShell exited with code {proc.returncode}")
-                if err: print(f"[SOUND] stderr: {err.decode('utf-8','replace')}")
-                if out: print(f"[SOUND] stdout: {out.decode('utf-8','replace')}")
-            else:
-                print(f"[SOUND] PowerShell completed OK")
-        threading.Thread(target=_check, daemon=True).start()
-    except Exception as e:
-        print(f"[SOUND] ERROR launching PowerShell: {e}")
+    with _sound_lock:
+        alias = _sound_aliases.get(fpath)
+        if alias is None:
+            if not os.path.exists(fpath):
+                print(f"[SOUND] ERROR: File not found: {fpath}")
+                return
+            alias = f"fcsound{len(_sound_aliases)}"
+            err = winmm.mciSendStringW(f'open "{fpath}" type mpegvideo alias {alias}', None, 0, None)
+            if err:
+                print(f"[SOUND] ERROR: MCI open failed ({err}): {fpath}")
+                return
+            _sound_aliases[fpath] = alias
+        err = winmm.mciSendStringW(f"play {alias} from 0", None, 0, None)
+        if err: print(f"[SOUND] ERROR: MCI play failed ({err}): {fpath}")
 
 
 # ••• VIRTUAL GAMEPAD •••
@@ -341,6 +423,8 @@ GAMEPAD_AXES = [
     ('left_trigger', 'Left Trigger', 0, 255),
     ('right_trigger', 'Right Trigger', 0, 255),
 ]
+GAMEPAD_BUTTON_INDEX = {b[0]:i for i,b in enumerate(GAMEPAD_BUTTONS)}
+GAMEPAD_AXIS_INDEX = {a[0]:i for i,a in enumerate(GAMEPAD_AXES)}
 
 
 class VirtualGamepad:
@@ -479,9 +563,44 @@ LIP_CENTER_UPPER = 0; LIP_CENTER_LOWER = 17; LIP_LEFT = 61; LIP_RIGHT = 291
 LEFT_BROW_INNER = 107; RIGHT_BROW_INNER = 336
 LEFT_INNER_EYE = 133; RIGHT_INNER_EYE = 362
 
-def _dist(a,b): return math.sqrt((a.x-b.x)**2+(a.y-b.y)**2+(getattr(a,'z',0)-getattr(b,'z',0))**2)
-def _ear(lm,idx):
-    p=[lm[i] for i in idx]; return(_dist(p[1],p[5])+_dist(p[2],p[4]))/(2*_dist(p[0],p[3])+0.0001)
+# Index arrays for the vectorized (SoA) landmark math in GestureDetector.compute
+_LEFT_EYEBROW_IDX = np.array(LEFT_EYEBROW, dtype=np.intp)
+_RIGHT_EYEBROW_IDX = np.array(RIGHT_EYEBROW, dtype=np.intp)
+# Landmark pairs whose distance is needed every frame (row order = slot in compute)
+_DIST_PAIRS = np.array([
+    (LEFT_CHEEK, RIGHT_CHEEK), (NOSE_TIP, CHIN),                              # 0 face width, 1 face height
+    (LEFT_EYE_EAR[1], LEFT_EYE_EAR[5]), (LEFT_EYE_EAR[2], LEFT_EYE_EAR[4]),   # 2-3 left EAR verticals
+    (LEFT_EYE_EAR[0], LEFT_EYE_EAR[3]),                                       # 4 left EAR horizontal
+    (RIGHT_EYE_EAR[1], RIGHT_EYE_EAR[5]), (RIGHT_EYE_EAR[2], RIGHT_EYE_EAR[4]),  # 5-6 right EAR verticals
+    (RIGHT_EYE_EAR[0], RIGHT_EYE_EAR[3]),                                     # 7 right EAR horizontal
+    (LEFT_EYE_TOP, LEFT_EYE_BOT), (RIGHT_EYE_TOP, RIGHT_EYE_BOT),             # 8-9 eye openings
+    (UPPER_LIP, LOWER_LIP), (MOUTH_LEFT, MOUTH_RIGHT),                        # 10 mouth open, 11 mouth width
+    (LEFT_BROW_INNER, RIGHT_BROW_INNER),                                      # 12 inner brow gap
+], dtype=np.intp)
+_DIST_A = _DIST_PAIRS[:, 0].copy(); _DIST_B = _DIST_PAIRS[:, 1].copy()
+# Highlighted feature landmarks drawn over the mesh in MainWindow._of (flat SoA: index + RGB colour per point;
+# the preview frame arrives already converted to RGB)
+_FEATURE_GROUPS = (
+    (LEFT_EYE_EAR, (136,255,0)), (RIGHT_EYE_EAR, (136,255,0)),
+    (LEFT_EYEBROW, (255,212,0)), (RIGHT_EYEBROW, (255,212,0)),
+    ([UPPER_LIP,LOWER_LIP,MOUTH_LEFT,MOUTH_RIGHT,LIP_TOP_OUTER,LIP_BOT_OUTER], (102,68,255)),
+    ([MOUTH_CORNER_LEFT,MOUTH_CORNER_RIGHT], (170,221,68)),
+    ([LEFT_BROW_INNER,RIGHT_BROW_INNER], (255,68,204)))
+FEATURE_IDX = np.array([i for idx, _ in _FEATURE_GROUPS for i in idx], dtype=np.int32)
+FEATURE_COLOR = np.array([clr for idx, clr in _FEATURE_GROUPS for _ in idx], dtype=np.uint8)
+# Pixel offsets of a filled radius-3 disc, stamped at every visible feature point in one fancy-index write
+_STAMP_DY, _STAMP_DX = (a.ravel() for a in np.mgrid[-3:4, -3:4])
+_STAMP_IN = _STAMP_DY*_STAMP_DY + _STAMP_DX*_STAMP_DX <= 10
+_STAMP_DY = _STAMP_DY[_STAMP_IN].astype(np.int32); _STAMP_DX = _STAMP_DX[_STAMP_IN].astype(np.int32)
+
+_LM_GETTERS = (attrgetter('x'), attrgetter('y'), attrgetter('z'))
+
+def _landmarks_to_array(lm):
+    """Pack MediaPipe landmarks into an (N,3) float32 array, one x,y,z row per landmark.
+    Fills one column per coordinate with C-level map/fromiter instead of a per-point tuple loop."""
+    n = len(lm); out = np.empty((n, 3), np.float32)
+    for j, get in enumerate(_LM_GETTERS): out[:, j] = np.fromiter(map(get, lm), np.float32, n)
+    return out
 
 class OneEuroFilter:
     """One-Euro filter for smooth, low-latency signal filtering.
@@ -508,27 +627,28 @@ class OneEuroFilter:
 
 class LandmarkSmoother:
     """Applies One-Euro filtering to all landmark x,y,z coordinates.
-    Produces a smoothed copy of the landmark list each frame."""
-    def __init__(self, num_landmarks=478, freq=30.0, min_cutoff=1.5, beta=0.01):
-        self._n = num_landmarks; self._freq = freq; self._mc = min_cutoff; self._beta = beta
-        self._filters = None  # lazy init
-    def reset(self): self._filters = None
-    def smooth(self, lm):
-        """Takes raw landmarks, returns smoothed landmarks (as list of SimpleNamespace)."""
-        n = min(len(lm), self._n)
-        if self._filters is None:
-            # 3 filters per landmark: x, y, z
-            self._filters = [(OneEuroFilter(self._freq, self._mc, self._beta),
-                              OneEuroFilter(self._freq, self._mc, self._beta),
-                              OneEuroFilter(self._freq, self._mc, self._beta)) for _ in range(self._n)]
-        from types import SimpleNamespace
-        t = time.time()
-        out = []
-        for i in range(n):
-            fx, fy, fz = self._filters[i]
-            sx = fx(lm[i].x, t); sy = fy(lm[i].y, t); sz = fz(getattr(lm[i], 'z', 0), t)
-            out.append(SimpleNamespace(x=sx, y=sy, z=sz))
-        return out
+    Runs the OneEuroFilter math elementwise over the whole (N,3) array (same result as one
+    independent filter per coordinate), in place on buffers allocated once per stream."""
+    def __init__(self, num_landmarks=478, freq=30.0, min_cutoff=1.5, beta=0.01, d_cutoff=1.0):
+        self._n = num_landmarks; self._freq = freq; self._mc = min_cutoff; self._beta = beta; self._dc = d_cutoff
+        self._x = None  # lazy init
+    def reset(self): self._x = None
+    def smooth(self, pts):
+        """Takes raw (N,3) landmark array, returns the smoothed array (a buffer reused next call)."""
+        pts = pts[:self._n]; t = time.time()
+        if self._x is None or pts.shape != self._x.shape:  # (re)start on first frame or landmark-count change
+            self._x = pts.astype(np.float32); self._dx = np.zeros_like(self._x)
+            self._a = np.empty_like(self._x); self._d = np.empty_like(self._x); self._t = t
+            return self._x
+        dt = max(t - self._t, 0.001); self._t = t
+        a_d = 1.0 / (1.0 + 1.0 / (2.0 * math.pi * self._dc * dt))
+        a = self._a; d = self._d
+        np.subtract(pts, self._x, out=d)
+        np.multiply(d, a_d / dt, out=a); self._dx *= (1 - a_d); self._dx += a     # dx_hat
+        np.abs(self._dx, out=a); a *= self._beta; a += self._mc                    # cutoff
+        a *= 2.0 * math.pi * dt; np.reciprocal(a, out=a); a += 1.0; np.reciprocal(a, out=a)  # alpha(cutoff)
+        d *= a; self._x += d                                                       # x_hat = x_prev + alpha*(x - x_prev)
+        return self._x
 
 CAL_N = 45
 
@@ -641,234 +761,299 @@ class PointTracker:
         return dx, dy
 
 
+# Fixed gesture slot order of the compute kernel's result vector (same order as GESTURES)
+GESTURE_ORDER = ('eyebrow_raise', 'eyebrow_raise_left', 'eyebrow_raise_right', 'brow_furrow',
+                 'blink', 'wink_left', 'wink_right', 'smile', 'mouth_open', 'pucker',
+                 'smirk_left', 'smirk_right', 'head_up', 'head_down', 'head_left', 'head_right')
+GESTURE_INDEX = {gid: i for i, gid in enumerate(GESTURE_ORDER)}
+_DEFAULT_SENS = np.ones(len(GESTURE_ORDER))
+# Calibration feature slots (baseline = mean over the first CAL_N frames); the kernel's
+# feature vector carries the two eye aspect ratios after these
+FEATURE_KEYS = ('br', 'lbr', 'rbr', 'sr', 'mo', 'pitch', 'pucker_w', 'mouth_asym', 'ul_nose',
+                'll_nose', 'corner_nose', 'brow_gap', 'brow_eye_gap', 'head_yaw', 'head_pitch_y')
+_N_CAL_FEAT = len(FEATURE_KEYS); _N_FEAT = _N_CAL_FEAT + 2
+# Every landmark the features read (iris excluded: it only nudges the EARs and is absent
+# from 468-point meshes); GestureDetector fingerprints these to spot a still face
+_FEATURE_LM_IDX = np.unique(np.concatenate([_DIST_PAIRS.ravel(), _LEFT_EYEBROW_IDX, _RIGHT_EYEBROW_IDX, [10]]))
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _features_njit(pts, gaze_comp):
+    """Face features from the (N,3) landmark array, in FEATURE_KEYS order + (left EAR, right EAR).
+    gaze_comp: apply iris-based gaze compensation to the EARs (only once calibrated)."""
+    _sqrt = math.sqrt  # local alias: LOAD_FAST in the loop when running without numba
+    d = np.empty(_DIST_A.shape[0])
+    for k in range(_DIST_A.shape[0]):
+        a = _DIST_A[k]; b = _DIST_B[k]
+        dx = pts[a, 0] - pts[b, 0]; dy = pts[a, 1] - pts[b, 1]; dz = pts[a, 2] - pts[b, 2]
+        d[k] = _sqrt(dx*dx + dy*dy + dz*dz)
+    fw = d[0]; fh = d[1]
+    le = (d[2]+d[3])/(2*d[4]+0.0001); re = (d[5]+d[6])/(2*d[7]+0.0001)
+
+    # Gaze-compensated EAR
+    if gaze_comp and pts.shape[0] > RIGHT_IRIS:
+        leh = d[8]; reh = d[9]
+        if leh > 0.001 and reh > 0.001:
+            l_gy = (pts[LEFT_IRIS, 1] - pts[LEFT_EYE_TOP, 1]) / (leh + 0.0001)
+            r_gy = (pts[RIGHT_IRIS, 1] - pts[RIGHT_EYE_TOP, 1]) / (reh + 0.0001)
+            COMP = 0.15
+            le = le + max(0.0, l_gy - 0.5) * 2 * COMP
+            re = re + max(0.0, r_gy - 0.5) * 2 * COMP
+
+    hairline_y = pts[10, 1]
+    ref_len = fw + 0.0001
+    lby = 0.0; rby = 0.0
+    for i in _LEFT_EYEBROW_IDX: lby += pts[i, 1]
+    for i in _RIGHT_EYEBROW_IDX: rby += pts[i, 1]
+    lby /= _LEFT_EYEBROW_IDX.shape[0]; rby /= _RIGHT_EYEBROW_IDX.shape[0]
+    aby = (lby+rby)/2
+
+    f = np.empty(_N_FEAT)
+    f[0] = (aby - hairline_y) / ref_len                         # br
+    f[1] = (lby - hairline_y) / ref_len                         # lbr
+    f[2] = (rby - hairline_y) / ref_len                         # rbr
+    f[3] = d[11]/fw                                             # sr (mouth width)
+    f[4] = d[10]/fw  # mo: normalize by face WIDTH, not height (beard-robust)
+    # pitch: forehead z - nose z (positive = looking down)
+    f[5] = pts[10, 2] - pts[1, 2]
+    f[6] = f[3]                                                 # pucker_w: mouth narrows horizontally
+    # Smirk: asymmetry of mouth corners, by face height so head tilt scale doesn't matter
+    f[7] = (pts[MOUTH_CORNER_RIGHT, 1] - pts[MOUTH_CORNER_LEFT, 1]) / (fh + 0.0001)  # positive = left smirk
+    # Directional lip signals for separating smile from mouth_open:
+    # Smile: upper lip rises toward nose + corners rise; mouth open: lower lip drops away from nose
+    nose_y = pts[NOSE_TIP, 1]
+    f[8] = (pts[UPPER_LIP, 1] - nose_y) / (fw + 0.0001)        # ul_nose: shrinks when smiling
+    f[9] = (pts[LOWER_LIP, 1] - nose_y) / (fw + 0.0001)        # ll_nose: grows when jaw drops
+    corner_avg_y = (pts[MOUTH_LEFT, 1] + pts[MOUTH_RIGHT, 1]) / 2
+    f[10] = (corner_avg_y - nose_y) / (fw + 0.0001)             # corner_nose: shrinks when smiling
+    # Brow furrow: brow-to-eye-corner gap (pitch-robust) + inter-brow gap
+    # Use fw (face width) not fh: fh changes when mouth opens (chin drops), causing crosstalk
+    f[11] = d[12] / (fw + 0.0001)                               # brow_gap
+    l_brow_eye_gap = (pts[LEFT_BROW_INNER, 1] - pts[LEFT_INNER_EYE, 1]) / (fw + 0.0001)
+    r_brow_eye_gap = (pts[RIGHT_BROW_INNER, 1] - pts[RIGHT_INNER_EYE, 1]) / (fw + 0.0001)
+    f[12] = (l_brow_eye_gap + r_brow_eye_gap) / 2               # brow_eye_gap
+    # Head yaw: nose tip X relative to face midpoint (positive = user turns right)
+    face_mid_x = (pts[LEFT_CHEEK, 0] + pts[RIGHT_CHEEK, 0]) / 2.0
+    f[13] = (pts[NOSE_TIP, 0] - face_mid_x) / (fw + 0.0001)
+    # Head pitch: nose Y relative to face vertical center (positive = looking down)
+    face_mid_y = (hairline_y + pts[CHIN, 1]) / 2.0
+    f[14] = (nose_y - face_mid_y) / (fh + 0.0001)
+    f[15] = le; f[16] = re
+    return f
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _accumulate_njit(cal_sum, f):
+    """Calibration step: add one frame's features to the running baseline sum."""
+    for i in range(cal_sum.shape[0]): cal_sum[i] += f[i]
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _compute_njit(f, bl, sens, tilt_comp, calibrated, out):
+    """Write gesture intensities 0-100 into out (GESTURE_ORDER) from features f, baseline bl
+    and per-gesture sensitivity multipliers (>1 = less motion needed)."""
+    out[:] = 0
+    le = f[15]; re = f[16]
+    blink = max(0.0, min(100.0, (1-(((le+re)/2)-0.05)/(0.30/sens[4]))*100))
+    log_ratio = math.log((le + 0.001) / (re + 0.001))
+    wink_left = max(0.0, min(100.0, -log_ratio / (0.6/sens[5]) * 100))
+    wink_right = max(0.0, min(100.0, log_ratio / (0.6/sens[6]) * 100))
+    out[4] = blink; out[5] = wink_left; out[6] = wink_right
+    if not calibrated: return
+
+    br = f[0]; lbr = f[1]; rbr = f[2]; sr = f[3]
+    pitch_indicator = f[5]; pucker_width = f[6]; mouth_asym = f[7]
+    upper_lip_to_nose = f[8]; lower_lip_to_nose = f[9]; corner_to_nose = f[10]
+    brow_inner_gap = f[11]; brow_eye_gap = f[12]; head_yaw = f[13]; head_pitch_y = f[14]
+
+    pitch_dev = pitch_indicator - bl[5]
+    pitch_comp = pitch_dev * -(tilt_comp / 100.0)
+
+    raw_left = max(0.0, min(100.0, (bl[1]-(lbr - pitch_comp))/(0.03/sens[1])*100))
+    raw_right = max(0.0, min(100.0, (bl[2]-(rbr - pitch_comp))/(0.03/sens[2])*100))
+
+    both_threshold = 85
+    if raw_left >= both_threshold and raw_right >= both_threshold:
+        eyebrow_raise = max(0.0, min(100.0, (bl[0]-(br - pitch_comp))/(0.03/sens[0])*100))
+        eyebrow_raise_left = 0.0; eyebrow_raise_right = 0.0
+    else:
+        eyebrow_raise = 0.0
+        eyebrow_raise_left = raw_left; eyebrow_raise_right = raw_right
+
+    # Smile: corners rise + upper lip rises + mouth widens
+    # All three go negative (toward nose) when smiling
+    s_sm = sens[7]
+    corner_rise = (bl[10] - corner_to_nose) / (0.04/s_sm)
+    upper_rise = (bl[8] - upper_lip_to_nose) / (0.03/s_sm)
+    width_inc = (sr - bl[3]) / (0.10/s_sm)
+    smile = max(0.0, min(100.0, (corner_rise*0.40 + upper_rise*0.25 + width_inc*0.35) * 100))
+
+    # Mouth open: lower lip drops away from nose (jaw drops)
+    lower_drop = (lower_lip_to_nose - bl[9]) / (0.06/sens[8])
+    mouth_open = max(0.0, min(100.0, lower_drop * 100))
+    # Suppress mouth_open when smiling strongly (smile pulls lower lip slightly)
+    if smile > 50:
+        mouth_open = max(0.0, mouth_open - smile * 0.3)
+
+    # Pucker: purely mouth width narrowing
+    w_shrink = (bl[6] - pucker_width) / (0.05/sens[9])
+    raw_pucker = max(0.0, min(100.0, w_shrink * 100))
+    if smile > 40 or mouth_open > 40: raw_pucker *= 0.2
+    pucker = max(0.0, min(100.0, raw_pucker))
+
+    # Smirk: mouth corner asymmetry
+    asym_dev = mouth_asym - bl[7]
+    smirk_left = max(0.0, min(100.0, asym_dev / (0.025/sens[10]) * 100))
+    smirk_right = max(0.0, min(100.0, -asym_dev / (0.025/sens[11]) * 100))
+
+    # ---- CROSS-GESTURE SUPPRESSION ----
+
+    # Smirk suppresses smile: a smirk is intentionally asymmetric, not a smile.
+    # Strong smirk means the "smile" reading is just bleed from one-sided corner rise.
+    smirk_max = max(smirk_left, smirk_right)
+    if smirk_max > 30:
+        smile = max(0.0, smile - smirk_max * 0.7)
+
+    # Wink suppresses opposite eyebrow: squinting one eye physically shifts brow landmarks
+    # on both sides via skin tension and mesh coupling.
+    if wink_left > 30:
+        eyebrow_raise_right = max(0.0, eyebrow_raise_right - wink_left * 0.6)
+    if wink_right > 30:
+        eyebrow_raise_left = max(0.0, eyebrow_raise_left - wink_right * 0.6)
+    # Also suppress same-side brow (winking can bunch up skin above the eye)
+    if wink_left > 40:
+        eyebrow_raise_left = max(0.0, eyebrow_raise_left - wink_left * 0.4)
+    if wink_right > 40:
+        eyebrow_raise_right = max(0.0, eyebrow_raise_right - wink_right * 0.4)
+
+    # Pucker suppresses eyebrow raise: lip pursing pulls facial skin and shifts
+    # brow landmarks relative to hairline reference, creating phantom raise.
+    if pucker > 25:
+        pucker_suppress = pucker * 0.5
+        eyebrow_raise = max(0.0, eyebrow_raise - pucker_suppress)
+        eyebrow_raise_left = max(0.0, eyebrow_raise_left - pucker_suppress)
+        eyebrow_raise_right = max(0.0, eyebrow_raise_right - pucker_suppress)
+
+    # Blink suppresses eyebrow raise: closing both eyes creates similar skin bunching
+    if blink > 40:
+        blink_suppress = blink * 0.5
+        eyebrow_raise = max(0.0, eyebrow_raise - blink_suppress)
+        eyebrow_raise_left = max(0.0, eyebrow_raise_left - blink_suppress)
+        eyebrow_raise_right = max(0.0, eyebrow_raise_right - blink_suppress)
+
+    # Brow furrow: pitch-robust via brow-to-eye-corner gap
+    # Apply pitch compensation: tilting forward shrinks brow_eye_gap artificially
+    s_bf = sens[3]
+    compensated_brow_eye_gap = brow_eye_gap - pitch_comp * 0.5
+    brow_drop = (compensated_brow_eye_gap - bl[12]) / (0.015/s_bf)
+    gap_shrink = (bl[11] - brow_inner_gap) / (0.03/s_bf)
+    raw_furrow = max(0.0, min(100.0, (brow_drop*0.55 + gap_shrink*0.45) * 100))
+    if eyebrow_raise > 30 or raw_left > 30 or raw_right > 30:
+        raw_furrow *= 0.1
+    # Suppress when mouth is open (residual crosstalk from jaw mechanics)
+    if mouth_open > 30:
+        raw_furrow *= max(0.0, 1.0 - mouth_open / 80.0)
+    brow_furrow = max(0.0, min(100.0, raw_furrow))
+
+    # Head yaw (left/right turn)
+    yaw_dev = head_yaw - bl[13]
+    # yaw_dev positive = nose moved right = user turned right (in mirrored view: head_right)
+    # Sensitivity divisor: ~0.04 normalized units = full turn at 1x sensitivity
+    head_right = max(0.0, min(100.0, yaw_dev / (0.04/sens[15]) * 100))
+    head_left = max(0.0, min(100.0, -yaw_dev / (0.04/sens[14]) * 100))
+
+    # Head pitch (up/down tilt) - combine Z-based pitch and Y-based pitch for robustness
+    pitch_y_dev = head_pitch_y - bl[14]
+    # pitch_y_dev positive = nose moved down = looking down
+    # pitch_dev (Z-based) positive = forehead closer = looking down
+    combined_pitch = pitch_y_dev * 0.6 + pitch_dev * 0.4
+    head_down = max(0.0, min(100.0, combined_pitch / (0.03/sens[13]) * 100))
+    head_up = max(0.0, min(100.0, -combined_pitch / (0.03/sens[12]) * 100))
+
+    out[0] = eyebrow_raise; out[1] = eyebrow_raise_left; out[2] = eyebrow_raise_right
+    out[3] = brow_furrow; out[7] = smile; out[8] = mouth_open; out[9] = pucker
+    out[10] = smirk_left; out[11] = smirk_right
+    out[12] = head_up; out[13] = head_down; out[14] = head_left; out[15] = head_right
+
 class GestureDetector:
+    """Calibrated gesture readings from landmark arrays. compute() runs on the camera's
+    gesture worker while reset() comes from the UI thread, so both hold _lock."""
+    CACHE_EPS = 3e-4        # mean |delta| of feature landmarks (normalized) treated as "not moving"
+    CACHE_REVALIDATE = 10   # force a full compute at least every N frames
     def __init__(self):
-        self._lm_smoother = LandmarkSmoother()
+        self._lm_smoother = LandmarkSmoother(); self._lock = threading.Lock()
+        self._raw_buf = np.zeros(len(GESTURE_ORDER), np.float32)
+        self.cache_hits = 0; self.cache_calls = 0  # still-face cache hit rate, for tuning CACHE_EPS
         self.reset()
     def reset(self):
-        self.cal_n=0; self.cal_s={}; self.bl={}
-        self._lm_smoother.reset()
+        with self._lock:
+            self.cal_n=0; self.cal_s=np.zeros(_N_CAL_FEAT); self.bl=np.zeros(_N_CAL_FEAT)
+            self._lm_smoother.reset()
+            self._fp = None; self._cache_age = 0; self._cache_tilt = None; self._cache_sens = None
     @property
     def calibrated(self): return self.cal_n >= CAL_N
     @property
     def cal_pct(self): return int(min(100, self.cal_n/CAL_N*100))
 
-    def compute(self, lm, tilt_comp=35, sens=None, lm_smooth=True):
-        """sens: dict of gesture_id -> multiplier. >1 = less motion needed, <1 = more motion needed."""
-        if sens is None: sens = {}
-        # Apply One-Euro filtering to raw landmarks before any computation
-        if lm_smooth:
-            lm = self._lm_smoother.smooth(lm)
-        raw = {}
-        fw = _dist(lm[LEFT_CHEEK],lm[RIGHT_CHEEK])
-        fh = _dist(lm[NOSE_TIP],lm[CHIN])
-        le = _ear(lm,LEFT_EYE_EAR); re = _ear(lm,RIGHT_EYE_EAR)
-
-        # Gaze-compensated EAR
-        has_iris = len(lm) > RIGHT_IRIS
-        if has_iris and self.calibrated:
-            leh = _dist(lm[LEFT_EYE_TOP], lm[LEFT_EYE_BOT])
-            reh = _dist(lm[RIGHT_EYE_TOP], lm[RIGHT_EYE_BOT])
-            if leh > 0.001 and reh > 0.001:
-                l_gy = (lm[LEFT_IRIS].y - lm[LEFT_EYE_TOP].y) / (leh + 0.0001)
-                r_gy = (lm[RIGHT_IRIS].y - lm[RIGHT_EYE_TOP].y) / (reh + 0.0001)
-                COMP = 0.15
-                le = le + max(0, l_gy - 0.5) * 2 * COMP
-                re = re + max(0, r_gy - 0.5) * 2 * COMP
-
-        raw['blink'] = max(0,min(100,(1-(((le+re)/2)-0.05)/(0.30/sens.get('blink',1.0)))*100))
-        log_ratio = math.log((le + 0.001) / (re + 0.001))
-        raw['wink_left'] = max(0, min(100, -log_ratio / (0.6/sens.get('wink_left',1.0)) * 100))
-        raw['wink_right'] = max(0, min(100, log_ratio / (0.6/sens.get('wink_right',1.0)) * 100))
-
-        hairline = lm[10]
-        ref_len = fw + 0.0001
-        lby = sum(lm[i].y for i in LEFT_EYEBROW)/5
-        rby = sum(lm[i].y for i in RIGHT_EYEBROW)/5
-        aby = (lby+rby)/2
-        br = (aby - hairline.y) / ref_len
-        lbr = (lby - hairline.y) / ref_len
-        rbr = (rby - hairline.y) / ref_len
-
-        mo = _dist(lm[UPPER_LIP],lm[LOWER_LIP])/fw  # normalize by face WIDTH, not height (beard-robust)
-        sr = _dist(lm[MOUTH_LEFT],lm[MOUTH_RIGHT])/fw
-
-        # Directional lip signals for separating smile from mouth_open:
-        # Smile: upper lip rises toward nose + corners rise
-        # Mouth open: lower lip drops away from nose
-        upper_lip_to_nose = (lm[UPPER_LIP].y - lm[NOSE_TIP].y) / (fw + 0.0001)  # shrinks when smiling
-        lower_lip_to_nose = (lm[LOWER_LIP].y - lm[NOSE_TIP].y) / (fw + 0.0001)  # grows when jaw drops
-        corner_avg_y = (lm[MOUTH_LEFT].y + lm[MOUTH_RIGHT].y) / 2
-        corner_to_nose = (corner_avg_y - lm[NOSE_TIP].y) / (fw + 0.0001)  # shrinks when smiling
-
-        # Pucker: mouth narrows horizontally
-        pucker_width = sr  # already normalized mouth width
-
-        # Smirk: asymmetry of mouth corners. Left smirk = left corner higher (lower Y).
-        l_corner_y = lm[MOUTH_CORNER_LEFT].y
-        r_corner_y = lm[MOUTH_CORNER_RIGHT].y
-        # Normalize by face height so head tilt scale doesn't matter
-        mouth_asym = (r_corner_y - l_corner_y) / (fh + 0.0001)  # positive = left higher = left smirk
-
-        # Brow furrow: brow-to-eye-corner gap (pitch-robust) + inter-brow gap
-        brow_inner_gap = _dist(lm[LEFT_BROW_INNER], lm[RIGHT_BROW_INNER]) / (fw + 0.0001)
-        # Use fw (face width) not fh Ã¢â‚¬â€ fh changes when mouth opens (chin drops), causing crosstalk
-        l_brow_eye_gap = (lm[LEFT_BROW_INNER].y - lm[LEFT_INNER_EYE].y) / (fw + 0.0001)
-        r_brow_eye_gap = (lm[RIGHT_BROW_INNER].y - lm[RIGHT_INNER_EYE].y) / (fw + 0.0001)
-        brow_eye_gap = (l_brow_eye_gap + r_brow_eye_gap) / 2
-
-        nose_z = lm[1].z; forehead_z = lm[10].z
-        pitch_indicator = forehead_z - nose_z
-
-        # Head yaw (left/right turn): nose tip X position relative to face midpoint
-        face_mid_x = (lm[LEFT_CHEEK].x + lm[RIGHT_CHEEK].x) / 2.0
-        head_yaw = (lm[NOSE_TIP].x - face_mid_x) / (fw + 0.0001)  # positive = nose points right (user turns right)
-
-        # Head pitch (up/down): use pitch_indicator (already computed) - positive = looking down
-        # Also use nose Y relative to face vertical center for a more robust signal
-        face_mid_y = (lm[10].y + lm[CHIN].y) / 2.0
-        head_pitch_y = (lm[NOSE_TIP].y - face_mid_y) / (fh + 0.0001)  # positive = nose lower = looking down
-
-        if self.cal_n < CAL_N:
-            s=self.cal_s
-            for k,v in [('br',br),('lbr',lbr),('rbr',rbr),('sr',sr),('mo',mo),
-                        ('pitch',pitch_indicator),('pucker_w',pucker_width),
-                        ('mouth_asym',mouth_asym),
-                        ('ul_nose',upper_lip_to_nose),('ll_nose',lower_lip_to_nose),
-                        ('corner_nose',corner_to_nose),
-                        ('brow_gap',brow_inner_gap),
-                        ('brow_eye_gap',brow_eye_gap),
-                        ('head_yaw',head_yaw),
-                        ('head_pitch_y',head_pitch_y)]:
-                s[k]=s.get(k,0)+v
-            self.cal_n += 1
-            if self.cal_n == CAL_N:
-                self.bl = {k:v/CAL_N for k,v in s.items()}
-
-        if self.calibrated:
-            pitch_dev = pitch_indicator - self.bl['pitch']
-            pitch_comp = pitch_dev * -(tilt_comp / 100.0)
-
-            raw_left = max(0,min(100,(self.bl['lbr']-(lbr - pitch_comp))/(0.03/sens.get('eyebrow_raise_left',1.0))*100))
-            raw_right = max(0,min(100,(self.bl['rbr']-(rbr - pitch_comp))/(0.03/sens.get('eyebrow_raise_right',1.0))*100))
-
-            both_threshold = 85
-            if raw_left >= both_threshold and raw_right >= both_threshold:
-                raw['eyebrow_raise'] = max(0,min(100,(self.bl['br']-(br - pitch_comp))/(0.03/sens.get('eyebrow_raise',1.0))*100))
-                raw['eyebrow_raise_left'] = 0; raw['eyebrow_raise_right'] = 0
-            else:
-                raw['eyebrow_raise'] = 0
-                raw['eyebrow_raise_left'] = raw_left; raw['eyebrow_raise_right'] = raw_right
-
-            # Smile: corners rise + upper lip rises + mouth widens
-            # All three go negative (toward nose) when smiling
-            s_sm = sens.get('smile', 1.0)
-            corner_rise = (self.bl['corner_nose'] - corner_to_nose) / (0.04/s_sm)
-            upper_rise = (self.bl['ul_nose'] - upper_lip_to_nose) / (0.03/s_sm)
-            width_inc = (sr - self.bl['sr']) / (0.10/s_sm)
-            raw['smile'] = max(0, min(100, (corner_rise*0.40 + upper_rise*0.25 + width_inc*0.35) * 100))
-
-            # Mouth open: lower lip drops away from nose (jaw drops)
-            lower_drop = (lower_lip_to_nose - self.bl['ll_nose']) / (0.06/sens.get('mouth_open',1.0))
-            raw['mouth_open'] = max(0, min(100, lower_drop * 100))
-            # Suppress mouth_open when smiling strongly (smile pulls lower lip slightly)
-            if raw['smile'] > 50:
-                raw['mouth_open'] = max(0, raw['mouth_open'] - raw['smile'] * 0.3)
-
-            # Pucker: purely mouth width narrowing
-            w_shrink = (self.bl['pucker_w'] - pucker_width) / (0.05/sens.get('pucker',1.0))
-            raw_pucker = max(0, min(100, w_shrink * 100))
-            if raw['smile'] > 40 or raw['mouth_open'] > 40: raw_pucker *= 0.2
-            raw['pucker'] = max(0, min(100, raw_pucker))
-
-            # Smirk: mouth corner asymmetry
-            asym_dev = mouth_asym - self.bl['mouth_asym']
-            raw['smirk_left'] = max(0, min(100, asym_dev / (0.025/sens.get('smirk_left',1.0)) * 100))
-            raw['smirk_right'] = max(0, min(100, -asym_dev / (0.025/sens.get('smirk_right',1.0)) * 100))
-
-            # ---- CROSS-GESTURE SUPPRESSION ----
-
-            # Smirk suppresses smile: a smirk is intentionally asymmetric, not a smile.
-            # Strong smirk means the "smile" reading is just bleed from one-sided corner rise.
-            smirk_max = max(raw['smirk_left'], raw['smirk_right'])
-            if smirk_max > 30:
-                raw['smile'] = max(0, raw['smile'] - smirk_max * 0.7)
-
-            # Wink suppresses opposite eyebrow: squinting one eye physically shifts brow landmarks
-            # on both sides via skin tension and mesh coupling.
-            if raw['wink_left'] > 30:
-                raw['eyebrow_raise_right'] = max(0, raw['eyebrow_raise_right'] - raw['wink_left'] * 0.6)
-            if raw['wink_right'] > 30:
-                raw['eyebrow_raise_left'] = max(0, raw['eyebrow_raise_left'] - raw['wink_right'] * 0.6)
-            # Also suppress same-side brow (winking can bunch up skin above the eye)
-            if raw['wink_left'] > 40:
-                raw['eyebrow_raise_left'] = max(0, raw['eyebrow_raise_left'] - raw['wink_left'] * 0.4)
-            if raw['wink_right'] > 40:
-                raw['eyebrow_raise_right'] = max(0, raw['eyebrow_raise_right'] - raw['wink_right'] * 0.4)
-
-            # Pucker suppresses eyebrow raise: lip pursing pulls facial skin and shifts
-            # brow landmarks relative to hairline reference, creating phantom raise.
-            if raw['pucker'] > 25:
-                pucker_suppress = raw['pucker'] * 0.5
-                raw['eyebrow_raise'] = max(0, raw['eyebrow_raise'] - pucker_suppress)
-                raw['eyebrow_raise_left'] = max(0, raw['eyebrow_raise_left'] - pucker_suppress)
-                raw['eyebrow_raise_right'] = max(0, raw['eyebrow_raise_right'] - pucker_suppress)
-
-            # Blink suppresses eyebrow raise: closing both eyes creates similar skin bunching
-            if raw['blink'] > 40:
-                blink_suppress = raw['blink'] * 0.5
-                raw['eyebrow_raise'] = max(0, raw['eyebrow_raise'] - blink_suppress)
-                raw['eyebrow_raise_left'] = max(0, raw['eyebrow_raise_left'] - blink_suppress)
-                raw['eyebrow_raise_right'] = max(0, raw['eyebrow_raise_right'] - blink_suppress)
-
-            # Brow furrow: pitch-robust via brow-to-eye-corner gap
-            # Apply pitch compensation: tilting forward shrinks brow_eye_gap artificially
-            s_bf = sens.get('brow_furrow', 1.0)
-            compensated_brow_eye_gap = brow_eye_gap - pitch_comp * 0.5
-            brow_drop = (compensated_brow_eye_gap - self.bl['brow_eye_gap']) / (0.015/s_bf)
-            gap_shrink = (self.bl['brow_gap'] - brow_inner_gap) / (0.03/s_bf)
-            raw_furrow = max(0, min(100, (brow_drop*0.55 + gap_shrink*0.45) * 100))
-            if raw['eyebrow_raise'] > 30 or raw_left > 30 or raw_right > 30:
-                raw_furrow *= 0.1
-            # Suppress when mouth is open (residual crosstalk from jaw mechanics)
-            if raw['mouth_open'] > 30:
-                raw_furrow *= max(0, 1.0 - raw['mouth_open'] / 80.0)
-            raw['brow_furrow'] = max(0, min(100, raw_furrow))
-
-            # Head yaw (left/right turn)
-            yaw_dev = head_yaw - self.bl['head_yaw']
-            # yaw_dev positive = nose moved right = user turned right (in mirrored view: head_right)
-            # Sensitivity divisor: ~0.04 normalized units = full turn at 1x sensitivity
-            s_yaw_r = sens.get('head_right', 1.0)
-            s_yaw_l = sens.get('head_left', 1.0)
-            raw['head_right'] = max(0, min(100, yaw_dev / (0.04/s_yaw_r) * 100))
-            raw['head_left'] = max(0, min(100, -yaw_dev / (0.04/s_yaw_l) * 100))
-
-            # Head pitch (up/down tilt) - combine Z-based pitch and Y-based pitch for robustness
-            s_pitch_up = sens.get('head_up', 1.0)
-            s_pitch_dn = sens.get('head_down', 1.0)
-            pitch_y_dev = head_pitch_y - self.bl['head_pitch_y']
-            # pitch_y_dev positive = nose moved down = looking down
-            # pitch_dev (Z-based) positive = forehead closer = looking down
-            combined_pitch = pitch_y_dev * 0.6 + pitch_dev * 0.4
-            raw['head_down'] = max(0, min(100, combined_pitch / (0.03/s_pitch_dn) * 100))
-            raw['head_up'] = max(0, min(100, -combined_pitch / (0.03/s_pitch_up) * 100))
-        else:
-            for k in ('eyebrow_raise','eyebrow_raise_left','eyebrow_raise_right','mouth_open',
-                      'smile','pucker','smirk_left','smirk_right','brow_furrow',
-                      'head_up','head_down','head_left','head_right'):
-                raw[k] = 0
-        return raw
+    def compute(self, lm, tilt_comp=35, sens_arr=None, lm_smooth=True):
+        """lm: (N,3) float32 landmark array (see _landmarks_to_array).
+        sens_arr: per-gesture multipliers indexed by GESTURE_INDEX (default all 1.0).
+        >1 = less motion needed, <1 = more motion needed.
+        Returns a reused float32 array indexed by GESTURE_INDEX (overwritten on the next call).
+        The numeric work runs in the _features_njit/_compute_njit kernels."""
+        if sens_arr is None: sens_arr = _DEFAULT_SENS
+        with self._lock:
+            # Still-face cache: if the feature landmarks barely moved since the last full compute
+            # (and settings are unchanged), the previous result in _raw_buf still holds
+            fp = lm[_FEATURE_LM_IDX, :2]; self.cache_calls += 1
+            if (self._fp is not None and self.calibrated and self._cache_age < self.CACHE_REVALIDATE
+                    and self._cache_tilt == tilt_comp and np.array_equal(self._cache_sens, sens_arr)
+                    and float(np.abs(fp - self._fp).sum()) < self.CACHE_EPS * fp.size):
+                self._cache_age += 1; self.cache_hits += 1
+                return self._raw_buf
+            self._fp = fp; self._cache_age = 0; self._cache_tilt = tilt_comp; self._cache_sens = sens_arr.copy()
+            # Apply One-Euro filtering to raw landmarks before any computation
+            if lm_smooth:
+                lm = self._lm_smoother.smooth(lm)
+            f = _features_njit(lm, self.calibrated)
+            if self.cal_n < CAL_N:
+                _accumulate_njit(self.cal_s, f)
+                self.cal_n += 1
+                if self.cal_n == CAL_N:
+                    self.bl = self.cal_s / CAL_N
+            _compute_njit(f, self.bl, sens_arr, float(tilt_comp), self.calibrated, self._raw_buf)
+            return self._raw_buf
 
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â CAMERA THREAD ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
+FACE_MODEL_URL = "https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/latest/face_landmarker.task"
+FACE_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'face_landmarker.task')
+_model_lock = threading.Lock(); _model_thread = None
+
+def _download_model():
+    """Fetch the face model into a .part file, renamed into place only once complete."""
+    import urllib.request, shutil
+    tmp = FACE_MODEL_PATH + '.part'
+    try:
+        with urllib.request.urlopen(FACE_MODEL_URL, timeout=30) as resp, open(tmp, 'wb') as f:
+            shutil.copyfileobj(resp, f, length=1 << 20)
+        os.replace(tmp, FACE_MODEL_PATH); print("[MODEL] Downloaded face_landmarker.task")
+    except Exception as e: print(f"[MODEL] Download failed: {e}")
+
+def start_model_download():
+    """Start a background download of the face model if it's missing.
+    Returns the (possibly already running) download thread, or None if the model is present."""
+    global _model_thread
+    with _model_lock:
+        if os.path.exists(FACE_MODEL_PATH): return None
+        if _model_thread is None or not _model_thread.is_alive():
+            _model_thread = threading.Thread(target=_download_model, daemon=True); _model_thread.start()
+        return _model_thread
+
 def enumerate_cameras(max_test=8):
     """Return camera indices without opening any devices.
     Simply returns indices 0..max_test-1 for the user to pick from."""
     return [(idx, None, f"Camera {idx}") for idx in range(max_test)]
 
 class CameraThread(QThread):
-    frame_ready = pyqtSignal(object, object, float)
+    frame_ready = pyqtSignal(object, object, object, float)  # RGB frame, landmark array, gesture readings, fps
     status_changed = pyqtSignal(str)
     error = pyqtSignal(str)
 
@@ -878,9 +1063,18 @@ class CameraThread(QThread):
         ('720p (1280x720)', 1280, 720),
         ('1080p (1920x1080)', 1920, 1080),
     ]
+    # Width of the frame handed to the landmarker (aspect kept). Landmarks come back
+    # normalized, so full resolution is only needed for the preview.
+    DETECT_WIDTH = 320
+    # How long a captured frame waits for its LIVE_STREAM result before it is trimmed
+    PENDING_MS = 1000
 
-    def __init__(self, cam_index=0, cam_backend=None, res_index=1):
+    def __init__(self, cam_index=0, cam_backend=None, res_index=1, detector=None):
         super().__init__(); self._running=False; self._mx=QMutex()
+        # Gesture math runs on a worker thread fed by a 1-slot queue (newest result wins), so it
+        # overlaps inference of the next frame. tilt_comp/sens_arr are set by the UI thread.
+        self.detector = detector; self.tilt_comp = 35; self.sens_arr = None
+        self._gq = queue.Queue(maxsize=1)
         self._cam_index = cam_index
         self._cam_backend = cam_backend
         self._res_index = res_index
@@ -898,6 +1092,12 @@ class CameraThread(QThread):
         }
         self._settings_dirty = False
         self._cap = None
+        self._rgb_buf = None  # reused BGR->RGB target for the detector input (sized on first frame)
+        self._rgb_free = queue.SimpleQueue()  # preview RGB buffers handed back by the UI (see recycle)
+        # Frames awaiting their LIVE_STREAM result, as (timestamp_ms, frame). Bounded by age, not count,
+        # so a slow landmarker still finds its frame; the lock covers capture-thread appends vs callback pops
+        self._pending = deque(); self._plock = threading.Lock()
+        self._fc = 0; self._ft = time.time(); self._fps = 0.0
 
     def update_settings(self, settings):
         """Called from UI thread to update camera settings."""
@@ -908,6 +1108,10 @@ class CameraThread(QThread):
     def stop(self):
         with QMutexLocker(self._mx): self._running=False
 
+    def recycle(self, buf):
+        """UI thread: return a preview frame it no longer references so the worker can reuse it."""
+        self._rgb_free.put(buf)
+
     def _apply_hw_settings(self, cap):
         """Apply hardware camera settings via OpenCV CAP_PROP."""
         s = self._settings
@@ -932,6 +1136,46 @@ class CameraThread(QThread):
         except Exception as e:
             print(f"[CAM] Settings apply error (some may not be supported): {e}")
 
+    def _queue_result(self, item):
+        """Hand (frame, landmarks) to the gesture worker, replacing an item it hasn't picked up yet."""
+        try: self._gq.put_nowait(item)
+        except queue.Full:
+            try: self._gq.get_nowait()
+            except queue.Empty: pass
+            self._gq.put_nowait(item)
+
+    def _gesture_worker(self):
+        """Landmark conversion + GestureDetector.compute off the capture/inference threads."""
+        while True:
+            item = self._gq.get()
+            if item is None: break
+            frame, landmarks = item
+            lm = raw = None
+            if landmarks is not None:
+                lm = _landmarks_to_array(landmarks)
+                if self.detector is not None:
+                    # copy: the detector reuses its buffer while the UI may still be reading this one
+                    raw = self.detector.compute(lm, self.tilt_comp, self.sens_arr).copy()
+            self._fc += 1; now = time.time()
+            if now - self._ft >= 0.5: self._fps = self._fc/(now - self._ft); self._fc = 0; self._ft = now
+            # Preview colour conversion happens here, off the GUI thread, into a buffer the UI has
+            # handed back (recycle); a new one is only allocated while frames are still in flight
+            try: out = self._rgb_free.get_nowait()
+            except queue.Empty: out = None
+            if out is None or out.shape != frame.shape: out = np.empty_like(frame)
+            self.frame_ready.emit(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out), lm, raw, self._fps)
+
+    def _on_detect(self, result, out_image, timestamp_ms):
+        """LIVE_STREAM result callback (runs on MediaPipe's thread): pair with the captured frame."""
+        p = self._pending; frame = None
+        with self._plock:
+            while p and p[0][0] < timestamp_ms: frame = p.popleft()[1]  # frames the landmarker dropped
+            if p and p[0][0] == timestamp_ms: frame = p.popleft()[1]
+            # Exact frame already trimmed: the newest older one is kept above, else the oldest newer one
+            elif frame is None and p: frame = p[0][1]
+        if frame is None: return
+        self._queue_result((frame, result.face_landmarks[0] if result.face_landmarks else None))
+
     def run(self):
         self._running = True
         self.status_changed.emit("Opening camera...")
@@ -953,17 +1197,20 @@ class CameraThread(QThread):
         self._apply_hw_settings(cap)
         self._cap = cap
         fm = None; mode = None
+        # The model download normally started at app launch; wait for it if it's still running
+        dl = start_model_download()
+        if dl is not None:
+            self.status_changed.emit("Downloading face model...")
+            while dl.is_alive() and self._running: dl.join(0.1)
+            if not self._running: cap.release(); self._cap = None; return
         try:
             from mediapipe.tasks import python as mpt
             from mediapipe.tasks.python import vision
-            mp_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),'face_landmarker.task')
-            if not os.path.exists(mp_path):
-                self.status_changed.emit("Downloading face model...")
-                import urllib.request
-                urllib.request.urlretrieve("https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float16/latest/face_landmarker.task", mp_path)
+            mp_path = FACE_MODEL_PATH
+            if not os.path.exists(mp_path): raise RuntimeError("face model download failed")
             opts = vision.FaceLandmarkerOptions(
                 base_options=mpt.BaseOptions(model_asset_path=mp_path),
-                running_mode=vision.RunningMode.IMAGE, num_faces=1,
+                running_mode=vision.RunningMode.LIVE_STREAM, result_callback=self._on_detect, num_faces=1,
                 min_face_detection_confidence=0.5, min_face_presence_confidence=0.5,
                 min_tracking_confidence=0.5, output_face_blendshapes=False,
                 output_facial_transformation_matrixes=False)
@@ -972,7 +1219,13 @@ class CameraThread(QThread):
         except Exception as e:
             self.error.emit(f"MediaPipe init failed: {e}"); cap.release(); return
 
-        fc=0; ft=time.time(); fps=0.0
+        with self._plock: self._pending.clear()
+        self._fc = 0; self._ft = time.time(); self._fps = 0.0; last_ts = 0
+        worker = threading.Thread(target=self._gesture_worker, daemon=True); worker.start()
+        # mp.Image copies its input into a C++ ImageFrame (numpy_view() of that frame is
+        # read-only, so it can't be a cvtColor target). Passing the C-contiguous _rgb_buf
+        # keeps that to the one unavoidable copy; hoist the lookups out of the loop.
+        mp_image = mp.Image; srgb = mp.ImageFormat.SRGB
         while True:
             with QMutexLocker(self._mx):
                 if not self._running: break
@@ -989,18 +1242,28 @@ class CameraThread(QThread):
                 sc = denoise_str * 10       # sigma color
                 ss = denoise_str * 10       # sigma space
                 frame = cv2.bilateralFilter(frame, d, sc, ss)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            lm = None
+            fh, fw = frame.shape[:2]
+            if fw > self.DETECT_WIDTH:
+                small = cv2.resize(frame, (self.DETECT_WIDTH, self.DETECT_WIDTH * fh // fw), interpolation=cv2.INTER_AREA)
+            else: small = frame
+            if self._rgb_buf is None or self._rgb_buf.shape != small.shape:
+                self._rgb_buf = np.empty(small.shape, dtype=np.uint8)
+            rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            # MediaPipe's binding silently copies strided input (e.g. a frame[:, :, ::-1] view);
+            # _rgb_buf is always C-contiguous, so this only guards future refactors
+            if not rgb.flags.c_contiguous: rgb = np.ascontiguousarray(rgb)
             if mode == 'legacy':
                 r = fm.process(rgb)
-                if r.multi_face_landmarks: lm = r.multi_face_landmarks[0].landmark
+                self._queue_result((frame, r.multi_face_landmarks[0].landmark if r.multi_face_landmarks else None))
             else:
-                r = fm.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb))
-                if r.face_landmarks and len(r.face_landmarks)>0: lm = r.face_landmarks[0]
-            fc+=1; now=time.time()
-            if now-ft>=0.5: fps=fc/(now-ft); fc=0; ft=now
-            self.frame_ready.emit(frame, lm, fps)
+                # Async: capture of the next frame overlaps inference; _on_detect emits the result
+                ts = max(int(time.monotonic()*1000), last_ts + 1); last_ts = ts  # must strictly increase
+                with self._plock:
+                    p = self._pending; p.append((ts, frame))
+                    while p[0][0] < ts - self.PENDING_MS: p.popleft()
+                fm.detect_async(mp_image(image_format=srgb, data=rgb), ts)
         cap.release(); self._cap = None; fm.close()
+        self._queue_result(None); worker.join(1.0)  # None stops the gesture worker
 
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â GESTURE DEFS ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
@@ -1085,12 +1348,45 @@ _TOGGLE_GESTURES_NOTE = "⚠ Recommended: Use with Gesture Chain or Morse Chain
 
 TRIGGER_MODES = [('single','Single Press'),('hold','Hold (Sustain)'),('toggle','Toggle On/Off'),('analog','Analog (Continuous)')]
 
+# value -> combo index maps (combos are filled in list order)
+ACTION_TYPE_INDEX = {v:i for i,(v,_) in enumerate(ACTION_TYPES)}
+TRIGGER_MODE_INDEX = {v:i for i,(v,_) in enumerate(TRIGGER_MODES)}
+
 # Actions that support sustained hold (key down / mouse down / gamepad button down)
 _HOLDABLE_ACTIONS = {'key','left_click','right_click','middle_click','gamepad_button'}
 # Actions that repeat during hold mode (non-holdable continuous actions)
 _REPEATABLE_ACTIONS = {'scroll_up','scroll_down','double_click','macro'}
 # Actions that map continuously (per-frame analog output)
 _ANALOG_ACTIONS = {'gamepad_axis'}
+# Action opcodes (combo order, The Rock included); per-opcode flags are tuples the frame loop indexes
+ACTION_OP = {v:i for i,(v,_) in enumerate(ACTION_TYPES_RIGHT_EYEBROW)}
+_OP_HOLDABLE = tuple(v in _HOLDABLE_ACTIONS for v in ACTION_OP)
+_OP_REPEATABLE = tuple(v in _REPEATABLE_ACTIONS for v in ACTION_OP)
+OP_NONE = ACTION_OP['none']; OP_MACRO = ACTION_OP['macro']; OP_TOGGLE_GESTURES = ACTION_OP['toggle_gestures']
+
+# Per-slot events written by _trigger_step_njit
+EV_NONE, EV_FIRE, EV_HOLD_START, EV_HELD, EV_RELEASE = 0, 1, 2, 3, 4
+_TM_HOLD = TRIGGER_MODE_INDEX['hold']; _TM_ANALOG = TRIGGER_MODE_INDEX['analog']
+
+@njit(cache=True, boundscheck=False)
+def _trigger_step_njit(val, th, mode, on, now, ht, cd, hs, ta, lt, hold_on, ev):
+    """Threshold / hold-time / cooldown gate for every gesture slot in one pass.
+    Updates hold start (hs), latch (ta), last fire (lt) and hold_on in place and writes one EV_* per
+    slot; slots with on=False (disabled or analog cards) are left to the caller as EV_NONE."""
+    for i in range(val.shape[0]):
+        ev[i] = EV_NONE
+        if not on[i]: continue
+        if val[i] >= th[i]:
+            if hs[i] == 0: hs[i] = now
+            if now - hs[i] < ht: continue
+            if mode[i] == _TM_HOLD:
+                if hold_on[i]: ev[i] = EV_HELD
+                else: hold_on[i] = True; ta[i] = True; ev[i] = EV_HOLD_START
+            elif not ta[i] and now - lt[i] > cd:
+                ta[i] = True; lt[i] = now; ev[i] = EV_FIRE
+        else:
+            if mode[i] == _TM_HOLD and hold_on[i]: hold_on[i] = False; ev[i] = EV_RELEASE
+            ta[i] = False; hs[i] = 0
 
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â STYLESHEET ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
@@ -1117,6 +1413,99 @@ QProgressBar{height:4px;background:#1e1e2a;border:none;border-radius:2px}
 QProgressBar::chunk{border-radius:2px}
 """
 
+# Row/card styles keyed by objectName, parsed once at app level instead of per widget.
+# Container rules carry the old selector-less cascade ("#x, #x *"); nested containers come later so they win.
+FACECMD_QSS = """
+#gestureCard,#gestureCard *{background:#16161f;border:1px solid #2a2a3a;border-radius:10px}
+#gestureChainCard,#gestureChainCard *{background:#16161f;border:1px solid #ffaa0055;border-radius:10px}
+#morseChainCard,#morseChainCard *{background:#16161f;border:1px solid #ff884455;border-radius:10px}
+#ptPanel,#ptPanel *{background:#16161f;border:1px solid #00ccaa55;border-radius:10px}
+#ptAxisConfig,#ptAxisConfig *{background:#1a1a26;border:1px solid #2a2a3a;border-radius:6px}
+#ptDirConfig,#ptDirConfig *{background:#12121a;border:1px solid #2a2a3a;border-radius:5px}
+#morsePatternRow,#morsePatternRow *{background:#1a1a26;border:1px solid #2a2a3a;border-radius:6px}
+#morseSymFrame,#morseSymFrame *{background:transparent;border:none}
+#macroEditor,#macroEditor *{background:transparent;border:none}
+#macroStepRow,#macroStepRow *,#chainStepRow,#chainStepRow *{background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px}
+#gpAxisFrameChain,#gpAxisFrame,#gestureCardBody{background:transparent;border:none}
+QPushButton#rowMoveBtn{font-size:8px;padding:0;border:1px solid #2a2a3a;border-radius:3px;background:#16161f;color:#555570}
+QPushButton#rowRemoveBtn{font-size:11px;padding:0;border:none;color:#ff4466;background:transparent}
+QSpinBox#macroDurSpin{background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;color:#e8e8f0;padding:2px}
+QPushButton#macroAddBtn{font-size:10px;padding:2px 10px;border:1px dashed #2a2a3a;color:#00d4ff;border-radius:4px;background:transparent}
+QLabel#chainStepIcon{font-size:8px;color:#ffaa00;border:none;background:transparent}
+QLabel#chainIcon{background:#ffaa0033;border-radius:6px;font-size:15px;border:none}
+QLabel#morseIcon{background:#ff884433;border-radius:6px;font-size:15px;border:none}
+QLineEdit#chainNameEdit{font-weight:600;font-size:13px;color:#ffaa00;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px}
+QLineEdit#morseNameEdit{font-weight:600;font-size:13px;color:#ff8844;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px}
+QLabel#cardSub{color:#555570;font-size:11px;border:none}
+QLabel#lbl11{font-size:11px;border:none}
+QLabel#monoVal{font-family:Consolas;font-size:11px;color:#555570;border:none}
+QLabel#secHdr{font-family:Consolas;font-size:10px;color:#555570;letter-spacing:1.5px;font-weight:600;padding:8px 12px 4px}
+QFrame#cardSep{color:#2a2a3a}
+QLabel#cardName{font-weight:600;font-size:13px;border:none}
+QLabel#cardTo{font-size:11px;color:#555570;border:none}
+QLabel#rowHint{font-size:10px;color:#555570;border:none}
+QLabel#dzVal{font-family:Consolas;font-size:10px;color:#00ff88;min-width:28px;border:none}
+QSlider#greenSl::handle:horizontal{background:#00ff88;border:2px solid #16161f}
+QPushButton#chainSaveBtn{font-size:10px;padding:2px 8px;border:1px solid #00ff8855;color:#00ff88;border-radius:4px;background:transparent}
+QPushButton#chainDelBtn{font-size:10px;padding:2px 8px;border:1px solid #ff446655;color:#ff4466;border-radius:4px;background:transparent}
+QPushButton#chainAddStepBtn{font-size:10px;padding:2px 10px;border:1px dashed #ffaa0055;color:#ffaa00;border-radius:4px;background:transparent}
+QPushButton#morseAddBtn{font-size:10px;padding:2px 8px;border:1px dashed #ff884455;color:#ff8844;border-radius:4px;background:transparent}
+QPushButton#morseResetBtn{font-size:10px;padding:1px 6px;border:1px solid #2a2a3a;color:#555570;border-radius:3px;background:transparent}
+QSlider#amberSl::handle:horizontal{background:#ffaa00;border:2px solid #16161f}
+QSlider#cyanSl::handle:horizontal{background:#00d4ff;border:2px solid #16161f}
+QLabel#shortLbl{font-size:11px;color:#00d4ff;border:none;font-weight:600}
+QLabel#longLbl{font-size:11px;color:#ffaa00;border:none;font-weight:600}
+QLabel#shortVal{font-family:Consolas;font-size:11px;color:#00d4ff;border:none}
+QLabel#longVal{font-family:Consolas;font-size:11px;color:#ffaa00;border:none}
+QCheckBox#gpInvert{font-size:10px;border:none}
+QLabel#actionWarn{font-size:10px;color:#ffaa00;background:#ffaa0015;border:1px solid #ffaa0033;border-radius:4px;padding:4px 6px}
+QLabel#actionNote{font-size:10px;color:#00ff88;background:#00ff8815;border:1px solid #00ff8833;border-radius:4px;padding:4px 6px}
+QLabel#chainProgress{font-family:Consolas;font-size:10px;color:#555570;border:none;padding-top:4px}
+QLabel#chainProgress[active="true"]{color:#ffaa00}
+QPushButton#addShortBtn{font-size:10px;font-weight:700;padding:0;border:1px solid #00d4ff55;color:#00d4ff;border-radius:4px;background:#00d4ff15}
+QPushButton#addLongBtn{font-size:10px;font-weight:700;padding:0;border:1px solid #ffaa0055;color:#ffaa00;border-radius:4px;background:#ffaa0015}
+QPushButton#rowClearBtn{font-size:10px;padding:0;border:none;color:#ff4466;background:transparent}
+QPushButton#rowTrashBtn{font-size:11px;padding:0;border:none;color:#555570;background:transparent}
+QLabel#morseArrow{color:#555570;font-size:12px;border:none}
+QLabel#morseSym[sym="S"]{background:#00d4ff33;border:1px solid #00d4ff66;border-radius:7px;color:#00d4ff;font-size:14px;font-weight:700}
+QLabel#morseSym[sym="L"]{background:#ffaa0033;border:1px solid #ffaa0066;border-radius:4px;color:#ffaa00;font-size:11px;font-weight:700}
+QLabel#morseHint{color:#555570;font-size:10px;border:none}
+"""
+# Per-widget sheets shared by the repeated row widgets (launch picker, point-tracker rows).
+# One string object per style instead of a fresh literal at every construction site.
+_ROW_CB_QSS = "font-size:10px;"
+_ROW_LBL_QSS = "font-size:10px;color:#8888a0;border:none;"
+_ROW_TINY_LBL_QSS = "font-size:9px;color:#8888a0;border:none;"
+_ROW_HINT_QSS = "font-size:10px;color:#555570;border:none;"
+_NO_BORDER_QSS = "border:none;"
+_TRANSPARENT_QSS = "background:transparent;border:none;"
+_LPE_PATH_QSS = "background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;color:#e8e8f0;padding:3px 6px;font-family:Consolas;font-size:10px;"
+_LPE_BTN_QSS = "font-size:12px;padding:0;border:1px solid #2a2a3a;border-radius:4px;background:#1e1e2a;"
+# Header widgets sit under a frame with its own sheet, so these stay per-widget; each is set once
+# and restyled by flipping the 'state' property (see _repolish) instead of swapping sheets
+_CAM_BTN_QSS = ("QPushButton{border-radius:6px;padding:6px 16px;color:#0a0a0f;font-weight:600}"
+    "QPushButton[state=\"primary\"]{background:#00d4ff;border:1px solid #00d4ff}QPushButton[state=\"primary\"]:hover{background:#00bde6}"
+    "QPushButton[state=\"danger\"]{background:#ff4466;border:1px solid #ff4466}QPushButton[state=\"danger\"]:hover{background:#e63355}")
+_STATUS_QSS = ("QLabel{font-family:Consolas;font-size:11px;padding:3px 8px;border-radius:10px}"
+    "QLabel[state=\"err\"]{color:#ff4466;background:#ff446633;border:1px solid #ff4466}"
+    "QLabel[state=\"warn\"]{color:#ffaa00;background:#ffaa0033;border:1px solid #ffaa00}"
+    "QLabel[state=\"ok\"]{color:#00ff88;background:#00ff8833;border:1px solid #00ff88}")
+_STATUS_STATE = {"#ff4466": 'err', "#ffaa00": 'warn', "#00ff88": 'ok'}
+
+# Collapsed card frames only swap the border colour; set on the frame itself while collapsed
+_CARD_OFF_QSS = "border-color:#1a1a24;"
+
+def install_stylesheet(app):
+    app.setStyleSheet(SS + FACECMD_QSS)
+
+def _emit_self(sig, obj, *_):
+    """partial() target for button clicks: drops the clicked(bool) arg and emits sig(obj)."""
+    sig.emit(obj)
+
+def _repolish(w, prop, val):
+    """Flip a dynamic property used by FACECMD_QSS and re-apply the already-parsed rules."""
+    w.setProperty(prop, val); st = w.style(); st.unpolish(w); st.polish(w)
+
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â KEY CAPTURE ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
 class KeyCaptureEdit(QLineEdit):
@@ -1139,13 +1528,13 @@ class LaunchProgramEdit(QFrame):
     """File picker for launch_program action: shows path + browse button."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:transparent;border:none;")
+        self.setStyleSheet(_TRANSPARENT_QSS)
         ly = QHBoxLayout(self); ly.setContentsMargins(0,0,0,0); ly.setSpacing(4)
         self.path_edit = QLineEdit(); self.path_edit.setPlaceholderText("Program path...")
-        self.path_edit.setStyleSheet("background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;color:#e8e8f0;padding:3px 6px;font-family:Consolas;font-size:10px;")
+        self.path_edit.setStyleSheet(_LPE_PATH_QSS)
         ly.addWidget(self.path_edit, stretch=1)
         self.browse_btn = QPushButton("\U0001F4C2"); self.browse_btn.setFixedSize(28,24)
-        self.browse_btn.setStyleSheet("font-size:12px;padding:0;border:1px solid #2a2a3a;border-radius:4px;background:#1e1e2a;")
+        self.browse_btn.setStyleSheet(_LPE_BTN_QSS)
         self.browse_btn.setToolTip("Browse for program")
         self.browse_btn.clicked.connect(self._browse)
         ly.addWidget(self.browse_btn)
@@ -1161,6 +1550,8 @@ class LaunchProgramEdit(QFrame):
 MACRO_STEP_TYPES = [('key','Key Press'),('hold','Hold Key'),('mouse','Mouse Action'),('delay','Delay (ms)')]
 MACRO_MOUSE_ACTIONS = [('left_click','Left Click'),('right_click','Right Click'),('double_click','Double Click'),
     ('middle_click','Middle Click'),('scroll_up','Scroll Up'),('scroll_down','Scroll Down')]
+STEP_TYPE_INDEX = {v:i for i,(v,_) in enumerate(MACRO_STEP_TYPES)}
+MOUSE_ACTION_INDEX = {v:i for i,(v,_) in enumerate(MACRO_MOUSE_ACTIONS)}
 
 class MacroStepRow(QFrame):
     removed = pyqtSignal(object)
@@ -1169,17 +1560,17 @@ class MacroStepRow(QFrame):
 
     def __init__(self, step_type='key', value='', parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;")
+        self.setObjectName("macroStepRow")
         self.setFixedHeight(32)
         ly = QHBoxLayout(self); ly.setContentsMargins(4,2,4,2); ly.setSpacing(4)
 
         self.up_btn = QPushButton("\u25B2"); self.up_btn.setFixedSize(18,18)
-        self.up_btn.setStyleSheet("font-size:8px;padding:0;border:1px solid #2a2a3a;border-radius:3px;background:#16161f;color:#555570;")
-        self.up_btn.clicked.connect(lambda: self.moved_up.emit(self))
+        self.up_btn.setObjectName("rowMoveBtn")
+        self.up_btn.clicked.connect(partial(_emit_self, self.moved_up, self))
         ly.addWidget(self.up_btn)
         self.dn_btn = QPushButton("\u25BC"); self.dn_btn.setFixedSize(18,18)
-        self.dn_btn.setStyleSheet("font-size:8px;padding:0;border:1px solid #2a2a3a;border-radius:3px;background:#16161f;color:#555570;")
-        self.dn_btn.clicked.connect(lambda: self.moved_down.emit(self))
+        self.dn_btn.setObjectName("rowMoveBtn")
+        self.dn_btn.clicked.connect(partial(_emit_self, self.moved_down, self))
         ly.addWidget(self.dn_btn)
 
         self.type_cb = QComboBox(); self.type_cb.setFixedWidth(90); self.type_cb.setFixedHeight(24)
@@ -1197,22 +1588,26 @@ class MacroStepRow(QFrame):
 
         self.dur_spin = QSpinBox(); self.dur_spin.setRange(10, 5000); self.dur_spin.setValue(50)
         self.dur_spin.setSuffix(" ms"); self.dur_spin.setFixedWidth(80); self.dur_spin.setFixedHeight(24)
-        self.dur_spin.setStyleSheet("background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;color:#e8e8f0;padding:2px;")
+        self.dur_spin.setObjectName("macroDurSpin")
         self.dur_spin.hide()
         ly.addWidget(self.dur_spin)
 
         ly.addStretch()
 
         rb = QPushButton("\u2715"); rb.setFixedSize(20,20)
-        rb.setStyleSheet("font-size:11px;padding:0;border:none;color:#ff4466;background:transparent;")
-        rb.setToolTip("Remove step"); rb.clicked.connect(lambda: self.removed.emit(self))
+        rb.setObjectName("rowRemoveBtn")
+        rb.setToolTip("Remove step"); rb.clicked.connect(partial(_emit_self, self.removed, self))
         ly.addWidget(rb)
 
+        # Cached to_macro_string() result, dropped whenever an input widget changes
+        self._cached = None
+        for sig in (self.type_cb.currentIndexChanged, self.key_edit.textChanged,
+                    self.dur_spin.valueChanged, self.mouse_cb.currentIndexChanged):
+            sig.connect(self._invalidate)
         self._apply_step(step_type, value)
 
     def _apply_step(self, step_type, value):
-        for i in range(self.type_cb.count()):
-            if self.type_cb.itemData(i) == step_type: self.type_cb.setCurrentIndex(i); break
+        self.type_cb.setCurrentIndex(STEP_TYPE_INDEX.get(step_type, 0))
         if step_type == 'key':
             self.key_edit.setText(value)
         elif step_type == 'hold':
@@ -1221,8 +1616,7 @@ class MacroStepRow(QFrame):
             try: self.dur_spin.setValue(int(parts[1]))
             except: self.dur_spin.setValue(500)
         elif step_type == 'mouse':
-            for i in range(self.mouse_cb.count()):
-                if self.mouse_cb.itemData(i) == value: self.mouse_cb.setCurrentIndex(i); break
+            self.mouse_cb.setCurrentIndex(MOUSE_ACTION_INDEX.get(value, 0))
         elif step_type == 'delay':
             try: self.dur_spin.setValue(int(value))
             except: self.dur_spin.setValue(50)
@@ -1234,10 +1628,17 @@ class MacroStepRow(QFrame):
         self.mouse_cb.setVisible(t == 'mouse')
         self.dur_spin.setVisible(t in ('hold','delay'))
 
+    def _invalidate(self, *_): self._cached = None
+
     def to_macro_string(self):
+        if self._cached is None: self._cached = self._build_macro_string()
+        return self._cached
+
+    def _build_macro_string(self):
         t = self.type_cb.currentData()
-        if t == 'key': return f"key:{self.key_edit.text()}" if self.key_edit.text() else ''
-        elif t == 'hold': return f"hold:{self.key_edit.text()}:{self.dur_spin.value()}" if self.key_edit.text() else ''
+        k = self.key_edit.text()
+        if t == 'key': return f"key:{_esc(k)}" if k else ''
+        elif t == 'hold': return f"hold:{_esc(k)}:{self.dur_spin.value()}" if k else ''
         elif t == 'mouse': return f"mouse:{self.mouse_cb.currentData()}"
         elif t == 'delay': return f"delay:{self.dur_spin.value()}"
         return ''
@@ -1246,65 +1647,93 @@ class MacroStepRow(QFrame):
 class MacroEditor(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:transparent;border:none;")
+        self.setObjectName("macroEditor")
         ly = QVBoxLayout(self); ly.setContentsMargins(0,0,0,0); ly.setSpacing(3)
 
         self.steps_layout = QVBoxLayout(); self.steps_layout.setContentsMargins(0,0,0,0); self.steps_layout.setSpacing(2)
         ly.addLayout(self.steps_layout)
-        self.step_rows = []
+        self.step_rows = []; self._row_set = set()  # set mirrors step_rows for O(1) membership
+        # parse_macro step tuple -> built row, one dict lookup per step in set_from_string
+        mk = self._make_row
+        self._step_dispatch = {'key': lambda s: mk('key', s[1]), 'hold': lambda s: mk('hold', f"{s[1]}:{s[2]}"),
+                               'mouse': lambda s: mk('mouse', s[1]), 'delay': lambda s: mk('delay', str(s[1]))}
 
         add_btn = QPushButton("+ Add Step"); add_btn.setFixedHeight(24)
-        add_btn.setStyleSheet("font-size:10px;padding:2px 10px;border:1px dashed #2a2a3a;color:#00d4ff;border-radius:4px;background:transparent;")
+        add_btn.setObjectName("macroAddBtn")
         add_btn.clicked.connect(lambda: self.add_step())
         ly.addWidget(add_btn)
 
-    def add_step(self, step_type='key', value=''):
+    def _make_row(self, step_type, value):
         row = MacroStepRow(step_type, value)
         row.removed.connect(self._remove_step)
         row.moved_up.connect(self._move_up)
         row.moved_down.connect(self._move_down)
-        self.step_rows.append(row)
+        return row
+
+    def add_step(self, step_type='key', value=''):
+        row = self._make_row(step_type, value)
+        self.step_rows.append(row); self._row_set.add(row)
         self.steps_layout.addWidget(row)
 
+    def _fast_clear(self):
+        """Drop every row in one pass (no per-row membership checks)."""
+        sl = self.steps_layout
+        for r in self.step_rows: sl.removeWidget(r); r.setParent(None); r.deleteLater()
+        self.step_rows = []; self._row_set = set()
+
     def _remove_step(self, row):
-        if row in self.step_rows:
-            self.step_rows.remove(row)
+        if row in self._row_set:
+            self._row_set.discard(row); self.step_rows.remove(row)
             self.steps_layout.removeWidget(row)
             row.deleteLater()
 
     def _move_up(self, row):
-        idx = self.step_rows.index(row) if row in self.step_rows else -1
+        idx = self.step_rows.index(row) if row in self._row_set else -1
         if idx > 0: self._swap(idx, idx-1)
 
     def _move_down(self, row):
-        idx = self.step_rows.index(row) if row in self.step_rows else -1
+        idx = self.step_rows.index(row) if row in self._row_set else -1
         if idx >= 0 and idx < len(self.step_rows)-1: self._swap(idx, idx+1)
 
     def _swap(self, i, j):
         self.step_rows[i], self.step_rows[j] = self.step_rows[j], self.step_rows[i]
-        for r in self.step_rows: self.steps_layout.removeWidget(r)
-        for r in self.step_rows: self.steps_layout.addWidget(r)
+        # Only the two swapped rows move; re-insert the lower slot first so indices stay valid
+        lo, hi = min(i, j), max(i, j); sl = self.steps_layout
+        sl.removeWidget(self.step_rows[lo]); sl.removeWidget(self.step_rows[hi])
+        sl.insertWidget(lo, self.step_rows[lo]); sl.insertWidget(hi, self.step_rows[hi])
 
     def to_macro_string(self):
-        parts = [r.to_macro_string() for r in self.step_rows if r.to_macro_string()]
-        return ';'.join(parts)
+        out = []; app = out.append
+        for r in self.step_rows:
+            s = r.to_macro_string()
+            if s: app(s)
+        return ';'.join(out)
 
     def set_from_string(self, macro_str):
-        for r in list(self.step_rows): self._remove_step(r)
-        if not macro_str: return
-        steps = parse_macro(macro_str)
-        for step in steps:
-            if step[0] == 'key': self.add_step('key', step[1])
-            elif step[0] == 'hold': self.add_step('hold', f"{step[1]}:{step[2]}")
-            elif step[0] == 'mouse': self.add_step('mouse', step[1])
-            elif step[0] == 'delay': self.add_step('delay', str(step[1]))
+        # Build every row first, then add them in one batch with painting off
+        self.setUpdatesEnabled(False)
+        try:
+            self._fast_clear()
+            if not macro_str: return
+            rows = []; disp = self._step_dispatch.get
+            for step in parse_macro(macro_str):
+                fn = disp(step[0])
+                if fn: rows.append(fn(step))
+            sl = self.steps_layout
+            for r in rows: sl.addWidget(r)
+            self.step_rows = rows; self._row_set = set(rows)
+        finally: self.setUpdatesEnabled(True)
 
     def clear(self):
-        for r in list(self.step_rows): self._remove_step(r)
+        self.setUpdatesEnabled(False)
+        try: self._fast_clear()
+        finally: self.setUpdatesEnabled(True)
 
 # ÃƒÂ¢Ã¢â‚¬Â¢ÃƒÂ¢Ã¢â‚¬Â¢ÃƒÂ¢Ã¢â‚¬Â¢ GESTURE CHAIN CARD ÃƒÂ¢Ã¢â‚¬Â¢ÃƒÂ¢Ã¢â‚¬Â¢ÃƒÂ¢Ã¢â‚¬Â¢
 
 GESTURE_CHOICES = [(g['id'], g['name'], g['color']) for g in GESTURES]
+# +1 for the leading "Select gesture..." item
+GESTURE_CHOICE_INDEX = {gid:i+1 for i,(gid,_,_) in enumerate(GESTURE_CHOICES)}
 
 class ChainStepRow(QFrame):
     """A single gesture step in a chain sequence."""
@@ -1313,33 +1742,33 @@ class ChainStepRow(QFrame):
 
     def __init__(self, gesture_id='', parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:#1e1e2a;border:1px solid #2a2a3a;border-radius:4px;")
+        self.setObjectName("chainStepRow")
         self.setFixedHeight(30)
         ly = QHBoxLayout(self); ly.setContentsMargins(6,2,4,2); ly.setSpacing(6)
 
         step_icon = QLabel("\u25B6"); step_icon.setFixedSize(16,16)
         step_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        step_icon.setStyleSheet("font-size:8px;color:#ffaa00;border:none;background:transparent;")
+        step_icon.setObjectName("chainStepIcon")
         ly.addWidget(step_icon)
 
         self.gcb = QComboBox(); self.gcb.setFixedHeight(24); self.gcb.setMaxVisibleItems(25)
         self.gcb.addItem("Select gesture...", "")
         for gid, label, clr in GESTURE_CHOICES: self.gcb.addItem(gesture_icon_qicon(gid, clr), label, gid)
         if gesture_id:
-            for i in range(self.gcb.count()):
-                if self.gcb.itemData(i) == gesture_id: self.gcb.setCurrentIndex(i); break
+            self.gcb.setCurrentIndex(GESTURE_CHOICE_INDEX.get(gesture_id, 0))
         self._prev_gid = gesture_id
         self.gcb.currentIndexChanged.connect(self._on_changed)
         ly.addWidget(self.gcb, stretch=1)
 
         rb = QPushButton("\u2715"); rb.setFixedSize(20,20)
-        rb.setStyleSheet("font-size:11px;padding:0;border:none;color:#ff4466;background:transparent;")
-        rb.clicked.connect(lambda: self.removed.emit(self))
+        rb.setObjectName("rowRemoveBtn")
+        rb.clicked.connect(partial(_emit_self, self.removed, self))
         ly.addWidget(rb)
 
     def _on_changed(self):
         new_gid = self.gcb.currentData() or ''
         old_gid = self._prev_gid
+        if new_gid == old_gid: return
         self._prev_gid = new_gid
         self.gesture_changed.emit(self, old_gid, new_gid)
 
@@ -1347,44 +1776,62 @@ class ChainStepRow(QFrame):
         return self.gcb.currentData() or ''
 
 
+class _SliderLabels:
+    """Coalesces slider drag ticks into at most one value-label refresh per ~frame (16 ms)."""
+    def __init__(self, parent, fmt="{} ms"):
+        self._pairs = []; self._last = {}; self._fmt = fmt
+        self._t = QTimer(parent); self._t.setSingleShot(True); self._t.setInterval(16)
+        self._t.timeout.connect(self._sync)
+    def bind(self, sl, lbl):
+        self._pairs.append((sl, lbl)); self._last[lbl] = sl.value()
+        sl.valueChanged.connect(self._kick)
+    def _kick(self, *_):
+        if not self._t.isActive(): self._t.start()
+    def _sync(self):
+        for sl, lbl in self._pairs:
+            v = sl.value()
+            if self._last[lbl] != v: self._last[lbl] = v; lbl.setText(self._fmt.format(v))
+
+
 class GestureChainCard(QFrame):
     """Card for defining a gesture chain (sequence) that triggers an action."""
     chain_deleted = pyqtSignal(object)
     gesture_claimed = pyqtSignal(str)    # gesture_id claimed by this chain
     gesture_released = pyqtSignal(str)   # gesture_id released by this chain
     chain_save_requested = pyqtSignal(object)  # request to save this chain to library
+    seq_changed = pyqtSignal()           # step list edited; MainWindow re-indexes its chain waiters
 
     def __init__(self, chain_id=0, parent=None):
         super().__init__(parent)
         self.chain_id = chain_id
         self._saved_name = ''  # name of linked saved chain (empty = not linked)
-        self.setStyleSheet("background:#16161f;border:1px solid #ffaa0055;border-radius:10px;")
+        self.setObjectName("gestureChainCard"); self.setUpdatesEnabled(False)  # one paint once built
         ly = QVBoxLayout(self); ly.setContentsMargins(12,12,12,12); ly.setSpacing(6)
 
         # Header
         top = QHBoxLayout()
         ic = QLabel("\u26A1"); ic.setFixedSize(30,30); ic.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        ic.setStyleSheet("background:#ffaa0033;border-radius:6px;font-size:15px;border:none;")
+        ic.setObjectName("chainIcon")
         top.addWidget(ic)
         nb = QVBoxLayout(); nb.setSpacing(0)
         self.name_edit = QLineEdit(f"Gesture Chain #{chain_id+1}")
-        self.name_edit.setStyleSheet("font-weight:600;font-size:13px;color:#ffaa00;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px;")
+        self.name_edit.setObjectName("chainNameEdit")
         self.name_edit.setPlaceholderText("Chain name...")
         # Also keep name_lbl as an alias for compatibility with action log
         self.name_lbl = self.name_edit
         sub = QLabel("Sequential gesture trigger")
-        sub.setStyleSheet("color:#555570;font-size:11px;border:none;")
+        sub.setObjectName("cardSub")
         nb.addWidget(self.name_edit); nb.addWidget(sub); top.addLayout(nb); top.addStretch()
 
         save_btn = QPushButton("\U0001F4BE Save"); save_btn.setFixedHeight(26)
-        save_btn.setStyleSheet("font-size:10px;padding:2px 8px;border:1px solid #00ff8855;color:#00ff88;border-radius:4px;background:transparent;")
+        save_btn.setObjectName("chainSaveBtn")
         save_btn.setToolTip("Save this chain to library")
-        save_btn.clicked.connect(lambda: self.chain_save_requested.emit(self))
+        save_btn.clicked.connect(partial(_emit_self, self.chain_save_requested, self))
         top.addWidget(save_btn)
 
         del_btn = QPushButton("\U0001F5D1 Delete"); del_btn.setFixedHeight(26)
-        del_btn.setStyleSheet("font-size:10px;padding:2px 8px;border:1px solid #ff446655;color:#ff4466;border-radius:4px;background:transparent;")
-        del_btn.clicked.connect(lambda: self.chain_deleted.emit(self))
+        del_btn.setObjectName("chainDelBtn")
+        del_btn.clicked.connect(partial(_emit_self, self.chain_deleted, self))
         top.addWidget(del_btn)
         ly.addLayout(top)
 
@@ -1392,26 +1839,26 @@ class GestureChainCard(QFrame):
         ly.addWidget(self._lbl("Gesture Sequence (in order)"))
         self.steps_layout = QVBoxLayout(); self.steps_layout.setContentsMargins(0,0,0,0); self.steps_layout.setSpacing(2)
         ly.addLayout(self.steps_layout)
-        self.step_rows = []
+        self.step_rows = []; self._row_set = set()
+        self._cached_seq = None; self._cached_ids = None  # dropped whenever the step rows change
 
         add_gesture_btn = QPushButton("+ Add Gesture Step"); add_gesture_btn.setFixedHeight(24)
-        add_gesture_btn.setStyleSheet("font-size:10px;padding:2px 10px;border:1px dashed #ffaa0055;color:#ffaa00;border-radius:4px;background:transparent;")
+        add_gesture_btn.setObjectName("chainAddStepBtn")
         add_gesture_btn.clicked.connect(lambda: self.add_gesture_step())
         ly.addWidget(add_gesture_btn)
 
         # Step timeout
         h = QHBoxLayout(); h.addWidget(self._lbl("Step Timeout")); h.addStretch()
-        self.timeout_val = QLabel("1500 ms")
-        self.timeout_val.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;border:none;")
+        self.timeout_val = QLabel("1500 ms"); self.timeout_val.setObjectName("monoVal")
         h.addWidget(self.timeout_val); ly.addLayout(h)
         self.timeout_sl = QSlider(Qt.Orientation.Horizontal); self.timeout_sl.setRange(300,5000)
-        self.timeout_sl.setSingleStep(100); self.timeout_sl.setValue(1500)
-        self.timeout_sl.setStyleSheet("QSlider::handle:horizontal{background:#ffaa00;border:2px solid #16161f;}")
-        self.timeout_sl.valueChanged.connect(lambda v: self.timeout_val.setText(f"{v} ms"))
+        self.timeout_sl.setSingleStep(100); self.timeout_sl.setValue(1500); self.timeout_sl.setObjectName("amberSl")
+        self._sl_labels = _SliderLabels(self); self._sl_labels.bind(self.timeout_sl, self.timeout_val)
+        self.timeout_ms = 1500; self.timeout_sl.valueChanged.connect(partial(setattr, self, 'timeout_ms'))  # read per frame
         ly.addWidget(self.timeout_sl)
 
         # Action config (reuse same pattern as GestureCard)
-        sep = QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setStyleSheet("color:#2a2a3a;"); ly.addWidget(sep)
+        sep = QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setObjectName("cardSep"); ly.addWidget(sep)
         ly.addWidget(self._lbl("Chain Action"))
         ar = QHBoxLayout()
         self.ac = QComboBox(); self.ac.setMaxVisibleItems(25)
@@ -1432,29 +1879,28 @@ class GestureChainCard(QFrame):
         # Gamepad axis picker + options
         self.gp_axis_frame = QFrame()
         self.gp_axis_frame.setObjectName("gpAxisFrameChain")
-        self.gp_axis_frame.setStyleSheet("#gpAxisFrameChain{background:transparent;border:none;}")
         gp_ax_ly = QVBoxLayout(self.gp_axis_frame); gp_ax_ly.setContentsMargins(0,0,0,0); gp_ax_ly.setSpacing(4)
         ax_row = QHBoxLayout()
         self.gp_axis_cb = QComboBox(); self.gp_axis_cb.setMaxVisibleItems(25)
         for ax_id, ax_label, *_ in GAMEPAD_AXES: self.gp_axis_cb.addItem(ax_label, ax_id)
         ax_row.addWidget(self.gp_axis_cb)
-        self.gp_invert = QCheckBox("Invert"); self.gp_invert.setStyleSheet("font-size:10px;border:none;")
+        self.gp_invert = QCheckBox("Invert"); self.gp_invert.setObjectName("gpInvert")
         ax_row.addWidget(self.gp_invert); gp_ax_ly.addLayout(ax_row)
         self.gp_axis_frame.hide(); ly.addWidget(self.gp_axis_frame)
 
         # Toggle gestures note (informational for chains - they're already a good trigger)
         self._toggle_note = QLabel("✓ Gesture chains are a good choice for this action.")
         self._toggle_note.setWordWrap(True)
-        self._toggle_note.setStyleSheet("font-size:10px;color:#00ff88;background:#00ff8815;border:1px solid #00ff8833;border-radius:4px;padding:4px 6px;")
+        self._toggle_note.setObjectName("actionNote")
         self._toggle_note.hide(); ly.addWidget(self._toggle_note)
 
         # Progress indicator
-        self.progress_lbl = QLabel("Waiting...")
-        self.progress_lbl.setStyleSheet("font-family:Consolas;font-size:10px;color:#555570;border:none;padding-top:4px;")
+        self.progress_lbl = QLabel("Waiting..."); self.progress_lbl.setObjectName("chainProgress"); self._prog_key = 0
         ly.addWidget(self.progress_lbl)
+        self.setUpdatesEnabled(True)
 
     def _lbl(self, t):
-        l = QLabel(t); l.setStyleSheet("font-size:11px;border:none;"); return l
+        l = QLabel(t); l.setObjectName("lbl11"); return l
 
     def _oa(self):
         a = self.ac.currentData()
@@ -1467,28 +1913,35 @@ class GestureChainCard(QFrame):
         row = ChainStepRow(gesture_id)
         row.removed.connect(self._remove_gesture_step)
         row.gesture_changed.connect(self._on_gesture_changed)
-        self.step_rows.append(row)
-        self.steps_layout.addWidget(row)
+        self.step_rows.append(row); self._row_set.add(row)
+        self.steps_layout.addWidget(row); self._invalidate_seq()
         if gesture_id: self.gesture_claimed.emit(gesture_id)
 
     def _remove_gesture_step(self, row):
-        if row in self.step_rows:
+        if row in self._row_set:
             gid = row.gesture_id()
-            self.step_rows.remove(row)
+            self._row_set.discard(row); self.step_rows.remove(row)
             self.steps_layout.removeWidget(row)
-            row.deleteLater()
+            row.deleteLater(); self._invalidate_seq()
             if gid: self.gesture_released.emit(gid)
 
     def _on_gesture_changed(self, row, old_gid, new_gid):
+        if old_gid == new_gid: return
+        self._invalidate_seq()
         if old_gid: self.gesture_released.emit(old_gid)
         if new_gid: self.gesture_claimed.emit(new_gid)
 
+    def _invalidate_seq(self): self._cached_seq = None; self._cached_ids = None; self.seq_changed.emit()
+
     def get_gesture_sequence(self):
-        return [r.gesture_id() for r in self.step_rows if r.gesture_id()]
+        if self._cached_seq is None:
+            self._cached_seq = tuple(g for g in (r.gesture_id() for r in self.step_rows) if g)
+        return self._cached_seq
 
     def get_all_gesture_ids(self):
-        """Return set of all gesture IDs used by this chain."""
-        return {r.gesture_id() for r in self.step_rows if r.gesture_id()}
+        """Return frozenset of all gesture IDs used by this chain."""
+        if self._cached_ids is None: self._cached_ids = frozenset(self.get_gesture_sequence())
+        return self._cached_ids
 
     def get_action_state(self):
         return dict(action=self.ac.currentData(), keyBind=self.ke.text(),
@@ -1500,7 +1953,7 @@ class GestureChainCard(QFrame):
 
     def get_state(self):
         return dict(name=self.name_edit.text(), saved_name=self._saved_name,
-                    gestures=self.get_gesture_sequence(),
+                    gestures=list(self.get_gesture_sequence()),
                     timeout=self.timeout_sl.value(),
                     action=self.ac.currentData(), keyBind=self.ke.text(),
                     command=self.ce.text(), launchProgram=self.lpe.text(),
@@ -1512,42 +1965,83 @@ class GestureChainCard(QFrame):
     def set_state(self, s):
         self.name_edit.setText(s.get('name', f'Gesture Chain #{self.chain_id+1}'))
         self._saved_name = s.get('saved_name', '')
-        # Clear existing steps
-        for r in list(self.step_rows): self._remove_gesture_step(r)
-        for gid in s.get('gestures', []): self.add_gesture_step(gid)
+        # Clear existing steps; per-step claim/release is muted and emitted once per gesture afterwards
+        old_ids = self.get_all_gesture_ids()
+        self._invalidate_seq(); self.setUpdatesEnabled(False); self.blockSignals(True)
+        try:
+            for r in list(self.step_rows): self._remove_gesture_step(r)
+            for gid in s.get('gestures', []): self.add_gesture_step(gid)
+        finally: self.blockSignals(False); self.setUpdatesEnabled(True)
+        new_ids = self.get_all_gesture_ids()
+        for gid in old_ids - new_ids: self.gesture_released.emit(gid)
+        for gid in new_ids: self.gesture_claimed.emit(gid)
         self.timeout_sl.setValue(s.get('timeout', 1500))
         a = s.get('action', 'none')
-        for i in range(self.ac.count()):
-            if self.ac.itemData(i) == a: self.ac.setCurrentIndex(i); break
+        self.ac.setCurrentIndex(ACTION_TYPE_INDEX.get(a, 0))
         self.ke.setText(s.get('keyBind', '')); self.ce.setText(s.get('command', ''))
         self.lpe.setText(s.get('launchProgram', ''))
         self.me.set_from_string(s.get('macro', ''))
         gb = s.get('gamepadBtn','')
-        for i in range(self.gp_btn_cb.count()):
-            if self.gp_btn_cb.itemData(i)==gb: self.gp_btn_cb.setCurrentIndex(i); break
+        self.gp_btn_cb.setCurrentIndex(GAMEPAD_BUTTON_INDEX.get(gb, 0))
         ga = s.get('gamepadAxis','')
-        for i in range(self.gp_axis_cb.count()):
-            if self.gp_axis_cb.itemData(i)==ga: self.gp_axis_cb.setCurrentIndex(i); break
+        self.gp_axis_cb.setCurrentIndex(GAMEPAD_AXIS_INDEX.get(ga, 0))
         self.gp_invert.setChecked(s.get('gamepadInvert', False))
 
+    _PROGRESS_CACHE = {}  # (step_idx, total) -> label text, shared by all chain cards
+
     def set_progress(self, step_idx, total):
-        if step_idx == 0:
-            self.progress_lbl.setText("Waiting...")
-            self.progress_lbl.setStyleSheet("font-family:Consolas;font-size:10px;color:#555570;border:none;padding-top:4px;")
-        else:
-            dots = "\u2B24 " * step_idx + "\u25CB " * (total - step_idx)
-            self.progress_lbl.setText(f"Progress: {dots.strip()} ({step_idx}/{total})")
-            self.progress_lbl.setStyleSheet("font-family:Consolas;font-size:10px;color:#ffaa00;border:none;padding-top:4px;")
+        # Called every frame; only touch the label when the step actually moved
+        key = (step_idx, total) if step_idx else 0
+        if key == self._prog_key: return
+        active = bool(step_idx)
+        if active:
+            txt = self._PROGRESS_CACHE.get(key)
+            if txt is None:
+                if len(self._PROGRESS_CACHE) >= 256: self._PROGRESS_CACHE.clear()
+                dots = ("\u2B24 " * step_idx + "\u25CB " * (total - step_idx)).strip()
+                txt = self._PROGRESS_CACHE[key] = f"Progress: {dots} ({step_idx}/{total})"
+        else: txt = "Waiting..."
+        self.progress_lbl.setText(txt)
+        if active != bool(self._prog_key): _repolish(self.progress_lbl, 'active', active)
+        self._prog_key = key
 
 
 # ••• MORSE CHAIN CARD •••
 
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
-from PyQt6.QtCore import QRect, QRectF
+
+@lru_cache(maxsize=256)
+def _morse_syms(code):
+    """Packed morse code -> ('S'/'L', ...). A code is a leading 1 bit followed by one bit per symbol
+    (S=0, L=1), so 1 is the empty input and appending is code << 1 | is_long."""
+    return tuple('L' if code >> k & 1 else 'S' for k in range(code.bit_length() - 2, -1, -1))
 
 
 class MorseProgressWidget(QWidget):
     """Custom widget that draws morse-code hold progress as split-pill cells."""
+    # Paint resources built once; paintEvent runs at frame rate while a capture is active
+    _CLR_IDLE = QColor(0x55, 0x55, 0x70); _CLR_FLASH = QColor(0x00, 0xff, 0x88)
+    _CLR_SHORT = QColor(0x00, 0xd4, 0xff); _CLR_LONG = QColor(0xff, 0xaa, 0x00)
+    _CLR_BG = QColor(0x1e, 0x1e, 0x2a); _CLR_BORDER = QColor(0x2a, 0x2a, 0x3a)
+    _CLR_SHORT_FILL = QColor(0x00, 0xd4, 0xff, 0x88); _CLR_SHORT_SOLID = QColor(0x00, 0xd4, 0xff, 0xcc)
+    _CLR_LONG_FILL = QColor(0xff, 0xaa, 0x00, 0xaa)
+    _BRUSH_FLASH = QBrush(_CLR_FLASH); _BRUSH_SHORT = QBrush(_CLR_SHORT); _BRUSH_LONG = QBrush(_CLR_LONG)
+    _BRUSH_BG = QBrush(_CLR_BG); _BRUSH_SHORT_FILL = QBrush(_CLR_SHORT_FILL)
+    _BRUSH_SHORT_SOLID = QBrush(_CLR_SHORT_SOLID); _BRUSH_LONG_FILL = QBrush(_CLR_LONG_FILL)
+    _PEN_BORDER = QPen(_CLR_BORDER, 1); _PEN_LONG = QPen(_CLR_LONG, 1)
+    _path_cache = {}  # (w, h) -> pill QPainterPath at the origin, oldest dropped past 32
+
+    @classmethod
+    def _pill_path(cls, cw, h):
+        path = cls._path_cache.get((cw, h))
+        if path is None:
+            if len(cls._path_cache) >= 32: cls._path_cache.pop(next(iter(cls._path_cache)))
+            r = h // 2; path = QPainterPath(); path.addRoundedRect(QRectF(0, 0, cw, h), r, r)
+            cls._path_cache[(cw, h)] = path
+        return path
+
+    @staticmethod
+    def _draw_at(p, path, x, y):
+        p.translate(x, y); p.drawPath(path); p.translate(-x, -y)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1558,6 +2052,8 @@ class MorseProgressWidget(QWidget):
         self.active = False
         self.matched = False
         self._flash = 0
+        self._flash_timer = QTimer(self); self._flash_timer.setInterval(80)
+        self._flash_timer.timeout.connect(self.update)
 
     def set_state(self, completed, in_progress_frac, active):
         self.completed = completed
@@ -1566,102 +2062,103 @@ class MorseProgressWidget(QWidget):
         self.update()
 
     def flash_match(self):
-        self.matched = True; self._flash = 6; self.update()
+        self.matched = True; self._flash = 6; self._flash_timer.start(); self.update()
 
     def reset(self):
         self.completed = []; self.in_progress = 0.0; self.active = False
-        self.matched = False; self._flash = 0; self.update()
+        self.matched = False; self._flash = 0; self._flash_timer.stop(); self.update()
 
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Flash countdown: one step per paint; the timer keeps repainting until it runs out
+        flashing = self._flash > 0
+        if flashing:
+            self._flash -= 1
+            if self._flash == 0: self.matched = False
+        else: self._flash_timer.stop()
         w = self.width(); h = self.height()
         cell_gap = 4
         n_cells = len(self.completed) + (1 if self.active else 0)
         if n_cells == 0:
-            p.setPen(QColor('#555570'))
+            p.setPen(self._CLR_IDLE)
             p.drawText(self.rect(), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, '  Waiting for gesture...')
             p.end(); return
         cir_d = h - 6; pill_w = int(cir_d * 2.5)
-        cell_widths = []
-        for t in self.completed:
-            cell_widths.append(cir_d if t == 'S' else pill_w)
-        if self.active: cell_widths.append(pill_w)
         x = 4; cy = h // 2
-        for i, t in enumerate(self.completed):
-            cw = cell_widths[i]
-            if self._flash > 0: clr = QColor('#00ff88')
-            elif t == 'S': clr = QColor('#00d4ff')
-            else: clr = QColor('#ffaa00')
-            p.setPen(Qt.PenStyle.NoPen); p.setBrush(QBrush(clr))
+        for t in self.completed:
+            cw = cir_d if t == 'S' else pill_w
+            if flashing: br = self._BRUSH_FLASH
+            elif t == 'S': br = self._BRUSH_SHORT
+            else: br = self._BRUSH_LONG
+            p.setPen(Qt.PenStyle.NoPen); p.setBrush(br)
             if t == 'S': p.drawEllipse(x, cy - cir_d//2, cir_d, cir_d)
-            else:
-                r = cir_d // 2; p.drawRoundedRect(x, cy - r, cw, cir_d, r, r)
+            else: self._draw_at(p, self._pill_path(cw, cir_d), x, cy - cir_d // 2)
             x += cw + cell_gap
         if self.active:
-            cw = cell_widths[-1]; r = cir_d // 2; frac = self.in_progress
-            p.setPen(Qt.PenStyle.NoPen); p.setBrush(QBrush(QColor('#1e1e2a')))
-            p.drawRoundedRect(x, cy - r, cw, cir_d, r, r)
-            p.setPen(QPen(QColor('#2a2a3a'), 1)); p.setBrush(Qt.BrushStyle.NoBrush)
-            p.drawRoundedRect(x, cy - r, cw, cir_d, r, r); p.setPen(Qt.PenStyle.NoPen)
+            cw = pill_w; r = cir_d // 2; frac = self.in_progress
+            pill = self._pill_path(cw, cir_d); top = cy - r
+            p.setPen(Qt.PenStyle.NoPen); p.setBrush(self._BRUSH_BG)
+            self._draw_at(p, pill, x, top)
+            p.setPen(self._PEN_BORDER); p.setBrush(Qt.BrushStyle.NoBrush)
+            self._draw_at(p, pill, x, top); p.setPen(Qt.PenStyle.NoPen)
             half = cw // 2
             if frac <= 0.5:
                 fill_w = int(frac * 2 * half)
                 if fill_w > 0:
                     p.save(); p.setClipRect(QRectF(x, cy - r, fill_w, cir_d))
-                    p.setBrush(QBrush(QColor('#00d4ff88')))
-                    p.drawRoundedRect(x, cy - r, cw, cir_d, r, r); p.restore()
-                p.setPen(QPen(QColor('#2a2a3a'), 1))
+                    p.setBrush(self._BRUSH_SHORT_FILL)
+                    self._draw_at(p, pill, x, top); p.restore()
+                p.setPen(self._PEN_BORDER)
                 p.drawLine(x + half, cy - r + 2, x + half, cy + r - 2); p.setPen(Qt.PenStyle.NoPen)
             else:
                 p.save(); p.setClipRect(QRectF(x, cy - r, half, cir_d))
-                p.setBrush(QBrush(QColor('#00d4ffcc')))
-                p.drawRoundedRect(x, cy - r, cw, cir_d, r, r); p.restore()
+                p.setBrush(self._BRUSH_SHORT_SOLID)
+                self._draw_at(p, pill, x, top); p.restore()
                 right_frac = (frac - 0.5) * 2; right_fill = int(right_frac * half)
                 if right_fill > 0:
                     p.save(); p.setClipRect(QRectF(x + half, cy - r, right_fill, cir_d))
-                    p.setBrush(QBrush(QColor('#ffaa00aa')))
-                    p.drawRoundedRect(x, cy - r, cw, cir_d, r, r); p.restore()
-                p.setPen(QPen(QColor('#ffaa00'), 1))
+                    p.setBrush(self._BRUSH_LONG_FILL)
+                    self._draw_at(p, pill, x, top); p.restore()
+                p.setPen(self._PEN_LONG)
                 p.drawLine(x + half, cy - r + 2, x + half, cy + r - 2); p.setPen(Qt.PenStyle.NoPen)
-        if self._flash > 0:
-            self._flash -= 1
-            if self._flash == 0: self.matched = False
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(80, self.update)
         p.end()
 
 
 class MorsePatternRow(QFrame):
     """One row: a morse pattern (S/L buttons) + action assignment."""
     removed = pyqtSignal(object)
+    pattern_changed = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:#1a1a26;border:1px solid #2a2a3a;border-radius:6px;")
+        self.setObjectName("morsePatternRow")
         self._symbols = []
         outer = QVBoxLayout(self); outer.setContentsMargins(8,6,8,6); outer.setSpacing(4)
         top = QHBoxLayout(); top.setSpacing(4)
-        self.sym_frame = QFrame()
-        self.sym_frame.setStyleSheet("background:transparent;border:none;")
+        self.sym_frame = QFrame(); self.sym_frame.setObjectName("morseSymFrame")
         self.sym_layout = QHBoxLayout(self.sym_frame)
         self.sym_layout.setContentsMargins(0,0,0,0); self.sym_layout.setSpacing(3)
+        # Symbol labels are pooled (slot i always removes symbol i); only restyled/shown/hidden on edits
+        self._sym_pool = []; self._pool_syms = []
+        self._sym_hint = QLabel("click \u00b7S or \u2501L to build pattern"); self._sym_hint.setObjectName("morseHint")
+        self.sym_layout.addWidget(self._sym_hint); self.sym_layout.addStretch()
         top.addWidget(self.sym_frame, stretch=1)
         add_s = QPushButton("\u00b7S"); add_s.setFixedSize(28,22)
-        add_s.setStyleSheet("font-size:10px;font-weight:700;padding:0;border:1px solid #00d4ff55;color:#00d4ff;border-radius:4px;background:#00d4ff15;")
+        add_s.setObjectName("addShortBtn")
         add_s.setToolTip("Add Short hold"); add_s.clicked.connect(lambda: self._add_symbol('S')); top.addWidget(add_s)
         add_l = QPushButton("\u2501L"); add_l.setFixedSize(28,22)
-        add_l.setStyleSheet("font-size:10px;font-weight:700;padding:0;border:1px solid #ffaa0055;color:#ffaa00;border-radius:4px;background:#ffaa0015;")
+        add_l.setObjectName("addLongBtn")
         add_l.setToolTip("Add Long hold"); add_l.clicked.connect(lambda: self._add_symbol('L')); top.addWidget(add_l)
         clr = QPushButton("\u2715"); clr.setFixedSize(22,22)
-        clr.setStyleSheet("font-size:10px;padding:0;border:none;color:#ff4466;background:transparent;")
+        clr.setObjectName("rowClearBtn")
         clr.setToolTip("Clear pattern"); clr.clicked.connect(self._clear_symbols); top.addWidget(clr)
         rb = QPushButton("\U0001F5D1"); rb.setFixedSize(22,22)
-        rb.setStyleSheet("font-size:11px;padding:0;border:none;color:#555570;background:transparent;")
-        rb.setToolTip("Remove this pattern row"); rb.clicked.connect(lambda: self.removed.emit(self)); top.addWidget(rb)
+        rb.setObjectName("rowTrashBtn")
+        rb.setToolTip("Remove this pattern row"); rb.clicked.connect(partial(_emit_self, self.removed, self)); top.addWidget(rb)
         outer.addLayout(top)
         bot = QHBoxLayout(); bot.setSpacing(4)
-        arr = QLabel("\u2192"); arr.setStyleSheet("color:#555570;font-size:12px;border:none;"); bot.addWidget(arr)
+        arr = QLabel("\u2192"); arr.setObjectName("morseArrow"); bot.addWidget(arr)
         self.ac = QComboBox(); self.ac.setFixedHeight(22); self.ac.setMaxVisibleItems(25)
         for v, l in ACTION_TYPES: self.ac.addItem(l, v)
         self.ac.currentIndexChanged.connect(self._oa); bot.addWidget(self.ac, stretch=1)
@@ -1681,7 +2178,7 @@ class MorsePatternRow(QFrame):
         # Toggle gestures note (informational for morse - they're already a good trigger)
         self._toggle_note = QLabel("✓ Morse chains are a good choice for this action.")
         self._toggle_note.setWordWrap(True)
-        self._toggle_note.setStyleSheet("font-size:10px;color:#00ff88;background:#00ff8815;border:1px solid #00ff8833;border-radius:4px;padding:4px 6px;")
+        self._toggle_note.setObjectName("actionNote")
         self._toggle_note.hide(); outer.addWidget(self._toggle_note)
         self._rebuild_symbols()
 
@@ -1699,22 +2196,23 @@ class MorsePatternRow(QFrame):
         self._symbols = []; self._rebuild_symbols()
 
     def _rebuild_symbols(self):
-        while self.sym_layout.count():
-            item = self.sym_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        for i, sym in enumerate(self._symbols):
-            if sym == 'S':
-                lbl = QLabel("\u00b7"); lbl.setFixedSize(14, 20); lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                lbl.setStyleSheet("background:#00d4ff33;border:1px solid #00d4ff66;border-radius:7px;color:#00d4ff;font-size:14px;font-weight:700;")
-            else:
-                lbl = QLabel("\u2501"); lbl.setFixedSize(26, 20); lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                lbl.setStyleSheet("background:#ffaa0033;border:1px solid #ffaa0066;border-radius:4px;color:#ffaa00;font-size:11px;font-weight:700;")
-            idx = i; lbl.mousePressEvent = lambda e, ix=idx: self._remove_symbol(ix)
-            lbl.setToolTip("Click to remove"); self.sym_layout.addWidget(lbl)
-        if not self._symbols:
-            hint = QLabel("click \u00b7S or \u2501L to build pattern")
-            hint.setStyleSheet("color:#555570;font-size:10px;border:none;"); self.sym_layout.addWidget(hint)
-        self.sym_layout.addStretch()
+        pool = self._sym_pool; kinds = self._pool_syms; syms = self._symbols
+        for i in range(max(len(syms), len(pool))):
+            if i >= len(syms): pool[i].hide(); continue
+            if i == len(pool):
+                lbl = QLabel(); lbl.setObjectName("morseSym"); lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                lbl.mousePressEvent = partial(self._remove_symbol_event, i)
+                lbl.setToolTip("Click to remove"); self.sym_layout.insertWidget(i, lbl)
+                pool.append(lbl); kinds.append(None)
+            lbl = pool[i]; sym = 'S' if syms[i] == 'S' else 'L'
+            if kinds[i] != sym:
+                if sym == 'S': lbl.setText("\u00b7"); lbl.setFixedSize(14, 20)
+                else: lbl.setText("\u2501"); lbl.setFixedSize(26, 20)
+                _repolish(lbl, 'sym', sym); kinds[i] = sym
+            lbl.show()
+        self._sym_hint.setVisible(not syms); self.pattern_changed.emit()
+
+    def _remove_symbol_event(self, idx, _e): self._remove_symbol(idx)
 
     def _remove_symbol(self, idx):
         if 0 <= idx < len(self._symbols): self._symbols.pop(idx); self._rebuild_symbols()
@@ -1727,16 +2225,13 @@ class MorsePatternRow(QFrame):
                     gamepadBtn=self.gp_btn_cb.currentData() or '', gamepadAxis=self.gp_axis_cb.currentData() or '')
     def set_action_state(self, s):
         a = s.get('action', 'none')
-        for i in range(self.ac.count()):
-            if self.ac.itemData(i) == a: self.ac.setCurrentIndex(i); break
+        self.ac.setCurrentIndex(ACTION_TYPE_INDEX.get(a, 0))
         self.ke.setText(s.get('keyBind', '')); self.ce.setText(s.get('command', ''))
         self.lpe.setText(s.get('launchProgram', '')); self.me.set_from_string(s.get('macro', ''))
         gb = s.get('gamepadBtn','')
-        for i in range(self.gp_btn_cb.count()):
-            if self.gp_btn_cb.itemData(i)==gb: self.gp_btn_cb.setCurrentIndex(i); break
+        self.gp_btn_cb.setCurrentIndex(GAMEPAD_BUTTON_INDEX.get(gb, 0))
         ga = s.get('gamepadAxis','')
-        for i in range(self.gp_axis_cb.count()):
-            if self.gp_axis_cb.itemData(i)==ga: self.gp_axis_cb.setCurrentIndex(i); break
+        self.gp_axis_cb.setCurrentIndex(GAMEPAD_AXIS_INDEX.get(ga, 0))
     def get_state(self): return dict(pattern=self._symbols, **self.get_action_state())
     def set_state(self, s): self.set_pattern(s.get('pattern', [])); self.set_action_state(s)
 
@@ -1751,81 +2246,83 @@ class MorseChainCard(QFrame):
     def __init__(self, chain_id=0, parent=None):
         super().__init__(parent)
         self.chain_id = chain_id
-        self._cur_gesture = ''
+        self._cur_gesture = ''; self._tick = None
         self._saved_name = ''  # name of linked saved chain (empty = not linked)
-        self.setStyleSheet("background:#16161f;border:1px solid #ff884455;border-radius:10px;")
+        self.setObjectName("morseChainCard"); self.setUpdatesEnabled(False)
         ly = QVBoxLayout(self); ly.setContentsMargins(12,12,12,12); ly.setSpacing(6)
         top = QHBoxLayout()
         ic = QLabel("\u2505"); ic.setFixedSize(30,30); ic.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        ic.setStyleSheet("background:#ff884433;border-radius:6px;font-size:15px;border:none;"); top.addWidget(ic)
+        ic.setObjectName("morseIcon"); top.addWidget(ic)
         nb = QVBoxLayout(); nb.setSpacing(0)
         self.name_edit = QLineEdit(f"Morse Chain #{chain_id+1}")
-        self.name_edit.setStyleSheet("font-weight:600;font-size:13px;color:#ff8844;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px;")
+        self.name_edit.setObjectName("morseNameEdit")
         self.name_edit.setPlaceholderText("Chain name...")
         self.name_lbl = self.name_edit  # alias for compatibility
         sub = QLabel("Short \u00b7 Long \u2501 hold sequences \u2192 actions")
-        sub.setStyleSheet("color:#555570;font-size:11px;border:none;")
+        sub.setObjectName("cardSub")
         nb.addWidget(self.name_edit); nb.addWidget(sub); top.addLayout(nb); top.addStretch()
 
         save_btn = QPushButton("\U0001F4BE Save"); save_btn.setFixedHeight(26)
-        save_btn.setStyleSheet("font-size:10px;padding:2px 8px;border:1px solid #00ff8855;color:#00ff88;border-radius:4px;background:transparent;")
+        save_btn.setObjectName("chainSaveBtn")
         save_btn.setToolTip("Save this chain to library")
-        save_btn.clicked.connect(lambda: self.chain_save_requested.emit(self))
+        save_btn.clicked.connect(partial(_emit_self, self.chain_save_requested, self))
         top.addWidget(save_btn)
 
         del_btn = QPushButton("\U0001F5D1 Delete"); del_btn.setFixedHeight(26)
-        del_btn.setStyleSheet("font-size:10px;padding:2px 8px;border:1px solid #ff446655;color:#ff4466;border-radius:4px;background:transparent;")
-        del_btn.clicked.connect(lambda: self.chain_deleted.emit(self)); top.addWidget(del_btn)
+        del_btn.setObjectName("chainDelBtn")
+        del_btn.clicked.connect(partial(_emit_self, self.chain_deleted, self)); top.addWidget(del_btn)
         ly.addLayout(top)
         ly.addWidget(self._lbl("Trigger Gesture"))
         self.gcb = QComboBox(); self.gcb.setFixedHeight(26); self.gcb.setMaxVisibleItems(25)
         self.gcb.addItem("Select gesture...", "")
         for gid, label, clr in GESTURE_CHOICES: self.gcb.addItem(gesture_icon_qicon(gid, clr), label, gid)
         self.gcb.currentIndexChanged.connect(self._on_gesture_changed); ly.addWidget(self.gcb)
-        sep0 = QFrame(); sep0.setFrameShape(QFrame.Shape.HLine); sep0.setStyleSheet("color:#2a2a3a;"); ly.addWidget(sep0)
+        sep0 = QFrame(); sep0.setFrameShape(QFrame.Shape.HLine); sep0.setObjectName("cardSep"); ly.addWidget(sep0)
         th_row = QHBoxLayout(); th_row.setSpacing(16)
         sh_col = QVBoxLayout(); sh_col.setSpacing(2)
         sh_hdr = QHBoxLayout()
-        sh_lbl = QLabel("Short Hold"); sh_lbl.setStyleSheet("font-size:11px;color:#00d4ff;border:none;font-weight:600;")
+        sh_lbl = QLabel("Short Hold"); sh_lbl.setObjectName("shortLbl")
         sh_hdr.addWidget(sh_lbl); sh_hdr.addStretch()
-        self.sh_val = QLabel("200 ms"); self.sh_val.setStyleSheet("font-family:Consolas;font-size:11px;color:#00d4ff;border:none;")
+        self.sh_val = QLabel("200 ms"); self.sh_val.setObjectName("shortVal")
         sh_hdr.addWidget(self.sh_val); sh_col.addLayout(sh_hdr)
         self.sh_sl = QSlider(Qt.Orientation.Horizontal); self.sh_sl.setRange(50,1000); self.sh_sl.setSingleStep(25); self.sh_sl.setValue(200)
-        self.sh_sl.setStyleSheet("QSlider::handle:horizontal{background:#00d4ff;border:2px solid #16161f;}")
-        self.sh_sl.valueChanged.connect(lambda v: self.sh_val.setText(f"{v} ms")); sh_col.addWidget(self.sh_sl)
+        self.sh_sl.setObjectName("cyanSl")
+        self._sl_labels = _SliderLabels(self); self._sl_labels.bind(self.sh_sl, self.sh_val); sh_col.addWidget(self.sh_sl)
         th_row.addLayout(sh_col, stretch=1)
         lh_col = QVBoxLayout(); lh_col.setSpacing(2)
         lh_hdr = QHBoxLayout()
-        lh_lbl = QLabel("Long Hold"); lh_lbl.setStyleSheet("font-size:11px;color:#ffaa00;border:none;font-weight:600;")
+        lh_lbl = QLabel("Long Hold"); lh_lbl.setObjectName("longLbl")
         lh_hdr.addWidget(lh_lbl); lh_hdr.addStretch()
-        self.lh_val = QLabel("600 ms"); self.lh_val.setStyleSheet("font-family:Consolas;font-size:11px;color:#ffaa00;border:none;")
+        self.lh_val = QLabel("600 ms"); self.lh_val.setObjectName("longVal")
         lh_hdr.addWidget(self.lh_val); lh_col.addLayout(lh_hdr)
         self.lh_sl = QSlider(Qt.Orientation.Horizontal); self.lh_sl.setRange(200,3000); self.lh_sl.setSingleStep(50); self.lh_sl.setValue(600)
-        self.lh_sl.setStyleSheet("QSlider::handle:horizontal{background:#ffaa00;border:2px solid #16161f;}")
-        self.lh_sl.valueChanged.connect(lambda v: self.lh_val.setText(f"{v} ms")); lh_col.addWidget(self.lh_sl)
+        self.lh_sl.setObjectName("amberSl")
+        self._sl_labels.bind(self.lh_sl, self.lh_val); lh_col.addWidget(self.lh_sl)
         th_row.addLayout(lh_col, stretch=1); ly.addLayout(th_row)
         ito_row = QHBoxLayout(); ito_row.addWidget(self._lbl("Symbol Timeout")); ito_row.addStretch()
-        self.timeout_val = QLabel("1500 ms"); self.timeout_val.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;border:none;")
+        self.timeout_val = QLabel("1500 ms"); self.timeout_val.setObjectName("monoVal")
         ito_row.addWidget(self.timeout_val); ly.addLayout(ito_row)
         self.timeout_sl = QSlider(Qt.Orientation.Horizontal); self.timeout_sl.setRange(300,5000); self.timeout_sl.setSingleStep(100); self.timeout_sl.setValue(1500)
-        self.timeout_sl.setStyleSheet("QSlider::handle:horizontal{background:#ffaa00;border:2px solid #16161f;}")
-        self.timeout_sl.valueChanged.connect(lambda v: self.timeout_val.setText(f"{v} ms")); ly.addWidget(self.timeout_sl)
-        sep = QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setStyleSheet("color:#2a2a3a;"); ly.addWidget(sep)
+        self.timeout_sl.setObjectName("amberSl")
+        self._sl_labels.bind(self.timeout_sl, self.timeout_val); ly.addWidget(self.timeout_sl)
+        for sl in (self.sh_sl, self.lh_sl, self.timeout_sl): sl.valueChanged.connect(self._invalidate_tick)
+        sep = QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setObjectName("cardSep"); ly.addWidget(sep)
         patr_hdr = QHBoxLayout(); patr_hdr.addWidget(self._lbl("Morse Patterns \u2192 Actions")); patr_hdr.addStretch()
         add_pat_btn = QPushButton("+ Pattern"); add_pat_btn.setFixedHeight(22)
-        add_pat_btn.setStyleSheet("font-size:10px;padding:2px 8px;border:1px dashed #ff884455;color:#ff8844;border-radius:4px;background:transparent;")
+        add_pat_btn.setObjectName("morseAddBtn")
         add_pat_btn.clicked.connect(self.add_pattern_row); patr_hdr.addWidget(add_pat_btn); ly.addLayout(patr_hdr)
         self.patterns_layout = QVBoxLayout(); self.patterns_layout.setContentsMargins(0,0,0,0); self.patterns_layout.setSpacing(3)
         ly.addLayout(self.patterns_layout); self.pattern_rows = []
-        sep2 = QFrame(); sep2.setFrameShape(QFrame.Shape.HLine); sep2.setStyleSheet("color:#2a2a3a;"); ly.addWidget(sep2)
+        sep2 = QFrame(); sep2.setFrameShape(QFrame.Shape.HLine); sep2.setObjectName("cardSep"); ly.addWidget(sep2)
         prog_hdr = QHBoxLayout(); prog_hdr.addWidget(self._lbl("Live Morse Input")); prog_hdr.addStretch()
         self.reset_btn = QPushButton("\u2715 Reset"); self.reset_btn.setFixedHeight(20)
-        self.reset_btn.setStyleSheet("font-size:10px;padding:1px 6px;border:1px solid #2a2a3a;color:#555570;border-radius:3px;background:transparent;")
+        self.reset_btn.setObjectName("morseResetBtn")
         prog_hdr.addWidget(self.reset_btn); ly.addLayout(prog_hdr)
         self.progress_widget = MorseProgressWidget(); ly.addWidget(self.progress_widget)
+        self.setUpdatesEnabled(True)
 
     def _lbl(self, t):
-        l = QLabel(t); l.setStyleSheet("font-size:11px;border:none;"); return l
+        l = QLabel(t); l.setObjectName("lbl11"); return l
     def _on_gesture_changed(self):
         new_gid = self.gcb.currentData() or ''
         old_gid = self._cur_gesture
@@ -1838,12 +2335,25 @@ class MorseChainCard(QFrame):
         gid = self.gesture_id(); return {gid} if gid else set()
     def add_pattern_row(self):
         row = MorsePatternRow(); row.removed.connect(self._remove_pattern_row)
-        self.pattern_rows.append(row); self.patterns_layout.addWidget(row)
+        row.pattern_changed.connect(self._invalidate_tick)
+        self.pattern_rows.append(row); self.patterns_layout.addWidget(row); self._tick = None
     def _remove_pattern_row(self, row):
         if row in self.pattern_rows:
-            self.pattern_rows.remove(row); self.patterns_layout.removeWidget(row); row.deleteLater()
-    def get_patterns(self):
-        return [(row.get_pattern(), row.get_action_state()) for row in self.pattern_rows if row.get_pattern()]
+            self.pattern_rows.remove(row); self.patterns_layout.removeWidget(row); row.deleteLater(); self._tick = None
+    def _invalidate_tick(self, *_): self._tick = None
+    def tick_params(self):
+        """(ends, prefixes, short_ms, long_ms, timeout_ms) for the frame loop, keyed by packed morse codes
+        (see _morse_syms): ends maps a full pattern to its row, prefixes holds every code some pattern extends."""
+        if self._tick is None:
+            ends = {}; prefixes = set()
+            for r in self.pattern_rows:
+                syms = r.get_pattern()
+                if not syms: continue
+                code = 1
+                for sym in syms: prefixes.add(code); code = code << 1 | (sym == 'L')
+                ends.setdefault(code, r)  # first row wins on duplicate patterns
+            self._tick = (ends, prefixes, self.sh_sl.value(), self.lh_sl.value(), self.timeout_sl.value())
+        return self._tick
     def get_state(self):
         return dict(type='morse', name=self.name_edit.text(), saved_name=self._saved_name,
             gesture=self.gesture_id(), short_ms=self.sh_sl.value(),
@@ -1853,12 +2363,14 @@ class MorseChainCard(QFrame):
         self.name_edit.setText(s.get('name', f'Morse Chain #{self.chain_id+1}'))
         self._saved_name = s.get('saved_name', '')
         gid = s.get('gesture', '')
-        for i in range(self.gcb.count()):
-            if self.gcb.itemData(i) == gid: self.gcb.setCurrentIndex(i); break
+        self.gcb.setCurrentIndex(GESTURE_CHOICE_INDEX.get(gid, 0))
         self.sh_sl.setValue(s.get('short_ms', 200)); self.lh_sl.setValue(s.get('long_ms', 600))
         self.timeout_sl.setValue(s.get('timeout', 1500))
-        for r in list(self.pattern_rows): self._remove_pattern_row(r)
-        for ps in s.get('patterns', []): self.add_pattern_row(); self.pattern_rows[-1].set_state(ps)
+        self.setUpdatesEnabled(False)
+        try:
+            for r in list(self.pattern_rows): self._remove_pattern_row(r)
+            for ps in s.get('patterns', []): self.add_pattern_row(); self.pattern_rows[-1].set_state(ps)
+        finally: self.setUpdatesEnabled(True)
     def set_progress(self, completed, in_progress_frac, active):
         self.progress_widget.set_state(completed, in_progress_frac, active)
     def flash_match(self): self.progress_widget.flash_match()
@@ -1873,20 +2385,26 @@ def _sens_mult(v):
         return 0.2 + 0.8 * ((v - 1) / 49.0)   # linear 0.2 to 1.0
     else:
         return 1.0 + 2.0 * ((v - 50) / 50.0)   # linear 1.0 to 3.0
+# Slider value -> multiplier, precomputed for every slider position (index 0 unused)
+_SENS_LUT = np.array([_sens_mult(v) for v in range(101)])
+_SENS_TXT = tuple(f"{m:.1f}x" for m in _SENS_LUT.tolist())
 
 class GestureCard(QFrame):
+    changed = pyqtSignal(object)  # self; any setting the trigger loop reads (not sensitivity / dead zone / macro)
+
     def __init__(self, g, action_types=None):
         super().__init__(); self.g=g; self.gid=g['id']; self.color=g['color']
         if action_types is None: action_types = ACTION_TYPES
-        self.setStyleSheet(f"background:#16161f;border:1px solid #2a2a3a;border-radius:10px;")
+        self._ac_index = ACTION_TYPE_INDEX if action_types is ACTION_TYPES else {v:i for i,(v,_) in enumerate(action_types)}
+        self.setObjectName("gestureCard")
         ly = QVBoxLayout(self); ly.setContentsMargins(12,12,12,12); ly.setSpacing(6)
 
         top = QHBoxLayout()
         ic = _gesture_icon_label(self.gid, self.color, 30)
         top.addWidget(ic)
         nb = QVBoxLayout(); nb.setSpacing(0)
-        n=QLabel(g['name']); n.setStyleSheet("font-weight:600;font-size:13px;border:none;")
-        s=QLabel(g['sub']); s.setStyleSheet("color:#555570;font-size:11px;border:none;")
+        n=QLabel(g['name']); n.setObjectName("cardName")
+        s=QLabel(g['sub']); s.setObjectName("cardSub")
         nb.addWidget(n); nb.addWidget(s); top.addLayout(nb); top.addStretch()
         self.en = QCheckBox(); self.en.setChecked(True); top.addWidget(self.en)
         ly.addLayout(top)
@@ -1894,14 +2412,13 @@ class GestureCard(QFrame):
         # Collapsible body container - everything below the header
         self._body = QWidget()
         self._body.setObjectName("gestureCardBody")
-        self._body.setStyleSheet("#gestureCardBody{background:transparent;border:none;}")
         bly = QVBoxLayout(self._body); bly.setContentsMargins(0,0,0,0); bly.setSpacing(6)
 
         # Sensitivity (now a multiplier)
         h=QHBoxLayout(); h.addWidget(self._lbl("Sensitivity")); h.addStretch()
-        self.sv=self._mono(f"{_sens_mult(g['ds']):.1f}x"); h.addWidget(self.sv); bly.addLayout(h)
+        self.sv=self._mono(_SENS_TXT[g['ds']]); h.addWidget(self.sv); bly.addLayout(h)
         self.ss=QSlider(Qt.Orientation.Horizontal); self.ss.setRange(1,100); self.ss.setValue(g['ds'])
-        self.ss.valueChanged.connect(lambda v: self.sv.setText(f"{_sens_mult(v):.1f}x")); bly.addWidget(self.ss)
+        self.ss.valueChanged.connect(lambda v: self.sv.setText(_SENS_TXT[v])); bly.addWidget(self.ss)
 
         # Threshold
         h2=QHBoxLayout(); h2.addWidget(self._lbl("Threshold")); h2.addStretch()
@@ -1909,7 +2426,7 @@ class GestureCard(QFrame):
         tr=QHBoxLayout()
         self.tmin=QSlider(Qt.Orientation.Horizontal); self.tmin.setRange(0,100); self.tmin.setValue(g['dtmin'])
         self.tmax=QSlider(Qt.Orientation.Horizontal); self.tmax.setRange(0,100); self.tmax.setValue(g['dtmax'])
-        tol=QLabel("to"); tol.setStyleSheet("font-size:11px;color:#555570;border:none;")
+        tol=QLabel("to"); tol.setObjectName("cardTo")
         tr.addWidget(self.tmin); tr.addWidget(tol); tr.addWidget(self.tmax); bly.addLayout(tr)
         self.tmin.valueChanged.connect(self._ut); self.tmax.valueChanged.connect(self._ut)
 
@@ -1924,7 +2441,7 @@ class GestureCard(QFrame):
         self.lb.setStyleSheet(f"QProgressBar::chunk{{background:{self.color};border-radius:2px;}}"); bly.addWidget(self.lb)
 
         # Action
-        sep=QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setStyleSheet("color:#2a2a3a;"); bly.addWidget(sep)
+        sep=QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setObjectName("cardSep"); bly.addWidget(sep)
         bly.addWidget(self._lbl("Trigger Action"))
         ar=QHBoxLayout()
         self.ac=QComboBox(); self.ac.setMaxVisibleItems(25)
@@ -1948,20 +2465,19 @@ class GestureCard(QFrame):
         # Gamepad axis picker + options (visible when action type is 'gamepad_axis')
         self.gp_axis_frame = QFrame()
         self.gp_axis_frame.setObjectName("gpAxisFrame")
-        self.gp_axis_frame.setStyleSheet("#gpAxisFrame{background:transparent;border:none;}")
         gp_ax_ly = QVBoxLayout(self.gp_axis_frame); gp_ax_ly.setContentsMargins(0,0,0,0); gp_ax_ly.setSpacing(4)
         ax_row = QHBoxLayout()
         self.gp_axis_cb = QComboBox(); self.gp_axis_cb.setMaxVisibleItems(25)
         for ax_id, ax_label, *_ in GAMEPAD_AXES: self.gp_axis_cb.addItem(ax_label, ax_id)
         ax_row.addWidget(self.gp_axis_cb)
-        self.gp_invert = QCheckBox("Invert"); self.gp_invert.setStyleSheet("font-size:10px;border:none;")
+        self.gp_invert = QCheckBox("Invert"); self.gp_invert.setObjectName("gpInvert")
         ax_row.addWidget(self.gp_invert); gp_ax_ly.addLayout(ax_row)
         dz_row = QHBoxLayout()
-        dz_lbl = QLabel("Dead Zone"); dz_lbl.setStyleSheet("font-size:10px;color:#555570;border:none;"); dz_row.addWidget(dz_lbl)
+        dz_lbl = QLabel("Dead Zone"); dz_lbl.setObjectName("rowHint"); dz_row.addWidget(dz_lbl)
         self.gp_deadzone = QSlider(Qt.Orientation.Horizontal); self.gp_deadzone.setRange(0,50); self.gp_deadzone.setValue(5)
-        self.gp_deadzone.setStyleSheet("QSlider::handle:horizontal{background:#00ff88;border:2px solid #16161f;}")
+        self.gp_deadzone.setObjectName("greenSl")
         dz_row.addWidget(self.gp_deadzone)
-        self.gp_dz_val = QLabel("5%"); self.gp_dz_val.setStyleSheet("font-family:Consolas;font-size:10px;color:#00ff88;min-width:28px;border:none;")
+        self.gp_dz_val = QLabel("5%"); self.gp_dz_val.setObjectName("dzVal")
         self.gp_deadzone.valueChanged.connect(lambda v: self.gp_dz_val.setText(f"{v}%")); dz_row.addWidget(self.gp_dz_val)
         gp_ax_ly.addLayout(dz_row)
         self.gp_axis_frame.hide(); bly.addWidget(self.gp_axis_frame)
@@ -1969,7 +2485,7 @@ class GestureCard(QFrame):
         # Toggle gestures recommendation note
         self._toggle_note = QLabel(_TOGGLE_GESTURES_NOTE)
         self._toggle_note.setWordWrap(True)
-        self._toggle_note.setStyleSheet("font-size:10px;color:#ffaa00;background:#ffaa0015;border:1px solid #ffaa0033;border-radius:4px;padding:4px 6px;")
+        self._toggle_note.setObjectName("actionWarn")
         self._toggle_note.hide(); bly.addWidget(self._toggle_note)
 
         # Trigger mode
@@ -1979,7 +2495,7 @@ class GestureCard(QFrame):
         for v,l in TRIGGER_MODES: self.tm.addItem(l,v)
         self.tm.setToolTip("Single Press: fire once per activation\nHold (Sustain): held while gesture active\nToggle: first activation starts, second stops\nAnalog: continuous axis output proportional to gesture intensity")
         mr.addWidget(self.tm)
-        self.tml=QLabel(""); self.tml.setStyleSheet("font-size:10px;color:#555570;border:none;"); mr.addWidget(self.tml)
+        self.tml=QLabel(""); self.tml.setObjectName("rowHint"); mr.addWidget(self.tml)
         self.tm.currentIndexChanged.connect(self._otm); bly.addLayout(mr)
 
         ly.addWidget(self._body)
@@ -1987,16 +2503,18 @@ class GestureCard(QFrame):
         # Connect checkbox to collapse/expand
         self.en.toggled.connect(self._toggle_body)
         self._toggle_body(self.en.isChecked())
-
-    def _lbl(self,t): l=QLabel(t); l.setStyleSheet("font-size:11px;border:none;"); return l
-    def _mono(self,t): l=QLabel(t); l.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;border:none;"); return l
+        emit = partial(_emit_self, self.changed, self)
+        for sig in (self.en.toggled, self.tmin.valueChanged, self.tmax.valueChanged, self.ac.currentIndexChanged,
+                    self.ke.textChanged, self.ce.textChanged, self.lpe.path_edit.textChanged, self.tm.currentIndexChanged,
+                    self.gp_btn_cb.currentIndexChanged, self.gp_axis_cb.currentIndexChanged, self.gp_invert.toggled,
+                    self.gp_deadzone.valueChanged): sig.connect(emit)
+
+    def _lbl(self,t): l=QLabel(t); l.setObjectName("lbl11"); return l
+    def _mono(self,t): l=QLabel(t); l.setObjectName("monoVal"); return l
     def _ut(self): self.tv.setText(f"{self.tmin.value()}\u2013{self.tmax.value()}")
     def _toggle_body(self, checked):
         self._body.setVisible(checked)
-        if checked:
-            self.setStyleSheet(f"background:#16161f;border:1px solid #2a2a3a;border-radius:10px;")
-        else:
-            self.setStyleSheet(f"background:#16161f;border:1px solid #1a1a24;border-radius:10px;")
+        self.setStyleSheet('' if checked else _CARD_OFF_QSS)
     def _oa(self):
         a=self.ac.currentData()
         self.ke.setVisible(a=='key')
@@ -2008,8 +2526,7 @@ class GestureCard(QFrame):
         self._toggle_note.setVisible(a=='toggle_gestures')
         # Auto-select analog trigger mode when gamepad_axis is chosen
         if a=='gamepad_axis':
-            for i in range(self.tm.count()):
-                if self.tm.itemData(i)=='analog': self.tm.setCurrentIndex(i); break
+            self.tm.setCurrentIndex(TRIGGER_MODE_INDEX['analog'])
     def _otm(self):
         m=self.tm.currentData()
         hints = {'single':'','hold':'Action sustained while gesture held','toggle':'Tap gesture to start/stop',
@@ -2032,21 +2549,17 @@ class GestureCard(QFrame):
         self.tmin.setValue(s.get('thresholdMin',20)); self.tmax.setValue(s.get('thresholdMax',80))
         self.dzs.setValue(s.get('deadZone',3))
         a=s.get('action','none')
-        for i in range(self.ac.count()):
-            if self.ac.itemData(i)==a: self.ac.setCurrentIndex(i); break
+        self.ac.setCurrentIndex(self._ac_index.get(a, 0))
         self.ke.setText(s.get('keyBind','')); self.ce.setText(s.get('command',''))
         self.lpe.setText(s.get('launchProgram',''))
         self.me.set_from_string(s.get('macro',''))
         tm=s.get('triggerMode','single')
-        for i in range(self.tm.count()):
-            if self.tm.itemData(i)==tm: self.tm.setCurrentIndex(i); break
+        self.tm.setCurrentIndex(TRIGGER_MODE_INDEX.get(tm, 0))
         # Gamepad state
         gb = s.get('gamepadBtn','')
-        for i in range(self.gp_btn_cb.count()):
-            if self.gp_btn_cb.itemData(i)==gb: self.gp_btn_cb.setCurrentIndex(i); break
+        self.gp_btn_cb.setCurrentIndex(GAMEPAD_BUTTON_INDEX.get(gb, 0))
         ga = s.get('gamepadAxis','')
-        for i in range(self.gp_axis_cb.count()):
-            if self.gp_axis_cb.itemData(i)==ga: self.gp_axis_cb.setCurrentIndex(i); break
+        self.gp_axis_cb.setCurrentIndex(GAMEPAD_AXIS_INDEX.get(ga, 0))
         self.gp_invert.setChecked(s.get('gamepadInvert',False))
         self.gp_deadzone.setValue(s.get('gamepadDeadzone',5))
     def reset_def(self):
@@ -2060,11 +2573,16 @@ class GestureCard(QFrame):
 
 # ••• POINT TRACKER PANEL •••
 
+PT_AXIS_MODES = [('single','1 Output'),('split','2 Outputs')]
+PT_MOUSE_MODES = [('relative','Relative (Joystick)'),('absolute','Absolute (Position)')]
+PT_AXIS_MODE_INDEX = {v:i for i,(v,_) in enumerate(PT_AXIS_MODES)}
+PT_MOUSE_MODE_INDEX = {v:i for i,(v,_) in enumerate(PT_MOUSE_MODES)}
+
 class PTDirectionConfig(QFrame):
     """Config for one direction (+/-) of a point tracker axis. Mirrors GestureCard action setup."""
     def __init__(self, label, color, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"background:#12121a;border:1px solid #2a2a3a;border-radius:5px;")
+        self.setObjectName("ptDirConfig")
         ly = QVBoxLayout(self); ly.setContentsMargins(6,4,6,4); ly.setSpacing(3)
 
         hdr = QHBoxLayout(); hdr.setSpacing(4)
@@ -2075,7 +2593,7 @@ class PTDirectionConfig(QFrame):
 
         # Threshold
         th_row = QHBoxLayout(); th_row.setSpacing(4)
-        thl = QLabel("Thresh"); thl.setStyleSheet("font-size:9px;color:#8888a0;border:none;"); th_row.addWidget(thl)
+        thl = QLabel("Thresh"); thl.setStyleSheet(_ROW_TINY_LBL_QSS); th_row.addWidget(thl)
         self.tmin = QSlider(Qt.Orientation.Horizontal); self.tmin.setRange(0,100); self.tmin.setValue(20)
         self.tmin.setStyleSheet(f"QSlider::handle:horizontal{{background:{color};border:1px solid #16161f;width:10px;height:10px;}}")
         th_row.addWidget(self.tmin, stretch=1)
@@ -2086,7 +2604,7 @@ class PTDirectionConfig(QFrame):
 
         # Action type
         self.ac = QComboBox(); self.ac.setFixedHeight(22); self.ac.setMaxVisibleItems(25)
-        self.ac.setStyleSheet("font-size:10px;")
+        self.ac.setStyleSheet(_ROW_CB_QSS)
         for v, l in ACTION_TYPES: self.ac.addItem(l, v)
         self.ac.currentIndexChanged.connect(self._oa); ly.addWidget(self.ac)
 
@@ -2096,25 +2614,25 @@ class PTDirectionConfig(QFrame):
         self.me = MacroEditor(); self.me.hide(); ly.addWidget(self.me)
 
         self.gp_btn_cb = QComboBox(); self.gp_btn_cb.setFixedHeight(22); self.gp_btn_cb.setMaxVisibleItems(25)
-        self.gp_btn_cb.setStyleSheet("font-size:10px;")
+        self.gp_btn_cb.setStyleSheet(_ROW_CB_QSS)
         for btn_id, btn_label in GAMEPAD_BUTTONS: self.gp_btn_cb.addItem(btn_label, btn_id)
         self.gp_btn_cb.hide(); ly.addWidget(self.gp_btn_cb)
 
         # Gamepad axis picker + options
         self.gp_axis_frame = QFrame()
-        self.gp_axis_frame.setStyleSheet("border:none;")
+        self.gp_axis_frame.setStyleSheet(_NO_BORDER_QSS)
         gp_ax_ly = QVBoxLayout(self.gp_axis_frame); gp_ax_ly.setContentsMargins(0,0,0,0); gp_ax_ly.setSpacing(2)
         self.gp_axis_cb = QComboBox(); self.gp_axis_cb.setFixedHeight(22); self.gp_axis_cb.setMaxVisibleItems(25)
-        self.gp_axis_cb.setStyleSheet("font-size:10px;")
+        self.gp_axis_cb.setStyleSheet(_ROW_CB_QSS)
         for ax_id, ax_label, *_ in GAMEPAD_AXES: self.gp_axis_cb.addItem(ax_label, ax_id)
         gp_ax_ly.addWidget(self.gp_axis_cb)
         self.gp_axis_frame.hide(); ly.addWidget(self.gp_axis_frame)
 
         # Trigger mode
         tm_row = QHBoxLayout(); tm_row.setSpacing(4)
-        tml = QLabel("Mode"); tml.setStyleSheet("font-size:9px;color:#8888a0;border:none;"); tm_row.addWidget(tml)
+        tml = QLabel("Mode"); tml.setStyleSheet(_ROW_TINY_LBL_QSS); tm_row.addWidget(tml)
         self.tm = QComboBox(); self.tm.setFixedHeight(22); self.tm.setMaxVisibleItems(25)
-        self.tm.setStyleSheet("font-size:10px;")
+        self.tm.setStyleSheet(_ROW_CB_QSS)
         for v, l in TRIGGER_MODES: self.tm.addItem(l, v)
         tm_row.addWidget(self.tm, stretch=1); ly.addLayout(tm_row)
 
@@ -2133,8 +2651,7 @@ class PTDirectionConfig(QFrame):
         self.gp_btn_cb.setVisible(a == 'gamepad_button')
         self.gp_axis_frame.setVisible(a == 'gamepad_axis')
         if a == 'gamepad_axis':
-            for i in range(self.tm.count()):
-                if self.tm.itemData(i) == 'analog': self.tm.setCurrentIndex(i); break
+            self.tm.setCurrentIndex(TRIGGER_MODE_INDEX['analog'])
 
     def get_state(self):
         return dict(enabled=self.en.isChecked(), threshold=self.tmin.value(),
@@ -2148,20 +2665,16 @@ class PTDirectionConfig(QFrame):
         self.en.setChecked(s.get('enabled', True))
         self.tmin.setValue(s.get('threshold', 20))
         a = s.get('action', 'none')
-        for i in range(self.ac.count()):
-            if self.ac.itemData(i) == a: self.ac.setCurrentIndex(i); break
+        self.ac.setCurrentIndex(ACTION_TYPE_INDEX.get(a, 0))
         self.ke.setText(s.get('keyBind', '')); self.ce.setText(s.get('command', ''))
         self.lpe.setText(s.get('launchProgram', ''))
         self.me.set_from_string(s.get('macro', ''))
         tm = s.get('triggerMode', 'single')
-        for i in range(self.tm.count()):
-            if self.tm.itemData(i) == tm: self.tm.setCurrentIndex(i); break
+        self.tm.setCurrentIndex(TRIGGER_MODE_INDEX.get(tm, 0))
         gb = s.get('gamepadBtn', '')
-        for i in range(self.gp_btn_cb.count()):
-            if self.gp_btn_cb.itemData(i) == gb: self.gp_btn_cb.setCurrentIndex(i); break
+        self.gp_btn_cb.setCurrentIndex(GAMEPAD_BUTTON_INDEX.get(gb, 0))
         ga = s.get('gamepadAxis', '')
-        for i in range(self.gp_axis_cb.count()):
-            if self.gp_axis_cb.itemData(i) == ga: self.gp_axis_cb.setCurrentIndex(i); break
+        self.gp_axis_cb.setCurrentIndex(GAMEPAD_AXIS_INDEX.get(ga, 0))
 
     def set_live(self, val):
         self.live_bar.setValue(max(0, min(100, int(val))))
@@ -2173,7 +2686,7 @@ class PointTrackerAxisConfig(QFrame):
     def __init__(self, axis_label, color, parent=None):
         super().__init__(parent)
         self._color = color; self._axis_label = axis_label
-        self.setStyleSheet("background:#1a1a26;border:1px solid #2a2a3a;border-radius:6px;")
+        self.setObjectName("ptAxisConfig")
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         ly = QVBoxLayout(self); ly.setContentsMargins(8,6,8,6); ly.setSpacing(4)
 
@@ -2188,7 +2701,7 @@ class PointTrackerAxisConfig(QFrame):
 
         # Range slider (per-axis)
         rng_row = QHBoxLayout(); rng_row.setSpacing(4)
-        rnl = QLabel("Range"); rnl.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); rng_row.addWidget(rnl)
+        rnl = QLabel("Range"); rnl.setStyleSheet(_ROW_LBL_QSS); rng_row.addWidget(rnl)
         self.rng_sl = QSlider(Qt.Orientation.Horizontal); self.rng_sl.setRange(10,200); self.rng_sl.setValue(60)
         self.rng_sl.setStyleSheet(f"QSlider::handle:horizontal{{background:{color};border:2px solid #16161f;}}")
         rng_row.addWidget(self.rng_sl, stretch=1)
@@ -2199,7 +2712,7 @@ class PointTrackerAxisConfig(QFrame):
 
         # Dead Zone slider (per-axis)
         dz_row = QHBoxLayout(); dz_row.setSpacing(4)
-        dzl = QLabel("D.Zone"); dzl.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); dz_row.addWidget(dzl)
+        dzl = QLabel("D.Zone"); dzl.setStyleSheet(_ROW_LBL_QSS); dz_row.addWidget(dzl)
         self.dz_sl = QSlider(Qt.Orientation.Horizontal); self.dz_sl.setRange(0,30); self.dz_sl.setValue(5)
         self.dz_sl.setStyleSheet(f"QSlider::handle:horizontal{{background:{color};border:2px solid #16161f;}}")
         dz_row.addWidget(self.dz_sl, stretch=1)
@@ -2210,11 +2723,11 @@ class PointTrackerAxisConfig(QFrame):
 
         # Invert + Output mode selector on same row
         opt_row = QHBoxLayout(); opt_row.setSpacing(6)
-        self.invert = QCheckBox("Invert"); self.invert.setStyleSheet("font-size:10px;color:#8888a0;border:none;")
+        self.invert = QCheckBox("Invert"); self.invert.setStyleSheet(_ROW_LBL_QSS)
         opt_row.addWidget(self.invert); opt_row.addStretch()
         self.mode_cb = QComboBox(); self.mode_cb.setFixedHeight(20); self.mode_cb.setFixedWidth(90)
         self.mode_cb.setStyleSheet("font-size:9px;padding:1px 4px;")
-        self.mode_cb.addItem("1 Output", "single"); self.mode_cb.addItem("2 Outputs", "split")
+        for v, l in PT_AXIS_MODES: self.mode_cb.addItem(l, v)
         self.mode_cb.currentIndexChanged.connect(self._on_mode_changed)
         opt_row.addWidget(self.mode_cb)
         ly.addLayout(opt_row)
@@ -2228,13 +2741,13 @@ class PointTrackerAxisConfig(QFrame):
 
         # === Single output config (1 Output mode) ===
         self._single_frame = QFrame()
-        self._single_frame.setStyleSheet("border:none;")
+        self._single_frame.setStyleSheet(_NO_BORDER_QSS)
         sly = QVBoxLayout(self._single_frame); sly.setContentsMargins(0,0,0,0); sly.setSpacing(3)
         # Action type
         sar = QHBoxLayout(); sar.setSpacing(4)
-        sal = QLabel("Action"); sal.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); sar.addWidget(sal)
+        sal = QLabel("Action"); sal.setStyleSheet(_ROW_LBL_QSS); sar.addWidget(sal)
         self.s_ac = QComboBox(); self.s_ac.setFixedHeight(22); self.s_ac.setMaxVisibleItems(25)
-        self.s_ac.setStyleSheet("font-size:10px;")
+        self.s_ac.setStyleSheet(_ROW_CB_QSS)
         for v, l in ACTION_TYPES: self.s_ac.addItem(l, v)
         self.s_ac.currentIndexChanged.connect(self._s_oa); sar.addWidget(self.s_ac, stretch=1)
         sly.addLayout(sar)
@@ -2243,11 +2756,11 @@ class PointTrackerAxisConfig(QFrame):
         self.s_lpe = LaunchProgramEdit(); self.s_lpe.hide(); sly.addWidget(self.s_lpe)
         self.s_me = MacroEditor(); self.s_me.hide(); sly.addWidget(self.s_me)
         self.s_gp_btn_cb = QComboBox(); self.s_gp_btn_cb.setFixedHeight(22); self.s_gp_btn_cb.setMaxVisibleItems(25)
-        self.s_gp_btn_cb.setStyleSheet("font-size:10px;")
+        self.s_gp_btn_cb.setStyleSheet(_ROW_CB_QSS)
         for btn_id, btn_label in GAMEPAD_BUTTONS: self.s_gp_btn_cb.addItem(btn_label, btn_id)
         self.s_gp_btn_cb.hide(); sly.addWidget(self.s_gp_btn_cb)
         self.s_gp_axis_cb = QComboBox(); self.s_gp_axis_cb.setFixedHeight(22); self.s_gp_axis_cb.setMaxVisibleItems(25)
-        self.s_gp_axis_cb.setStyleSheet("font-size:10px;")
+        self.s_gp_axis_cb.setStyleSheet(_ROW_CB_QSS)
         for ax_id, ax_label, *_ in GAMEPAD_AXES: self.s_gp_axis_cb.addItem(ax_label, ax_id)
         self.s_gp_axis_cb.hide(); sly.addWidget(self.s_gp_axis_cb)
         # Live bar for single mode
@@ -2259,7 +2772,7 @@ class PointTrackerAxisConfig(QFrame):
 
         # === Split output config (2 Outputs mode) ===
         self._split_frame = QFrame()
-        self._split_frame.setStyleSheet("border:none;")
+        self._split_frame.setStyleSheet(_NO_BORDER_QSS)
         dly = QVBoxLayout(self._split_frame); dly.setContentsMargins(0,0,0,0); dly.setSpacing(4)
         pos_sub = "Right" if axis_label == 'X' else "Down"
         neg_sub = "Left" if axis_label == 'X' else "Up"
@@ -2295,16 +2808,13 @@ class PointTrackerAxisConfig(QFrame):
 
     def set_single_state(self, s):
         a = s.get('action', 'gamepad_axis')
-        for i in range(self.s_ac.count()):
-            if self.s_ac.itemData(i) == a: self.s_ac.setCurrentIndex(i); break
+        self.s_ac.setCurrentIndex(ACTION_TYPE_INDEX.get(a, 0))
         self.s_ke.setText(s.get('keyBind', '')); self.s_ce.setText(s.get('command', ''))
         self.s_lpe.setText(s.get('launchProgram', '')); self.s_me.set_from_string(s.get('macro', ''))
         gb = s.get('gamepadBtn', '')
-        for i in range(self.s_gp_btn_cb.count()):
-            if self.s_gp_btn_cb.itemData(i) == gb: self.s_gp_btn_cb.setCurrentIndex(i); break
+        self.s_gp_btn_cb.setCurrentIndex(GAMEPAD_BUTTON_INDEX.get(gb, 0))
         ga = s.get('gamepadAxis', '')
-        for i in range(self.s_gp_axis_cb.count()):
-            if self.s_gp_axis_cb.itemData(i) == ga: self.s_gp_axis_cb.setCurrentIndex(i); break
+        self.s_gp_axis_cb.setCurrentIndex(GAMEPAD_AXIS_INDEX.get(ga, 0))
 
     def get_state(self):
         return dict(enabled=self.en.isChecked(), range_px=self.rng_sl.value(),
@@ -2319,8 +2829,8 @@ class PointTrackerAxisConfig(QFrame):
         self.dz_sl.setValue(s.get('dead_zone', 5))
         self.invert.setChecked(s.get('invert', False))
         mode = s.get('mode', 'single')
-        for i in range(self.mode_cb.count()):
-            if self.mode_cb.itemData(i) == mode: self.mode_cb.setCurrentIndex(i); break
+        if mode not in PT_AXIS_MODE_INDEX: print(f"[PT] Unknown axis mode {mode!r}, using single")
+        self.mode_cb.setCurrentIndex(PT_AXIS_MODE_INDEX.get(mode, 0))
         if 'single' in s: self.set_single_state(s['single'])
         if 'pos' in s: self.pos.set_state(s['pos'])
         if 'neg' in s: self.neg.set_state(s['neg'])
@@ -2339,7 +2849,7 @@ class PointTrackerPanel(QFrame):
     """UI panel for the point tracker feature."""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background:#16161f;border:1px solid #00ccaa55;border-radius:10px;")
+        self.setObjectName("ptPanel")
         ly = QVBoxLayout(self); ly.setContentsMargins(12,12,12,12); ly.setSpacing(6)
 
         # Header
@@ -2350,7 +2860,7 @@ class PointTrackerPanel(QFrame):
         nb = QVBoxLayout(); nb.setSpacing(0)
         title = QLabel("Point Tracker"); title.setStyleSheet("font-weight:600;font-size:13px;color:#00ccaa;border:none;")
         sub = QLabel("Click camera feed to track a point \u2022 Raw X/Y output")
-        sub.setStyleSheet("color:#555570;font-size:11px;border:none;")
+        sub.setObjectName("cardSub")
         nb.addWidget(title); nb.addWidget(sub); top.addLayout(nb); top.addStretch()
         self.en = QCheckBox(); self.en.setChecked(False)
         self.en.setToolTip("Enable/disable point tracker"); top.addWidget(self.en)
@@ -2403,21 +2913,20 @@ class PointTrackerPanel(QFrame):
 
         # Mouse options (visible when mouse_en is checked)
         self._mouse_body = QFrame()
-        self._mouse_body.setStyleSheet("background:transparent;border:none;")
+        self._mouse_body.setStyleSheet(_TRANSPARENT_QSS)
         mly = QVBoxLayout(self._mouse_body); mly.setContentsMargins(0,0,0,0); mly.setSpacing(4)
 
         # Mode: Relative vs Absolute
         mmode_row = QHBoxLayout(); mmode_row.setSpacing(6)
-        mml = QLabel("Mode"); mml.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); mmode_row.addWidget(mml)
+        mml = QLabel("Mode"); mml.setStyleSheet(_ROW_LBL_QSS); mmode_row.addWidget(mml)
         self.mouse_mode = QComboBox(); self.mouse_mode.setFixedHeight(22)
-        self.mouse_mode.setStyleSheet("font-size:10px;")
-        self.mouse_mode.addItem("Relative (Joystick)", "relative")
-        self.mouse_mode.addItem("Absolute (Position)", "absolute")
+        self.mouse_mode.setStyleSheet(_ROW_CB_QSS)
+        for v, l in PT_MOUSE_MODES: self.mouse_mode.addItem(l, v)
         mmode_row.addWidget(self.mouse_mode, stretch=1); mly.addLayout(mmode_row)
 
         # Speed slider (for relative mode: pixels per frame at full deflection)
         spd_row = QHBoxLayout(); spd_row.setSpacing(4)
-        spdl = QLabel("Speed"); spdl.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); spd_row.addWidget(spdl)
+        spdl = QLabel("Speed"); spdl.setStyleSheet(_ROW_LBL_QSS); spd_row.addWidget(spdl)
         self.mouse_speed = QSlider(Qt.Orientation.Horizontal); self.mouse_speed.setRange(1,50); self.mouse_speed.setValue(15)
         self.mouse_speed.setStyleSheet("QSlider::handle:horizontal{background:#ff66aa;border:2px solid #16161f;}")
         spd_row.addWidget(self.mouse_speed, stretch=1)
@@ -2428,7 +2937,7 @@ class PointTrackerPanel(QFrame):
 
         # Smoothing slider (for relative: higher = more smoothing on cursor movement)
         msm_row = QHBoxLayout(); msm_row.setSpacing(4)
-        msml = QLabel("Smooth"); msml.setStyleSheet("font-size:10px;color:#8888a0;border:none;"); msm_row.addWidget(msml)
+        msml = QLabel("Smooth"); msml.setStyleSheet(_ROW_LBL_QSS); msm_row.addWidget(msml)
         self.mouse_smooth = QSlider(Qt.Orientation.Horizontal); self.mouse_smooth.setRange(0,20); self.mouse_smooth.setValue(5)
         self.mouse_smooth.setStyleSheet("QSlider::handle:horizontal{background:#ff66aa;border:2px solid #16161f;}")
         msm_row.addWidget(self.mouse_smooth, stretch=1)
@@ -2459,10 +2968,7 @@ class PointTrackerPanel(QFrame):
 
     def _toggle_body(self, checked):
         self._body.setVisible(checked)
-        if checked:
-            self.setStyleSheet("background:#16161f;border:1px solid #00ccaa55;border-radius:10px;")
-        else:
-            self.setStyleSheet("background:#16161f;border:1px solid #1a1a24;border-radius:10px;")
+        self.setStyleSheet('' if checked else _CARD_OFF_QSS)
 
     def get_state(self):
         return dict(enabled=self.en.isChecked(), roi_size=self.roi_sl.value(),
@@ -2477,8 +2983,8 @@ class PointTrackerPanel(QFrame):
         self.roi_sl.setValue(s.get('roi_size', 31))
         self.mouse_en.setChecked(s.get('mouse_enabled', False))
         mm = s.get('mouse_mode', 'relative')
-        for i in range(self.mouse_mode.count()):
-            if self.mouse_mode.itemData(i) == mm: self.mouse_mode.setCurrentIndex(i); break
+        if mm not in PT_MOUSE_MODE_INDEX: print(f"[PT] Unknown mouse mode {mm!r}, using relative")
+        self.mouse_mode.setCurrentIndex(PT_MOUSE_MODE_INDEX.get(mm, 0))
         self.mouse_speed.setValue(s.get('mouse_speed', 15))
         self.mouse_smooth.setValue(s.get('mouse_smooth', 5))
         if 'x_axis' in s: self.x_axis.set_state(s['x_axis'])
@@ -2487,19 +2993,57 @@ class PointTrackerPanel(QFrame):
 
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â MAIN WINDOW ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
+ACTION_LOG_MAX = 50  # rows kept in the action log list
+
+def _load_json(path):
+    if _orjson_available:
+        with open(path, 'rb') as f: return orjson.loads(f.read())
+    with open(path, encoding='utf-8') as f: return json.load(f)
+
+def _write_json(path, cfg, tag):
+    """Write a profile as indented UTF-8 JSON; runs on the I/O worker, so errors are reported here.
+    Goes through a .part file and os.replace so an interrupted write never leaves a truncated profile."""
+    tmp = path + '.part'
+    try:
+        if _orjson_available:
+            data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+            with open(tmp, 'wb') as f: f.write(data)
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(cfg, f, indent=2)
+        os.replace(tmp, path)
+    except Exception as e: print(f"{tag} error: {e}")
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FaceCommand"); self.setMinimumSize(1000,650); self.resize(1200,750)
         self.det = GestureDetector(); self.cam = None
-        self.sm = {g['id']:0.0 for g in GESTURES}; self.lv = dict(self.sm)
-        self.ta = {g['id']:False for g in GESTURES}; self.lt = {g['id']:0.0 for g in GESTURES}
-        self.hs = {g['id']:0.0 for g in GESTURES}
-        # Phase 1: hold/toggle state tracking
-        self.hold_active = {g['id']:False for g in GESTURES}   # currently holding key/mouse down
-        self.toggle_state = {g['id']:False for g in GESTURES}  # toggle is currently on
-        self.repeat_lt = {g['id']:0.0 for g in GESTURES}       # last repeat fire time
-        self.dc = 0; self.alog = deque(maxlen=50)
+        self._sens_arr = np.ones(len(GESTURE_ORDER))  # per-gesture sensitivity multipliers (GESTURE_INDEX order)
+        self._dz_arr = np.full(len(GESTURE_ORDER), 3.0, np.float32)  # per-gesture dead zones (GESTURE_INDEX order)
+        self._sm_vec = np.zeros(len(GESTURE_ORDER), np.float32)  # EMA-smoothed gesture values (GESTURE_INDEX order)
+        start_model_download()  # first run: fetch the face model while the UI comes up
+        # Trigger state machine, SoA in GESTURE_INDEX order (stepped by _trigger_step_njit)
+        n = len(GESTURE_ORDER)
+        # Chain activation tracker, same layout: hold start (ms) and activated flag per gesture
+        self._chain_hs = np.zeros(n); self._chain_ta = np.zeros(n, bool)
+        self._above_prev = np.zeros(n, bool)  # last frame's above-threshold mask
+        self._morse_mask = None                # gestures used by morse chains; None = rebuild
+        self._th_arr = np.zeros(n); self._mode_arr = np.zeros(n, np.int32)  # mirrors of card threshold / trigger mode
+        self._trig_on = np.zeros(n, np.bool_); self._analog_ix = []  # slots the kernel steps / enabled analog axis slots
+        self._enabled = np.zeros(n, np.bool_)  # card enable checkboxes, updated from card.changed
+        self._hs = np.zeros(n); self._ta = np.zeros(n, np.bool_); self._lt = np.zeros(n)  # hold start ms, latched, last fire ms
+        self._hold_on = np.zeros(n, np.bool_)  # currently holding key/mouse down
+        self._toggle_on = np.zeros(n, np.bool_); self._repeat_lt = np.zeros(n)  # toggle is on / last repeat fire ms
+        self._trig_ev = np.zeros(n, np.int32)  # EV_* per slot for this frame
+        # Per-slot card settings (enabled, thMin, thMax, mode, action, key, cmd, gpBtn, gpAxis, gpInvert, gpDz, opcode); see _cache_card
+        self._g_cached = [None]*n; self._g_names = [g['name'] for g in GESTURES]
+        self.dc = self._dc_shown = 0; self._log_empty = True  # action log still shows its placeholder row
+        self._log_pending = []  # lines logged since the last flush, oldest first
+        self._pending_actions = []  # execute_action args queued this frame, submitted as one batch
+        # Persistent workers for fired actions; hold start/stop go through one worker so key state stays ordered
+        self._action_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fcaction')
+        self._hold_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fchold')
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fcio')  # profile writes, in order
         self.cards={}; self.rbars={}; self.rvals={}
         # Toggle gestures state
         self._gestures_disabled = False        # True when gestures are toggled off
@@ -2509,15 +3053,27 @@ class MainWindow(QMainWindow):
         self.chains = []          # list of GestureChainCard widgets
         self.morse_chains = []    # list of MorseChainCard widgets
         self.chain_counter = 0    # for unique chain IDs
-        self.chain_state = {}     # chain_id -> {step:int, last_time:float, prev_active:set}
+        self.chain_state = {}     # chain_id -> {step:int, last_time:float}, one per indexed chain
+        self._chain_waiters = None  # gesture slot -> [(chain, step_idx)]; None = rebuild on next tick
+        self._chain_active = {}     # chain_id -> chain, chains part-way through their sequence
+        self._gid_to_chains = {}    # gesture_id -> set of chain / morse cards using it
+        # Morse input per chain_id, filled by _init_morse_state when a morse chain is added
+        self._mc_code = {}; self._mc_hs = {}; self._mc_last = {}; self._mc_active = {}
+        self._chain_gids = {}       # chain / morse card -> frozenset of its gesture ids
         self.saved_chains_lib = {}       # name -> state dict (gesture chains)
         self.saved_morse_chains_lib = {} # name -> state dict (morse chains)
         self._auto_profile = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.facecommand_last_profile.json')
         # Point tracker
         self.pt = PointTracker()
-        self._pt_last_frame = None  # store raw (un-flipped) frame for point tracker
+        self._pt_last_frame = None  # store raw RGB frame (no overlays) for point tracker
         self._pt_pick_mode = False  # True when waiting for user to click on feed
         self._pt_crop = (0.0, 0.0, 1.0, 1.0, 1, 1)  # crop params for click mapping
+        self._zbuf = None; self._drawbuf = None  # reused preview buffers (zoomed crop / 1x overlay copy)
+        self._view = None  # cached zoom/pan crop (see _calc_view); None = rebuild the preview renderer
+        self._regime = None; self._render = None  # (has landmarks, w, h) the current renderer was built for
+        self._hud_last = 0.0; self._fps_last = 0.0  # HUD throttle timestamps (monotonic s)
+        self._last_iv = [-1]*len(GESTURE_ORDER)  # value last shown per GESTURE_INDEX slot
+        self._hud_triples = ()  # (slot, result bar, value label, card), bound once all cards exist
         # Per-direction state: keyed by 'x_pos','x_neg','y_pos','y_neg'
         self._pt_dirs = ['x_pos','x_neg','y_pos','y_neg']
         self._pt_hs = {d:0.0 for d in self._pt_dirs}      # hold start time
@@ -2529,10 +3085,33 @@ class MainWindow(QMainWindow):
         self._pt_mouse_sx = 0.0  # smoothed mouse dx
         self._pt_mouse_sy = 0.0  # smoothed mouse dy
         self._build()
-        self._auto_load()
+        # Gesture cards are built one per event-loop tick after the first paint; the profile
+        # load and auto-start run once the last card exists (see _build_next_card)
+        QTimer.singleShot(0, self._build_next_card)
+
+    def _build_next_card(self):
+        """Build one queued GestureCard, then reschedule; finish startup when the queue is empty."""
+        if self._card_queue:
+            row, col, g = self._card_queue.pop(0); gid = g['id']
+            at = ACTION_TYPES_RIGHT_EYEBROW if gid == 'eyebrow_raise_right' else ACTION_TYPES
+            card = GestureCard(g, action_types=at); self.cards[gid] = card
+            self._card_grid.addWidget(card, row, col)
+            # Sensitivity multipliers live in an array the detector reads directly; refresh on edit
+            self._set_sens(gid, card.ss.value())
+            card.ss.valueChanged.connect(lambda v, g=gid: self._set_sens(g, v))
+            self._set_dz(gid, card.dzs.value())
+            card.dzs.valueChanged.connect(lambda v, g=gid: self._set_dz(g, v))
+            # Cached trigger settings + kernel mirrors, refreshed whenever the card is edited
+            self._cache_card(card); card.changed.connect(self._cache_card)
+            # Connect card enable toggle to live readings filter
+            card.en.toggled.connect(self._update_lr_filter); card.en.toggled.connect(self._update_active_lbl)
+            QTimer.singleShot(0, self._build_next_card); return
+        for w in self._startup_locked: w.setEnabled(True)
+        self._startup_locked = ()
+        self._hud_triples = tuple((i, self.rbars[gid], self.rvals[gid], self.cards[gid]) for i, gid in enumerate(GESTURE_ORDER))
+        self._auto_load(); self._update_active_lbl()
         # Auto-start camera after load if enabled (use a short timer to let UI settle)
         if self.auto_start_cb.isChecked():
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(500, self._start)
 
     def _build(self):
@@ -2547,7 +3126,7 @@ class MainWindow(QMainWindow):
         t=QLabel("FaceCommand"); t.setStyleSheet("font-family:Consolas;font-weight:600;font-size:14px;")
         hl.addWidget(t)
         v=QLabel("v1.4 native"); v.setStyleSheet("color:#555570;font-size:11px;"); hl.addWidget(v); hl.addStretch()
-        self.stl=QLabel(); self._ss("Camera Off","#ff4466"); hl.addWidget(self.stl)
+        self.stl=QLabel(); self.stl.setStyleSheet(_STATUS_QSS); self._ss("Camera Off","#ff4466"); hl.addWidget(self.stl)
         # Gamepad status
         self.gp_stl=QLabel(); self._update_gp_status(); hl.addWidget(self.gp_stl)
         # Camera selector
@@ -2565,9 +3144,10 @@ class MainWindow(QMainWindow):
         self.rcb=QPushButton("\u27F3 Recalibrate"); self.rcb.setMinimumWidth(100); self.rcb.clicked.connect(self._recal); self.rcb.hide(); hl.addWidget(self.rcb)
         self.auto_start_cb=QCheckBox("Auto Start"); self.auto_start_cb.setChecked(False)
         self.auto_start_cb.setToolTip("Automatically start camera on launch")
-        self.auto_start_cb.setStyleSheet("font-size:10px;color:#8888a0;border:none;")
+        self.auto_start_cb.setStyleSheet(_ROW_LBL_QSS)
         hl.addWidget(self.auto_start_cb)
         self.cb=QPushButton("\u25B6 Start Camera"); self.cb.setMinimumWidth(140); self.cb.clicked.connect(self._tc); hl.addWidget(self.cb)
+        self.cb.setStyleSheet(_CAM_BTN_QSS)
         self._set_btn_primary()
         root.addWidget(hdr)
 
@@ -2637,6 +3217,8 @@ class MainWindow(QMainWindow):
         self.zprb.setStyleSheet("font-size:10px;padding:2px 10px;border:1px solid #2a2a3a;color:#555570;border-radius:4px;")
         def _reset_view(): self.zs.setValue(100); self.pxs.setValue(0); self.pys.setValue(0)
         self.zprb.clicked.connect(_reset_view); zpr.addWidget(self.zprb); zpl.addLayout(zpr)
+        # Any view slider change invalidates the cached crop used by _of
+        for sl in (self.zs, self.pxs, self.pys): sl.valueChanged.connect(lambda _v: setattr(self, '_view', None))
         ll.addWidget(zpf)
 
         # Camera Settings panel (collapsible)
@@ -2650,7 +3232,7 @@ class MainWindow(QMainWindow):
         self._cs_toggle.clicked.connect(self._toggle_cam_settings); cs_hdr.addWidget(self._cs_toggle); cs_hdr.addStretch()
         csl.addLayout(cs_hdr)
 
-        self._cs_body=QFrame(); self._cs_body.setStyleSheet("background:transparent;border:none;")
+        self._cs_body=QFrame(); self._cs_body.setStyleSheet(_TRANSPARENT_QSS)
         self._cs_body.hide()
         cs_body_ly=QVBoxLayout(self._cs_body); cs_body_ly.setContentsMargins(0,2,0,2); cs_body_ly.setSpacing(3)
 
@@ -2680,7 +3262,7 @@ class MainWindow(QMainWindow):
         # Auto Exposure checkbox + Exposure slider
         ae_row=QHBoxLayout(); ae_row.setSpacing(6)
         self.auto_exp_cb=QCheckBox("Auto Exposure"); self.auto_exp_cb.setChecked(True)
-        self.auto_exp_cb.setStyleSheet("font-size:10px;color:#8888a0;border:none;")
+        self.auto_exp_cb.setStyleSheet(_ROW_LBL_QSS)
         self.auto_exp_cb.toggled.connect(self._push_cam_settings); self.auto_exp_cb.toggled.connect(lambda v: self.exposure_sl.setEnabled(not v))
         ae_row.addWidget(self.auto_exp_cb); ae_row.addStretch(); cs_body_ly.addLayout(ae_row)
 
@@ -2697,7 +3279,7 @@ class MainWindow(QMainWindow):
         # Auto WB checkbox + WB Temp slider
         awb_row=QHBoxLayout(); awb_row.setSpacing(6)
         self.auto_wb_cb=QCheckBox("Auto White Balance"); self.auto_wb_cb.setChecked(True)
-        self.auto_wb_cb.setStyleSheet("font-size:10px;color:#8888a0;border:none;")
+        self.auto_wb_cb.setStyleSheet(_ROW_LBL_QSS)
         self.auto_wb_cb.toggled.connect(self._push_cam_settings); self.auto_wb_cb.toggled.connect(lambda v: self.wb_sl.setEnabled(not v))
         awb_row.addWidget(self.auto_wb_cb); awb_row.addStretch(); cs_body_ly.addLayout(awb_row)
 
@@ -2772,8 +3354,11 @@ class MainWindow(QMainWindow):
 
         sep=QFrame(); sep.setFrameShape(QFrame.Shape.HLine); sep.setStyleSheet("color:#2a2a3a;"); ll.addWidget(sep)
         ll.addWidget(self._sec("ACTION LOG"))
-        self.logl=QLabel("No actions yet"); self.logl.setStyleSheet("font-size:11px;color:#555570;padding:4px 12px;")
-        self.logl.setWordWrap(True); self.logl.setMinimumHeight(80); self.logl.setAlignment(Qt.AlignmentFlag.AlignTop); ll.addWidget(self.logl)
+        # Item view: a log write lays out one new row instead of re-flowing a whole rich-text label
+        self.logl=QListWidget(); self.logl.setUniformItemSizes(True); self.logl.setMinimumHeight(80); self.logl.setMaximumHeight(140)
+        self.logl.setFocusPolicy(Qt.FocusPolicy.NoFocus); self.logl.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.logl.setStyleSheet("QListWidget{background:transparent;border:none;font-size:11px;color:#8888a0;padding:0 8px}QListWidget::item{padding:0 4px}")
+        self.logl.addItem("No actions yet"); self.logl.item(0).setForeground(QColor(0x55,0x55,0x70)); ll.addWidget(self.logl)
         sp.addWidget(left)
 
         # Right panel
@@ -2803,7 +3388,7 @@ class MainWindow(QMainWindow):
         # Load saved chain dropdowns row
         load_row = QHBoxLayout(); load_row.setSpacing(6)
         load_lbl = QLabel("Load Saved:")
-        load_lbl.setStyleSheet("font-size:10px;color:#8888a0;border:none;")
+        load_lbl.setStyleSheet(_ROW_LBL_QSS)
         load_row.addWidget(load_lbl)
         self.load_chain_cb = QComboBox(); self.load_chain_cb.setFixedHeight(26)
         self.load_chain_cb.setStyleSheet("font-size:10px;padding:2px 6px;min-width:120px;")
@@ -2848,14 +3433,8 @@ class MainWindow(QMainWindow):
             (8, 0, 'head_left'),            (8, 1, 'head_right'),
         ]
         g_lookup = {g['id']: g for g in GESTURES}
-        for row, col, gid in GRID_LAYOUT:
-            g = g_lookup[gid]
-            at = ACTION_TYPES_RIGHT_EYEBROW if gid == 'eyebrow_raise_right' else ACTION_TYPES
-            card = GestureCard(g, action_types=at); self.cards[gid] = card
-            grid.addWidget(card, row, col)
-        # Connect card enable toggles to live readings filter
-        for gid, card in self.cards.items():
-            card.en.toggled.connect(self._update_lr_filter)
+        # Cards are filled in lazily by _build_next_card so the window paints before they exist
+        self._card_grid = grid; self._card_queue = [(row, col, g_lookup[gid]) for row, col, gid in GRID_LAYOUT]
         rl.addLayout(grid)
 
         rl.addWidget(self._sec("GLOBAL SETTINGS"))
@@ -2865,6 +3444,7 @@ class MainWindow(QMainWindow):
         self.cds = self._gslider(gcl,"Cooldown (ms)",50,1500,650,50)
         self.hds = self._gslider(gcl,"Hold Time (ms)",5,500,200,25)
         self.pcs = self._gslider(gcl,"Tilt Compensation",0,100,35)
+        self.pcs.valueChanged.connect(self._set_tilt)
         rl.addWidget(gc); rl.addStretch()
         rsc.setWidget(rwid); sp.addWidget(rsc); sp.setSizes([320,880]); root.addWidget(sp,stretch=1)
 
@@ -2877,9 +3457,50 @@ class MainWindow(QMainWindow):
         self.al=QLabel(f"Active: {len(GESTURES)}/{len(GESTURES)}"); self.al.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;"); bl.addWidget(self.al)
         self.dl=QLabel("Detections: 0"); self.dl.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;"); bl.addWidget(self.dl)
         root.addWidget(bot)
+        # Camera and profile buttons stay disabled until every gesture card is built
+        self._startup_locked = (self.cb, bot)
+        for w in self._startup_locked: w.setEnabled(False)
 
     def _sec(self, t):
-        l=QLabel(t); l.setStyleSheet("font-family:Consolas;font-size:10px;color:#555570;letter-spacing:1.5px;font-weight:600;padding:8px 12px 4px;"); return l
+        l=QLabel(t); l.setObjectName("secHdr"); return l
+
+    def _set_tilt(self, v):
+        """Tilt compensation slider -> camera thread's gesture worker."""
+        if self.cam: self.cam.tilt_comp = v
+
+    def _set_sens(self, gid, v):
+        """Sensitivity slider value -> multiplier slot read by GestureDetector.compute."""
+        self._sens_arr[GESTURE_INDEX[gid]] = _SENS_LUT[v]
+
+    def _cache_card(self, card):
+        """Card edit -> cached trigger tuple + kernel arrays, so the frame loop never calls get_state().
+        Disabled cards are skipped outright; analog axis cards are stepped in Python, not by the kernel."""
+        i = GESTURE_INDEX[card.gid]; s = card.get_state(); act = s['action']; mode = s['triggerMode']
+        cmd = s['launchProgram'] if act == 'launch_program' else s['command']
+        prev = self._g_cached[i]
+        if prev is not None and prev[0] and not s['enabled']: self._release_slot(i, prev)
+        self._g_cached[i] = (s['enabled'], s['thresholdMin'], s['thresholdMax'], mode, act, s['keyBind'], cmd,
+                             s['gamepadBtn'], s['gamepadAxis'], s['gamepadInvert'], s['gamepadDeadzone'], ACTION_OP.get(act, OP_NONE))
+        self._th_arr[i] = s['thresholdMin']; self._mode_arr[i] = m = TRIGGER_MODE_INDEX.get(mode, 0)
+        self._enabled[i] = en = s['enabled']
+        self._trig_on[i] = en and not (m == _TM_ANALOG and act == 'gamepad_axis' and s['gamepadAxis'])
+        self._analog_ix = np.flatnonzero(self._enabled & ~self._trig_on).tolist()
+
+    def _release_slot(self, i, c):
+        """Card just disabled: let go of whatever it holds, once, instead of checking every frame."""
+        if self._hold_on[i] or self._toggle_on[i]:
+            self._hold_pool.submit(execute_hold_stop, c[4], c[5], c[7]); self._hold_on[i] = False; self._toggle_on[i] = False
+        # If disabled mid-analog, zero the axis
+        if c[3] == 'analog' and c[4] == 'gamepad_axis' and VirtualGamepad.connected():
+            execute_gamepad_axis(c[8] or 'left_trigger', 0.0)
+
+    def _set_dz(self, gid, v):
+        """Dead zone slider value -> slot in the array applied after EMA smoothing."""
+        self._dz_arr[GESTURE_INDEX[gid]] = v
+
+    def _update_active_lbl(self, *_):
+        ac = sum(c.en.isChecked() for c in self.cards.values())
+        self.al.setText(f"Active: {ac}/{len(GESTURES)}")
 
     def _update_lr_filter(self):
         """Show/hide live reading rows based on filter selection."""
@@ -2894,19 +3515,19 @@ class MainWindow(QMainWindow):
                     self.rrows[gid].setVisible(enabled)
 
     def _gslider(self, parent_layout, label, mn, mx, default, step=1):
-        h=QHBoxLayout(); l=QLabel(label); l.setStyleSheet("font-size:11px;border:none;"); h.addWidget(l); h.addStretch()
-        vl=QLabel(str(default)); vl.setStyleSheet("font-family:Consolas;font-size:11px;color:#555570;border:none;"); h.addWidget(vl)
+        h=QHBoxLayout(); l=QLabel(label); l.setObjectName("lbl11"); h.addWidget(l); h.addStretch()
+        vl=QLabel(str(default)); vl.setObjectName("monoVal"); h.addWidget(vl)
         parent_layout.addLayout(h)
         sl=QSlider(Qt.Orientation.Horizontal); sl.setRange(mn,mx); sl.setSingleStep(step); sl.setValue(default)
         sl.valueChanged.connect(lambda v: vl.setText(str(v))); parent_layout.addWidget(sl); return sl
 
-    def _set_btn_primary(self):
-        self.cb.setStyleSheet("QPushButton{background:#00d4ff;border:1px solid #00d4ff;color:#0a0a0f;font-weight:600;border-radius:6px;padding:6px 16px}QPushButton:hover{background:#00bde6}")
-    def _set_btn_danger(self):
-        self.cb.setStyleSheet("QPushButton{background:#ff4466;border:1px solid #ff4466;color:#0a0a0f;font-weight:600;border-radius:6px;padding:6px 16px}QPushButton:hover{background:#e63355}")
+    def _set_btn_primary(self): _repolish(self.cb, 'state', 'primary')
+    def _set_btn_danger(self): _repolish(self.cb, 'state', 'danger')
     def _ss(self, txt, clr):
-        self.stl.setText(f"\u25CF {txt}")
-        self.stl.setStyleSheet(f"color:{clr};font-family:Consolas;font-size:11px;background:{clr}33;padding:3px 8px;border-radius:10px;border:1px solid {clr};")
+        """Status pill: text + colour state; both are skipped when unchanged (called every frame)."""
+        txt = f"\u25CF {txt}"; st = _STATUS_STATE.get(clr, 'warn')
+        if self.stl.text() != txt: self.stl.setText(txt)
+        if self.stl.property('state') != st: _repolish(self.stl, 'state', st)
     def _update_gp_status(self):
         if not VirtualGamepad.available():
             self.gp_stl.setText("\U0001F3AE No Driver")
@@ -2970,7 +3591,6 @@ class MainWindow(QMainWindow):
     def _scan_cameras(self):
         """Populate camera list without probing devices."""
         self._available_cams = enumerate_cameras()
-        from PyQt6.QtCore import QMetaObject
         QMetaObject.invokeMethod(self, "_populate_cameras", Qt.ConnectionType.QueuedConnection)
 
     @pyqtSlot()
@@ -2991,13 +3611,12 @@ class MainWindow(QMainWindow):
         if cam_data is None:
             self._ss("No camera selected", "#ff4466"); return
         cam_index, cam_backend = cam_data
-        self.det.reset(); self.sm={k:0 for k in self.sm}
-        self.hold_active={k:False for k in self.hold_active}
-        self.toggle_state={k:False for k in self.toggle_state}
-        self.repeat_lt={k:0.0 for k in self.repeat_lt}
-        self.chain_state={}; self._mc_hs={}; self._mc_buf={}; self._mc_last={}; self._mc_active={}
-        self._chain_hs={g['id']:0.0 for g in GESTURES}
-        self._chain_ta={g['id']:False for g in GESTURES}; self._chain_newly=set()
+        self.det.reset(); self._sm_vec.fill(0.0)
+        self._hold_on[:] = False
+        self._toggle_on[:] = False; self._repeat_lt.fill(0.0)
+        self._chain_waiters=None
+        for ch in self.morse_chains: self._init_morse_state(ch.chain_id)
+        self._chain_hs.fill(0.0); self._chain_ta[:] = False
         # Reset point tracker direction states
         for d in self._pt_dirs:
             self._pt_hs[d]=0.0; self._pt_ta[d]=False; self._pt_lt[d]=0.0
@@ -3012,7 +3631,8 @@ class MainWindow(QMainWindow):
         # Initialize virtual gamepad if any gesture uses a gamepad action
         self._init_gamepad_if_needed()
         res_idx = self.res_cb.currentIndex()
-        self.cam=CameraThread(cam_index, cam_backend, res_index=res_idx)
+        self.cam=CameraThread(cam_index, cam_backend, res_index=res_idx, detector=self.det)
+        self.cam.sens_arr = self._sens_arr; self.cam.tilt_comp = self.pcs.value()
         # Push current camera settings to thread before starting
         cam_s = {
             'denoise': self.denoise_sl.value(),
@@ -3041,7 +3661,9 @@ class MainWindow(QMainWindow):
     def _stop(self):
         # Release any held keys/buttons before stopping
         self._release_all_holds()
-        if self.cam: self.cam.stop(); self.cam.wait(3000); self.cam=None
+        if self.cam:
+            self.cam.frame_ready.disconnect(self._of)
+            self.cam.stop(); self.cam.wait(3000); self.cam=None
         self.cb.setText("\u25B6 Start Camera"); self._set_btn_primary(); self.rcb.hide()
         self._ss("Camera Off","#ff4466"); self.vl.clear(); self.vl.setText("\U0001F4F7  Start Camera"); self.fl.setText("-- fps")
         self._update_gp_status()
@@ -3051,26 +3673,22 @@ class MainWindow(QMainWindow):
     def _recal(self):
         self.rcb.setEnabled(False)
         self.rcb.setText("\u23F3 Wait...")
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(1000, self._recal_execute)
     def _recal_execute(self):
         self._release_all_holds()
-        self.chain_state={}
-        self.det.reset(); self.sm={k:0 for k in self.sm}; self._ss("Calibrating...","#ffaa00")
+        self._chain_waiters=None
+        self.det.reset(); self._sm_vec.fill(0.0); self._ss("Calibrating...","#ffaa00")
         self.rcb.setEnabled(True)
         self.rcb.setText("\u27F3 Recalibrate")
     def _release_all_holds(self):
-        """Release any keys/buttons currently held by hold or toggle mode."""
-        for g in GESTURES:
-            gid = g['id']
-            if self.hold_active.get(gid, False) or self.toggle_state.get(gid, False):
-                s = self.cards[gid].get_state()
-                execute_hold_stop(s['action'], s['keyBind'], s.get('gamepadBtn',''))
-                self.hold_active[gid] = False
-                self.toggle_state[gid] = False
+        """Release any keys/buttons currently held by hold or toggle mode.
+        Queued on the hold worker so a pending hold start can't land after its release."""
+        for i in np.flatnonzero(self._hold_on | self._toggle_on).tolist():
+            c = self._g_cached[i]; self._hold_pool.submit(execute_hold_stop, c[4], c[5], c[7])
+        self._hold_on[:] = False; self._toggle_on[:] = False
         # Reset virtual gamepad if connected
         gp = VirtualGamepad.get() if VirtualGamepad.connected() else None
-        if gp: gp.reset_all()
+        if gp: self._hold_pool.submit(gp.reset_all)
 
     # ••• Point Tracker Methods •••
     def _on_cam_click(self, event):
@@ -3130,7 +3748,6 @@ class MainWindow(QMainWindow):
         """Re-center the point tracker origin to its current position (with 1s delay)."""
         self.pt_panel.recenter_btn.setEnabled(False)
         self.pt_panel.recenter_btn.setText("\u23F3 Wait...")
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(1000, self._pt_recenter_execute)
 
     def _pt_recenter_execute(self):
@@ -3171,7 +3788,7 @@ class MainWindow(QMainWindow):
             self._pt_ta[d] = False
             self._pt_hs[d] = 0.0
 
-    def _pt_process_direction(self, dir_key, val_0_100, now_ms):
+    def _pt_process_direction(self, dir_key, val_0_100, now_ms, cd, ht):
         """Process a single point tracker direction like a gesture card.
         val_0_100: 0-100 magnitude in this direction."""
         cfg = self._pt_get_dir_cfg(dir_key)
@@ -3186,10 +3803,9 @@ class MainWindow(QMainWindow):
         val = val_0_100
         th = s['threshold']
         mode = s.get('triggerMode', 'single')
-        act = s['action']; kb = s['keyBind']; macro = s.get('macro','')
+        act = s['action']; kb = s['keyBind']; macro = s.get('macro',''); op = ACTION_OP.get(act, OP_NONE)
         cmd = s.get('launchProgram','') if act == 'launch_program' else s['command']
         gp_btn = s.get('gamepadBtn',''); gp_axis = s.get('gamepadAxis','')
-        cd = self.cds.value(); ht = self.hds.value()
         REPEAT_INTERVAL = 150
 
         # Analog mode: continuous per-frame axis output
@@ -3205,60 +3821,45 @@ class MainWindow(QMainWindow):
             if mode == 'single':
                 if held >= ht and not self._pt_ta[dir_key] and now_ms - self._pt_lt[dir_key] > cd:
                     self._pt_ta[dir_key] = True; self._pt_lt[dir_key] = now_ms
-                    self.dc += 1; self.dl.setText(f"Detections: {self.dc}")
-                    threading.Thread(target=execute_action, args=(act, kb, cmd, macro, gp_btn), daemon=True).start()
+                    self.dc += 1
+                    self._fire(op, act, kb, cmd, macro, gp_btn)
                     self._logit(f"\U0001F3AF PT:{dir_key}", act, kb, macro)
 
             elif mode == 'hold':
                 if held >= ht and not self._pt_hold[dir_key]:
                     self._pt_hold[dir_key] = True; self._pt_ta[dir_key] = True
-                    self.dc += 1; self.dl.setText(f"Detections: {self.dc}")
-                    if act in _HOLDABLE_ACTIONS:
-                        threading.Thread(target=execute_hold_start, args=(act, kb, gp_btn), daemon=True).start()
-                    elif act in _REPEATABLE_ACTIONS or act == 'command':
-                        threading.Thread(target=execute_action, args=(act, kb, cmd, macro, gp_btn), daemon=True).start()
-                        self._pt_rpt[dir_key] = now_ms
-                    else:
-                        threading.Thread(target=execute_action, args=(act, kb, cmd, macro, gp_btn), daemon=True).start()
+                    self.dc += 1
+                    self._fire(op, act, kb, cmd, macro, gp_btn, hold=True)
+                    if _OP_REPEATABLE[op]: self._pt_rpt[dir_key] = now_ms
                     self._logit(f"\U0001F3AF PT:{dir_key}", act, kb, macro, mode_tag='HOLD')
-                elif self._pt_hold[dir_key] and act in _REPEATABLE_ACTIONS:
+                elif self._pt_hold[dir_key] and _OP_REPEATABLE[op]:
                     if now_ms - self._pt_rpt.get(dir_key, 0) >= REPEAT_INTERVAL:
-                        threading.Thread(target=execute_action, args=(act, kb, cmd, macro, gp_btn), daemon=True).start()
+                        self._fire(op, act, kb, cmd, macro, gp_btn)
                         self._pt_rpt[dir_key] = now_ms
 
             elif mode == 'toggle':
                 if held >= ht and not self._pt_ta[dir_key] and now_ms - self._pt_lt[dir_key] > cd:
                     self._pt_ta[dir_key] = True; self._pt_lt[dir_key] = now_ms
-                    self.dc += 1; self.dl.setText(f"Detections: {self.dc}")
+                    self.dc += 1
                     if not self._pt_tog_state[dir_key]:
                         self._pt_tog_state[dir_key] = True
-                        if act in _HOLDABLE_ACTIONS:
-                            threading.Thread(target=execute_hold_start, args=(act, kb, gp_btn), daemon=True).start()
-                        else:
-                            threading.Thread(target=execute_action, args=(act, kb, cmd, macro, gp_btn), daemon=True).start()
+                        self._fire(op, act, kb, cmd, macro, gp_btn, hold=True)
                         self._logit(f"\U0001F3AF PT:{dir_key}", act, kb, macro, mode_tag='TOG ON')
                     else:
                         self._pt_tog_state[dir_key] = False
-                        if act in _HOLDABLE_ACTIONS:
-                            threading.Thread(target=execute_hold_stop, args=(act, kb, gp_btn), daemon=True).start()
+                        if _OP_HOLDABLE[op]:
+                            self._hold_pool.submit(execute_hold_stop, act, kb, gp_btn)
                         self._logit(f"\U0001F3AF PT:{dir_key}", act, kb, macro, mode_tag='TOG OFF')
         else:
             if mode == 'hold' and self._pt_hold[dir_key]:
-                if act in _HOLDABLE_ACTIONS:
-                    threading.Thread(target=execute_hold_stop, args=(act, kb, gp_btn), daemon=True).start()
+                if _OP_HOLDABLE[op]:
+                    self._hold_pool.submit(execute_hold_stop, act, kb, gp_btn)
                 self._pt_hold[dir_key] = False
             self._pt_ta[dir_key] = False
             self._pt_hs[dir_key] = 0
 
-    @pyqtSlot(object, object, float)
-    def _of(self, frame, lm, fps):
-        self.fl.setText(f"{fps:.0f} fps")
-        # Store raw frame for point tracker (before any overlays)
-        self._pt_last_frame = frame.copy()
-        d = frame.copy()
-        h, w = d.shape[:2]
-
-        # Zoom + pan crop
+    def _calc_view(self, w, h):
+        """Crop for the current zoom/pan: ((w,h), x0, y0, cw, ch, pixel box or None at 1x)."""
         zoom = self.zs.value() / 100.0
         pan_x = self.pxs.value() / 100.0
         pan_y = self.pys.value() / 100.0
@@ -3266,33 +3867,74 @@ class MainWindow(QMainWindow):
         max_off_x = (1.0 - crop_w) / 2.0; max_off_y = (1.0 - crop_h) / 2.0
         cx = 0.5 + pan_x * max_off_x; cy = 0.5 + pan_y * max_off_y
         crop_x0 = cx - crop_w / 2.0; crop_y0 = cy - crop_h / 2.0
-
         # Store crop params for click mapping
         self._pt_crop = (crop_x0, crop_y0, crop_w, crop_h, w, h)
-
+        box = None
         if zoom > 1.0:
-            px0 = max(0, min(int(crop_x0 * w), w-1)); py0 = max(0, min(int(crop_y0 * h), h-1))
-            px1 = max(1, min(int((crop_x0 + crop_w) * w), w)); py1 = max(1, min(int((crop_y0 + crop_h) * h), h))
-            d = cv2.resize(d[py0:py1, px0:px1], (w, h), interpolation=cv2.INTER_LINEAR)
+            # Pixel corners of the crop, clamped in two ufunc calls: top-left to [0,size-1], bottom-right to [1,size]
+            c = (np.array([[crop_x0, crop_y0], [crop_x0 + crop_w, crop_y0 + crop_h]]) * (w, h)).astype(np.int32)
+            c[0] = np.clip(c[0], 0, (w-1, h-1)); c[1] = np.clip(c[1], 1, (w, h))
+            box = tuple(c.ravel().tolist())
+        return (w, h), crop_x0, crop_y0, crop_w, crop_h, box
+
+    def _draw_landmarks(self, d, uv):
+        """Mesh dots + feature markers for landmarks already mapped to normalised view coords uv."""
+        dh, dw = d.shape[:2]
+        vis = ((uv >= 0) & (uv <= 1)).all(1)  # points outside the crop are masked off
+        px = (uv * (dw, dh)).astype(np.int32); np.clip(px, 0, (dw-1, dh-1), out=px)
+        # Mesh dots: a 5-pixel "+" stamp written by fancy indexing (matches a radius-1 cv2.circle)
+        c = px[:468][vis[:468]]; xs = c[:, 0]; ys = c[:, 1]
+        xl = np.maximum(xs-1, 0); xr = np.minimum(xs+1, dw-1); yu = np.maximum(ys-1, 0); yd = np.minimum(ys+1, dh-1)
+        d[ys, xs] = d[ys, xl] = d[ys, xr] = d[yu, xs] = d[yd, xs] = (0,212,255)
+        # Feature markers: radius-3 disc stamp per visible point, all points in a single write
+        fm = vis[FEATURE_IDX]; fp = px[FEATURE_IDX[fm]]
+        fy = np.clip(fp[:, 1:2] + _STAMP_DY, 0, dh-1); fx = np.clip(fp[:, 0:1] + _STAMP_DX, 0, dw-1)
+        d[fy, fx] = FEATURE_COLOR[fm][:, None]
+
+    def _build_preview(self, has_lm, w, h):
+        """Return (view, render) for one regime. render(frame, lm, pt_on) -> image to show, with the
+        zoom and landmark branches resolved here once instead of being re-tested every frame."""
+        view = self._calc_view(w, h); _, x0, y0, cw, ch, box = view
+        def drawable(frame):
+            # Drawing at 1x: copy into a reused buffer so `frame` itself is never written
+            if self._drawbuf is None or self._drawbuf.shape != frame.shape: self._drawbuf = np.empty_like(frame)
+            np.copyto(self._drawbuf, frame); return self._drawbuf
+        if box is None:
+            if has_lm:
+                def render(frame, lm, pt_on): d = drawable(frame); self._draw_landmarks(d, lm[:, :2]); return d
+            else:
+                def render(frame, lm, pt_on): return drawable(frame) if pt_on else frame
+            return view, render
+        px0, py0, px1, py1 = box; off = np.array((x0, y0), np.float32); scl = np.array((1.0/cw, 1.0/ch), np.float32)
+        def zoomed(frame):
+            if self._zbuf is None or self._zbuf.shape != frame.shape: self._zbuf = np.empty_like(frame)
+            return cv2.resize(frame[py0:py1, px0:px1], (w, h), dst=self._zbuf, interpolation=cv2.INTER_LINEAR)
+        if has_lm:
+            def render(frame, lm, pt_on): d = zoomed(frame); self._draw_landmarks(d, (lm[:, :2] - off) * scl); return d
+        else:
+            def render(frame, lm, pt_on): return zoomed(frame)
+        return view, render
+
+    @pyqtSlot(object, object, object, float)
+    def _of(self, frame, lm, raw, fps):
+        if self.cam is None: return  # frame queued before _stop; the action pools may already be shut down
+        now = time.monotonic()
+        if now - self._fps_last >= 0.5: self._fps_last = now; self.fl.setText(f"{fps:.0f} fps")
+        # Raw frame for point tracker; overlays never draw into `frame`, so no copy is needed.
+        # The frame it replaces is no longer referenced, so its buffer goes back to the camera thread
+        prev = self._pt_last_frame; self._pt_last_frame = frame
+        if prev is not None and self.cam: self.cam.recycle(prev)
+        h, w = frame.shape[:2]
 
-        if lm is not None:
-            dh, dw = d.shape[:2]
-            for i in range(min(len(lm),468)):
-                sx = (lm[i].x - crop_x0) / crop_w; sy = (lm[i].y - crop_y0) / crop_h
-                if 0 <= sx <= 1 and 0 <= sy <= 1:
-                    cv2.circle(d,(int(sx*dw),int(sy*dh)),1,(255,212,0),-1)
-            for idx,clr in [(LEFT_EYE_EAR,(0,255,136)),(RIGHT_EYE_EAR,(0,255,136)),
-                            (LEFT_EYEBROW,(0,212,255)),(RIGHT_EYEBROW,(0,212,255)),
-                            ([UPPER_LIP,LOWER_LIP,MOUTH_LEFT,MOUTH_RIGHT,LIP_TOP_OUTER,LIP_BOT_OUTER],(255,68,102)),
-                            ([MOUTH_CORNER_LEFT,MOUTH_CORNER_RIGHT],(68,221,170)),
-                            ([LEFT_BROW_INNER,RIGHT_BROW_INNER],(204,68,255))]:
-                for i in idx:
-                    if i<len(lm):
-                        sx = (lm[i].x - crop_x0) / crop_w; sy = (lm[i].y - crop_y0) / crop_h
-                        if 0 <= sx <= 1 and 0 <= sy <= 1:
-                            cv2.circle(d,(int(sx*dw),int(sy*dh)),3,clr,-1)
+        # Preview renderer specialised for (landmarks?, frame size, zoom/pan view); rebuilt only on change
+        regime = (lm is not None, w, h)
+        if self._view is None or self._regime != regime:
+            self._regime = regime; self._view, self._render = self._build_preview(lm is not None, w, h)
+        _, crop_x0, crop_y0, crop_w, crop_h, _ = self._view
+        pt_on = self.pt.active and self.pt_panel.en.isChecked()
+        d = self._render(frame, lm, pt_on)
         # Point tracker overlay
-        if self.pt.active and self.pt_panel.en.isChecked():
+        if pt_on:
             dh, dw = d.shape[:2]
             ox, oy = self.pt.origin
             cx, cy = self.pt.current
@@ -3302,7 +3944,7 @@ class MainWindow(QMainWindow):
             osy = (oy / frame.shape[0] - crop_y0) / crop_h
             if 0 <= osx <= 1 and 0 <= osy <= 1:
                 opx, opy = int(osx * dw), int(osy * dh)
-                cv2.drawMarker(d, (opx, opy), (0, 204, 170), cv2.MARKER_CROSS, 12, 1)
+                cv2.drawMarker(d, (opx, opy), (170, 204, 0), cv2.MARKER_CROSS, 12, 1)
             # Draw current tracked position (bright box)
             csx = (cx / frame.shape[1] - crop_x0) / crop_w
             csy = (cy / frame.shape[0] - crop_y0) / crop_h
@@ -3311,258 +3953,185 @@ class MainWindow(QMainWindow):
                 # ROI box scaled to display
                 rsx = int(r / frame.shape[1] * dw / crop_w)
                 rsy = int(r / frame.shape[0] * dh / crop_h)
-                cv2.rectangle(d, (cpx - rsx, cpy - rsy), (cpx + rsx, cpy + rsy), (0, 204, 170), 2)
-                cv2.circle(d, (cpx, cpy), 3, (0, 255, 200), -1)
+                cv2.rectangle(d, (cpx - rsx, cpy - rsy), (cpx + rsx, cpy + rsy), (170, 204, 0), 2)
+                cv2.circle(d, (cpx, cpy), 3, (200, 255, 0), -1)
                 # Draw line from origin to current
                 if 0 <= osx <= 1 and 0 <= osy <= 1:
-                    cv2.line(d, (opx, opy), (cpx, cpy), (0, 204, 170), 1)
+                    cv2.line(d, (opx, opy), (cpx, cpy), (170, 204, 0), 1)
 
-        rgb = cv2.cvtColor(d, cv2.COLOR_BGR2RGB)
-        qi = QImage(rgb.data,rgb.shape[1],rgb.shape[0],rgb.strides[0],QImage.Format.Format_RGB888)
-        self.vl.setPixmap(QPixmap.fromImage(qi).scaled(self.vl.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+        # d is already RGB (converted on the camera side); fromImage copies, so wrapping it is safe
+        qi = QImage(d.data,d.shape[1],d.shape[0],d.strides[0],QImage.Format.Format_RGB888)
+        self.vl.setPixmap(QPixmap.fromImage(qi).scaled(self.vl.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.FastTransformation))
 
-        if lm is None: self._ss("No Face","#ffaa00"); return
-        # Build per-gesture sensitivity dict from card sliders
-        sens = {}
-        for gid, card in self.cards.items():
-            sens[gid] = _sens_mult(card.ss.value())
-        raw = self.det.compute(lm, self.pcs.value(), sens=sens)
+        if raw is None: self._ss("No Face","#ffaa00"); return
         if not self.det.calibrated: self._ss(f"Calibrating... ({self.det.cal_pct}%)","#ffaa00"); return
         self._ss("Tracking","#00ff88")
 
         alpha = 1-(self.sms.value()/30.0)*0.92
-        for gid,val in raw.items():
-            self.sm[gid]=self.sm.get(gid,0)*(1-alpha)+val*alpha
-            # Apply per-gesture dead zone: values below dz are snapped to 0
-            dz = self.cards[gid].dzs.value() if gid in self.cards else 3
-            if self.sm[gid] < dz:
-                self.sm[gid] = 0.0
-            self.lv[gid]=self.sm[gid]
-
-        for gid in self.lv:
-            iv=int(self.lv[gid])
-            if gid in self.rbars: self.rbars[gid].setValue(iv)
-            if gid in self.rvals: self.rvals[gid].setText(str(iv))
-            if gid in self.cards: self.cards[gid].set_live(self.lv[gid])
-
-        cd = self.cds.value(); ht = self.hds.value(); now_ms = time.time()*1000
+        sm = self._sm_vec; sm *= 1-alpha; sm += raw*alpha
+        # Apply per-gesture dead zone: values below dz are snapped to 0
+        sm[sm < self._dz_arr] = 0.0
+        above = sm >= self._th_arr  # one compare for every gesture; chains and morse index into it
+        moved = above | self._above_prev; self._above_prev = above  # above now or last frame
+
+        # HUD bars/labels refresh at ~15 Hz and only when the integer value changed
+        if now - self._hud_last >= 0.066:
+            self._hud_last = now; last = self._last_iv; ivs = sm.astype(np.int32).tolist()
+            for i, bar, vl, card in self._hud_triples:
+                iv = ivs[i]
+                if last[i] == iv: continue
+                last[i] = iv; bar.setValue(iv); vl.setText(str(iv)); card.set_live(iv)
+
+        # Slider reads hoisted once per frame; timestamps are monotonic ms (only ever diffed)
+        cd = self.cds.value(); ht = self.hds.value(); now_ms = time.monotonic_ns() // 1_000_000
         REPEAT_INTERVAL = 150  # ms between repeat fires in hold mode for repeatable actions
-        for g in GESTURES:
-            gid=g['id']; s=self.cards[gid].get_state()
-            if not s['enabled']:
-                # If disabled mid-hold, release
-                if self.hold_active[gid]:
-                    execute_hold_stop(s['action'], s['keyBind'], s.get('gamepadBtn','')); self.hold_active[gid]=False
-                # If disabled mid-analog, zero the axis
-                if s.get('triggerMode') == 'analog' and s['action'] == 'gamepad_axis':
-                    execute_gamepad_axis(s.get('gamepadAxis','left_trigger'), 0.0)
-                continue
-            val=self.lv.get(gid,0)
-            th = s['thresholdMin']; th_max = s.get('thresholdMax', 100)
-            mode = s.get('triggerMode', 'single')
-            act = s['action']; kb = s['keyBind']; macro = s.get('macro','')
-            cmd = s.get('launchProgram','') if act == 'launch_program' else s['command']
-            gp_btn = s.get('gamepadBtn',''); gp_axis = s.get('gamepadAxis','')
-            gp_invert = s.get('gamepadInvert', False); gp_dz = s.get('gamepadDeadzone', 5)
-
+        ev = self._trig_ev
+        _trigger_step_njit(sm, self._th_arr, self._mode_arr, self._trig_on, float(now_ms), float(ht), float(cd),
+                           self._hs, self._ta, self._lt, self._hold_on, ev)
+        # Enabled analog axis cards, which the kernel skips (disabled cards are released in _cache_card)
+        cached = self._g_cached
+        for i in self._analog_ix:
+            _, th, th_max, _, _, _, _, _, gp_axis, gp_invert, gp_dz, _ = cached[i]
             # Analog mode: continuous per-frame axis output, no threshold gating
-            if mode == 'analog' and act == 'gamepad_axis' and gp_axis:
-                # Map gesture 0-100 to 0.0-1.0 using threshold range
-                range_size = max(1, th_max - th)
-                clamped = max(0.0, min(1.0, (val - th) / range_size))
-                # Apply dead zone
-                dz = gp_dz / 100.0
-                if clamped < dz: clamped = 0.0
-                else: clamped = (clamped - dz) / (1.0 - dz)
-                # Apply invert
-                if gp_invert: clamped = 1.0 - clamped
-                execute_gamepad_axis(gp_axis, clamped)
-                continue  # skip normal threshold logic for analog
-
-            if val >= th:
-                if self.hs[gid] == 0: self.hs[gid] = now_ms
-                held = now_ms - self.hs[gid]
-
-                if mode == 'single':
-                    # Original behavior: fire once per activation, with cooldown
-                    if held >= ht and not self.ta[gid] and now_ms-self.lt[gid]>cd:
-                        self.ta[gid]=True; self.lt[gid]=now_ms; self.dc+=1; self.dl.setText(f"Detections: {self.dc}")
-                        if act == 'toggle_gestures':
-                            self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
-                        else:
-                            threading.Thread(target=execute_action,args=(act,kb,cmd,macro,gp_btn),daemon=True).start()
-                            self._logit(g['name'],act,kb,macro)
-
-                elif mode == 'hold':
-                    # Sustain: press down on activation, release on deactivation
-                    if held >= ht and not self.hold_active[gid]:
-                        # Start holding
-                        self.hold_active[gid] = True; self.ta[gid] = True
-                        self.dc+=1; self.dl.setText(f"Detections: {self.dc}")
-                        if act == 'toggle_gestures':
-                            self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
-                        elif act in _HOLDABLE_ACTIONS:
-                            threading.Thread(target=execute_hold_start,args=(act,kb,gp_btn),daemon=True).start()
-                        elif act in _REPEATABLE_ACTIONS or act == 'command':
-                            # Fire first shot immediately
-                            threading.Thread(target=execute_action,args=(act,kb,cmd,macro,gp_btn),daemon=True).start()
-                            self.repeat_lt[gid] = now_ms
-                        else:
-                            # Non-holdable, non-repeatable: just fire once
-                            threading.Thread(target=execute_action,args=(act,kb,cmd,macro,gp_btn),daemon=True).start()
-                        self._logit(g['name'],act,kb,macro,mode_tag='HOLD')
-                    elif self.hold_active[gid] and act in _REPEATABLE_ACTIONS:
-                        # Repeat fire while held
-                        if now_ms - self.repeat_lt.get(gid,0) >= REPEAT_INTERVAL:
-                            threading.Thread(target=execute_action,args=(act,kb,cmd,macro,gp_btn),daemon=True).start()
-                            self.repeat_lt[gid] = now_ms
-
-                elif mode == 'toggle':
-                    # Toggle: first activation starts, second stops
-                    if held >= ht and not self.ta[gid] and now_ms-self.lt[gid]>cd:
-                        self.ta[gid] = True; self.lt[gid] = now_ms
-                        self.dc+=1; self.dl.setText(f"Detections: {self.dc}")
-                        if act == 'toggle_gestures':
-                            self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
-                        elif not self.toggle_state[gid]:
-                            # Toggle ON
-                            self.toggle_state[gid] = True
-                            if act in _HOLDABLE_ACTIONS:
-                                threading.Thread(target=execute_hold_start,args=(act,kb,gp_btn),daemon=True).start()
-                            else:
-                                threading.Thread(target=execute_action,args=(act,kb,cmd,macro,gp_btn),daemon=True).start()
-                            self._logit(g['name'],act,kb,macro,mode_tag='TOG ON')
-                        else:
-                            # Toggle OFF
-                            self.toggle_state[gid] = False
-                            if act in _HOLDABLE_ACTIONS:
-                                threading.Thread(target=execute_hold_stop,args=(act,kb,gp_btn),daemon=True).start()
-                            self._logit(g['name'],act,kb,macro,mode_tag='TOG OFF')
-            else:
-                # Gesture dropped below threshold
-                if mode == 'hold' and self.hold_active[gid]:
-                    # Release the held key/button
-                    if act in _HOLDABLE_ACTIONS:
-                        threading.Thread(target=execute_hold_stop,args=(act,kb,gp_btn),daemon=True).start()
-                    self.hold_active[gid] = False
-                self.ta[gid]=False; self.hs[gid]=0
-
-        ac=sum(1 for g in GESTURES if self.cards[g['id']].get_state()['enabled'])
-        self.al.setText(f"Active: {ac}/{len(GESTURES)}")
+            val = float(sm[i])
+            # Map gesture 0-100 to 0.0-1.0 using threshold range
+            range_size = max(1, th_max - th)
+            clamped = max(0.0, min(1.0, (val - th) / range_size))
+            # Apply dead zone
+            dz = gp_dz / 100.0
+            if clamped < dz: clamped = 0.0
+            else: clamped = (clamped - dz) / (1.0 - dz)
+            # Apply invert
+            if gp_invert: clamped = 1.0 - clamped
+            execute_gamepad_axis(gp_axis, clamped)
 
-        # Ã¢â€â‚¬Ã¢â€â‚¬ Chain sequence detection Ã¢â€â‚¬Ã¢â€â‚¬
-        if self.chains:
-            ht_chain = self.hds.value()
-            # Detect gesture activations for chain matching (works even for disabled individual cards)
-            # Use a separate activation tracker so chains work independently
-            if not hasattr(self, '_chain_hs'): self._chain_hs = {g['id']:0.0 for g in GESTURES}
-            if not hasattr(self, '_chain_ta'): self._chain_ta = {g['id']:False for g in GESTURES}
-            if not hasattr(self, '_chain_newly'): self._chain_newly = set()
-
-            self._chain_newly.clear()
-            for g in GESTURES:
-                gid = g['id']
-                val = self.lv.get(gid, 0)
-                # Use individual card's threshold even if card is disabled
-                card_s = self.cards[gid].get_state()
-                th = card_s['thresholdMin']
-                if val >= th:
-                    if self._chain_hs[gid] == 0: self._chain_hs[gid] = now_ms
-                    held = now_ms - self._chain_hs[gid]
-                    if held >= ht_chain and not self._chain_ta[gid]:
-                        self._chain_ta[gid] = True
-                        self._chain_newly.add(gid)  # newly activated this frame
+        # Only slots with an event this frame need their card state and actions
+        gd = self._gestures_disabled
+        for i in np.flatnonzero(ev).tolist():
+            # ev was stepped before the loop: once a toggle_gestures fire has flipped the cards and
+            # released every hold, the rest of this frame's events are stale
+            if self._gestures_disabled != gd: break
+            if not self._trig_on[i]: continue
+            gid = GESTURE_ORDER[i]; name = self._g_names[i]; e = ev[i]
+            _, _, _, mode, act, kb, cmd, gp_btn, _, _, _, op = cached[i]
+            macro = self.cards[gid].me.to_macro_string() if op == OP_MACRO else ''
+
+            if e == EV_FIRE and mode == 'single':
+                # Original behavior: fire once per activation, with cooldown
+                self.dc += 1
+                if op == OP_TOGGLE_GESTURES:
+                    self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
                 else:
-                    self._chain_ta[gid] = False
-                    self._chain_hs[gid] = 0
+                    self._fire(op, act, kb, cmd, macro, gp_btn)
+                    self._logit(name,act,kb,macro)
+
+            elif e == EV_HOLD_START:
+                # Sustain: press down on activation, release on deactivation
+                self.dc += 1
+                if op == OP_TOGGLE_GESTURES:
+                    self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
+                else:
+                    # Holdable actions go down; anything else fires its first shot now
+                    self._fire(op, act, kb, cmd, macro, gp_btn, hold=True)
+                    if _OP_REPEATABLE[op]: self._repeat_lt[i] = now_ms
+                self._logit(name,act,kb,macro,mode_tag='HOLD')
+
+            elif e == EV_HELD:
+                # Repeat fire while held
+                if _OP_REPEATABLE[op] and now_ms - self._repeat_lt[i] >= REPEAT_INTERVAL:
+                    self._fire(op, act, kb, cmd, macro, gp_btn)
+                    self._repeat_lt[i] = now_ms
+
+            elif e == EV_FIRE and mode == 'toggle':
+                # Toggle: first activation starts, second stops
+                self.dc += 1
+                if op == OP_TOGGLE_GESTURES:
+                    self._toggle_gestures(self._collect_toggle_exempt_gestures(f'card:{gid}'))
+                elif not self._toggle_on[i]:
+                    # Toggle ON
+                    self._toggle_on[i] = True
+                    self._fire(op, act, kb, cmd, macro, gp_btn, hold=True)
+                    self._logit(name,act,kb,macro,mode_tag='TOG ON')
+                else:
+                    # Toggle OFF
+                    self._toggle_on[i] = False
+                    if _OP_HOLDABLE[op]:
+                        self._hold_pool.submit(execute_hold_stop, act, kb, gp_btn)
+                    self._logit(name,act,kb,macro,mode_tag='TOG OFF')
 
-            # Process each chain
-            for chain in self.chains:
-                cid = chain.chain_id
-                seq = chain.get_gesture_sequence()
-                if len(seq) < 2: continue  # need at least 2 gestures for a chain
-
-                if cid not in self.chain_state:
-                    self.chain_state[cid] = {'step': 0, 'last_time': 0.0}
-                cs = self.chain_state[cid]
-                timeout = chain.timeout_sl.value()
-
-                # Check timeout - reset if too long since last step
-                if cs['step'] > 0 and (now_ms - cs['last_time']) > timeout:
-                    cs['step'] = 0; cs['last_time'] = 0.0
-
-                # Check if expected gesture newly activated
-                expected_gid = seq[cs['step']] if cs['step'] < len(seq) else None
-                if expected_gid and expected_gid in self._chain_newly:
-                    cs['step'] += 1
-                    cs['last_time'] = now_ms
-
-                    if cs['step'] >= len(seq):
+            elif e == EV_RELEASE:
+                # Gesture dropped below threshold: release the held key/button
+                if _OP_HOLDABLE[op]:
+                    self._hold_pool.submit(execute_hold_stop, act, kb, gp_btn)
+
+
+        # Ã¢â€â‚¬Ã¢â€â‚¬ Chain sequence detection Ã¢â€â‚¬Ã¢â€â‚¬
+        # Idle frames (nothing above threshold now or last frame, no chain mid-sequence) skip the block
+        if self.chains and (self._chain_active or moved.any()):
+            # Detect gesture activations for chain matching (works even for disabled individual cards)
+            # Use a separate activation tracker so chains work independently; `newly` is the rising edge
+            # of "above threshold for the hold time", and ta keeps that state for the next frame
+            hs = self._chain_hs; ta = self._chain_ta
+            hs[above & (hs == 0)] = now_ms
+            newly = above & ~ta & (now_ms - hs >= ht)
+            ta |= newly; ta &= above; hs[~above] = 0.0
+
+            if self._chain_waiters is None: self._rebuild_chain_waiters()
+            cstate = self.chain_state; active = self._chain_active
+            # Reset chains that waited too long for their next step
+            if active:
+                for cid in [c for c, ch in active.items() if now_ms - cstate[c]['last_time'] > ch.timeout_ms]:
+                    cs = cstate[cid]; cs['step'] = 0; cs['last_time'] = 0.0
+                    active.pop(cid).set_progress(0, 0)
+
+            # Advance only the chains whose next expected step is a newly activated gesture
+            advanced = set()
+            for gi in np.flatnonzero(newly).tolist():
+                for chain, step in self._chain_waiters.get(gi, ()):
+                    cid = chain.chain_id
+                    if cid in advanced: continue
+                    cs = cstate[cid]
+                    if cs['step'] != step: continue
+                    advanced.add(cid); n = len(chain.get_gesture_sequence())
+                    if step + 1 < n:
+                        cs['step'] = step + 1; cs['last_time'] = now_ms; active[cid] = chain
+                    else:
                         # Chain complete! Fire the action
-                        cs['step'] = 0; cs['last_time'] = 0.0
-                        a_state = chain.get_action_state()
-                        self.dc += 1; self.dl.setText(f"Detections: {self.dc}")
-                        if a_state['action'] == 'toggle_gestures':
-                            self._toggle_gestures(self._collect_toggle_exempt_gestures(f'chain:{cid}'))
-                        else:
-                            threading.Thread(target=execute_action,
-                                args=(a_state['action'], a_state['keyBind'], a_state.get('launchProgram','') if a_state['action']=='launch_program' else a_state['command'], a_state['macro'], a_state.get('gamepadBtn','')),
-                                daemon=True).start()
-                            chain_name = chain.name_lbl.text()
-                            self._logit(f"\u26A1{chain_name}", a_state['action'], a_state['keyBind'], a_state['macro'], mode_tag='CHAIN')
-
-                # Update chain progress indicator
-                chain.set_progress(cs['step'], len(seq))
+                        cs['step'] = 0; cs['last_time'] = 0.0; active.pop(cid, None)
+                        self._dispatch(f"\u26A1{chain.name_lbl.text()}", chain.get_action_state(), 'CHAIN', f'chain:{cid}')
+                    chain.set_progress(cs['step'], n)
 
 
         # -- Morse Chain detection --
-        if self.morse_chains:
-            if not hasattr(self, '_mc_hs'): self._mc_hs = {}
-            if not hasattr(self, '_mc_buf'): self._mc_buf = {}
-            if not hasattr(self, '_mc_last'): self._mc_last = {}
-            if not hasattr(self, '_mc_active'): self._mc_active = {}
+        if self._morse_mask is None and self.morse_chains: self._rebuild_morse_mask()
+        if self.morse_chains and (moved[self._morse_mask].any() or any(c > 1 for c in self._mc_code.values()) or any(self._mc_active.values())):
             for chain in self.morse_chains:
                 cid = chain.chain_id; gid = chain.gesture_id()
                 if not gid: continue
-                val = self.lv.get(gid, 0)
-                card_s = self.cards[gid].get_state(); th = card_s['thresholdMin']
-                short_ms = chain.sh_sl.value(); long_ms = chain.lh_sl.value(); timeout_ms = chain.timeout_sl.value()
-                if cid not in self._mc_hs: self._mc_hs[cid] = 0.0
-                if cid not in self._mc_buf: self._mc_buf[cid] = []
-                if cid not in self._mc_last: self._mc_last[cid] = 0.0
-                if cid not in self._mc_active: self._mc_active[cid] = False
-                was_active = self._mc_active[cid]; buf = self._mc_buf[cid]
-                if not was_active and buf and (now_ms - self._mc_last[cid]) > timeout_ms:
-                    self._mc_buf[cid] = []; buf = []; chain.set_progress([], 0.0, False)
-                if val >= th:
+                ends, prefixes, short_ms, long_ms, timeout_ms = chain.tick_params()
+                was_active = self._mc_active[cid]; code = self._mc_code[cid]
+                if not was_active and code > 1 and (now_ms - self._mc_last[cid]) > timeout_ms:
+                    self._mc_code[cid] = code = 1; chain.set_progress((), 0.0, False)
+                if above[GESTURE_INDEX[gid]]:
                     if not was_active: self._mc_hs[cid] = now_ms; self._mc_active[cid] = True
                     held = now_ms - self._mc_hs[cid]
                     if held < short_ms: frac = held / short_ms * 0.5
                     elif held < long_ms: frac = 0.5 + (held - short_ms) / max(1, long_ms - short_ms) * 0.5
                     else: frac = 1.0
-                    chain.set_progress(buf, frac, True)
+                    chain.set_progress(_morse_syms(code), frac, True)
                 else:
                     if was_active:
                         self._mc_active[cid] = False; held = now_ms - self._mc_hs[cid]; self._mc_hs[cid] = 0.0
                         if held >= short_ms:
-                            sym = 'L' if held >= long_ms else 'S'; buf.append(sym); self._mc_last[cid] = now_ms
-                            matched = False
-                            for pat, a_state in chain.get_patterns():
-                                if buf == pat:
-                                    self._mc_buf[cid] = []; buf = []; chain.flash_match()
-                                    self.dc += 1; self.dl.setText(f"Detections: {self.dc}")
-                                    if a_state['action'] == 'toggle_gestures':
-                                        self._toggle_gestures(self._collect_toggle_exempt_gestures(f'morse:{cid}'))
-                                    else:
-                                        threading.Thread(target=execute_action,
-                                            args=(a_state['action'], a_state['keyBind'], a_state.get('launchProgram','') if a_state['action']=='launch_program' else a_state['command'], a_state['macro'], a_state.get('gamepadBtn','')),
-                                            daemon=True).start()
-                                        self._logit(f"\u2505{chain.name_lbl.text()}", a_state['action'], a_state['keyBind'], a_state['macro'], mode_tag='MORSE')
-                                    matched = True; break
-                            if not matched:
-                                is_prefix = any(pat[:len(buf)] == buf for pat, _ in chain.get_patterns())
-                                if not is_prefix: self._mc_buf[cid] = []; buf = []
-                    chain.set_progress(buf, 0.0, False)
+                            code = code << 1 | (held >= long_ms); self._mc_last[cid] = now_ms
+                            # Two int lookups per symbol: a pattern ends here, the input is still a prefix, or neither
+                            row = ends.get(code)
+                            if row is not None:
+                                code = 1; chain.flash_match()
+                                self._dispatch(f"\u2505{chain.name_lbl.text()}", row.get_action_state(), 'MORSE', f'morse:{cid}')
+                            elif code not in prefixes: code = 1
+                            self._mc_code[cid] = code
+                    chain.set_progress(_morse_syms(code), 0.0, False)
 
         # -- Point Tracker processing --
         if self.pt_panel.en.isChecked() and self.pt.active:
@@ -3629,8 +4198,29 @@ class MainWindow(QMainWindow):
                 else:
                     # Split output: process each direction independently
                     pos_val = max(0, nval) * 100; neg_val = max(0, -nval) * 100
-                    self._pt_process_direction(pos_key, pos_val, now_ms)
-                    self._pt_process_direction(neg_key, neg_val, now_ms)
+                    self._pt_process_direction(pos_key, pos_val, now_ms, cd, ht)
+                    self._pt_process_direction(neg_key, neg_val, now_ms, cd, ht)
+
+        # Fire sites only count; the label is written once per frame
+        if self.dc != self._dc_shown: self._dc_shown = self.dc; self.dl.setText(f"Detections: {self.dc}")
+        # This frame's one-shot actions go to the pool as one task
+        if self._pending_actions:
+            self._action_pool.submit(execute_action_batch, self._pending_actions); self._pending_actions = []
+
+    def _fire(self, op, act, kb, cmd, macro, gp_btn, hold=False):
+        """Start one action: holdable actions go down on the hold pool when hold=True, the rest are
+        queued for this frame's batch."""
+        if hold and _OP_HOLDABLE[op]: self._hold_pool.submit(execute_hold_start, act, kb, gp_btn)
+        else: self._pending_actions.append((act, kb, cmd, macro, gp_btn))
+
+    def _dispatch(self, name, a_state, mode_tag, context):
+        """Chain / morse completion: count it, run its action (or flip gestures) and log it."""
+        self.dc += 1; act = a_state['action']
+        if act == 'toggle_gestures':
+            self._toggle_gestures(self._collect_toggle_exempt_gestures(context)); return
+        cmd = a_state.get('launchProgram','') if act == 'launch_program' else a_state['command']
+        self._pending_actions.append((act, a_state['keyBind'], cmd, a_state['macro'], a_state.get('gamepadBtn','')))
+        self._logit(name, act, a_state['keyBind'], a_state['macro'], mode_tag=mode_tag)
 
     def _toggle_gestures_from_btn(self):
         """Called by the UI button — no exempt gestures needed since it's a manual button."""
@@ -3708,60 +4298,106 @@ class MainWindow(QMainWindow):
         cid = self.chain_counter; self.chain_counter += 1
         chain = GestureChainCard(cid)
         chain.chain_deleted.connect(self._remove_chain)
+        # Index refresh is connected first so the claim/release slots see this chain's new gesture set
+        chain.gesture_claimed.connect(partial(self._sync_chain_gids, chain))
+        chain.gesture_released.connect(partial(self._sync_chain_gids, chain))
         chain.gesture_claimed.connect(self._on_gesture_claimed)
         chain.gesture_released.connect(self._on_gesture_released)
         chain.chain_save_requested.connect(self._save_chain_to_lib)
-        self.chains.append(chain)
+        chain.seq_changed.connect(self._invalidate_chain_waiters)
+        self.chains.append(chain); self._chain_waiters = None
         self.chains_layout.addWidget(chain)
         self._update_no_chains_label()
 
     def _remove_chain(self, chain):
         if chain in self.chains:
             # Release all gestures used by this chain
-            for gid in chain.get_all_gesture_ids():
+            for gid in self._untrack_chain(chain):
                 self._on_gesture_released(gid)
-            # Clean up chain state
-            if chain.chain_id in self.chain_state:
-                del self.chain_state[chain.chain_id]
-            self.chains.remove(chain)
+            # Chain state is dropped when the waiter index is rebuilt
+            self.chains.remove(chain); self._chain_waiters = None
             self.chains_layout.removeWidget(chain)
             chain.deleteLater()
             self._update_no_chains_label()
 
+    def _invalidate_chain_waiters(self): self._chain_waiters = None
+
+    def _rebuild_chain_waiters(self):
+        """Index every chain step by its gesture. Progress restarts, since a step may have moved."""
+        waiters = {}; state = {}
+        for chain in self.chains:
+            seq = chain.get_gesture_sequence(); chain.set_progress(0, 0)
+            if len(seq) < 2: continue  # need at least 2 gestures for a chain
+            for i, gid in enumerate(seq): waiters.setdefault(GESTURE_INDEX[gid], []).append((chain, i))
+            state[chain.chain_id] = {'step': 0, 'last_time': 0.0}
+        self.chain_state = state; self._chain_active = {}; self._chain_waiters = waiters
+
     def _add_morse_chain(self):
         cid = self.chain_counter; self.chain_counter += 1
         chain = MorseChainCard(cid)
         chain.chain_deleted.connect(self._remove_morse_chain)
+        # Index refresh is connected first so the claim/release slots see this chain's new gesture set
+        chain.gesture_claimed.connect(partial(self._sync_chain_gids, chain))
+        chain.gesture_released.connect(partial(self._sync_chain_gids, chain))
         chain.gesture_claimed.connect(self._on_gesture_claimed)
         chain.gesture_released.connect(self._on_gesture_released)
         chain.chain_save_requested.connect(self._save_morse_chain_to_lib)
+        chain.gesture_claimed.connect(self._invalidate_morse_mask)
+        chain.gesture_released.connect(self._invalidate_morse_mask)
         chain.connect_reset(lambda cid=cid: self._reset_morse_chain(cid))
-        self.morse_chains.append(chain)
+        self._init_morse_state(cid)
+        self.morse_chains.append(chain); self._morse_mask = None
         self.chains_layout.addWidget(chain)
         self._update_no_chains_label()
 
     def _remove_morse_chain(self, chain):
         if chain in self.morse_chains:
-            for gid in chain.get_all_gesture_ids():
+            for gid in self._untrack_chain(chain):
                 self._on_gesture_released(gid)
             cid = chain.chain_id
-            for d in (getattr(self, '_mc_hs', {}), getattr(self, '_mc_buf', {}),
-                      getattr(self, '_mc_last', {}), getattr(self, '_mc_active', {})):
-                d.pop(cid, None)
-            self.morse_chains.remove(chain)
+            for d in (self._mc_hs, self._mc_code, self._mc_last, self._mc_active): d.pop(cid, None)
+            self.morse_chains.remove(chain); self._morse_mask = None
             self.chains_layout.removeWidget(chain)
             chain.deleteLater()
             self._update_no_chains_label()
 
+    def _invalidate_morse_mask(self, *_): self._morse_mask = None
+
+    def _rebuild_morse_mask(self):
+        m = np.zeros(len(GESTURE_ORDER), bool)
+        for chain in self.morse_chains:
+            gid = chain.gesture_id()
+            if gid: m[GESTURE_INDEX[gid]] = True
+        self._morse_mask = m
+
+    def _init_morse_state(self, cid):
+        """Fresh morse input for one chain: packed code, press start, last symbol time, pressed flag."""
+        self._mc_code[cid] = 1; self._mc_hs[cid] = 0.0; self._mc_last[cid] = 0.0; self._mc_active[cid] = False
+
     def _reset_morse_chain(self, cid):
-        for d in (getattr(self, '_mc_buf', {}), getattr(self, '_mc_hs', {}),
-                  getattr(self, '_mc_last', {}), getattr(self, '_mc_active', {})):
-            if cid in d:
-                if isinstance(d[cid], list): d[cid] = []
-                else: d[cid] = 0.0 if isinstance(d[cid], float) else False
+        self._init_morse_state(cid)
         for chain in self.morse_chains:
             if chain.chain_id == cid: chain.set_progress([], 0.0, False); break
 
+    def _sync_chain_gids(self, chain, *_):
+        """Refresh one chain's entries in the gesture -> chains index after a claim or release."""
+        old = self._chain_gids.get(chain, frozenset()); new = frozenset(chain.get_all_gesture_ids())
+        if old == new: return
+        idx = self._gid_to_chains
+        for gid in old - new:
+            users = idx[gid]; users.discard(chain)
+            if not users: del idx[gid]
+        for gid in new - old: idx.setdefault(gid, set()).add(chain)
+        self._chain_gids[chain] = new
+
+    def _untrack_chain(self, chain):
+        """Drop a chain from the gesture -> chains index; returns the gestures it held."""
+        gids = self._chain_gids.pop(chain, frozenset())
+        for gid in gids:
+            users = self._gid_to_chains[gid]; users.discard(chain)
+            if not users: del self._gid_to_chains[gid]
+        return gids
+
     def _on_gesture_claimed(self, gid):
         """A chain claimed a gesture - disable its individual card."""
         if gid in self.cards:
@@ -3769,11 +4405,7 @@ class MainWindow(QMainWindow):
 
     def _on_gesture_released(self, gid):
         """A chain released a gesture - re-enable if no other chain uses it."""
-        if not gid: return
-        for chain in self.chains:
-            if gid in chain.get_all_gesture_ids(): return
-        for chain in self.morse_chains:
-            if gid in chain.get_all_gesture_ids(): return
+        if not gid or self._gid_to_chains.get(gid): return
         if gid in self.cards:
             self.cards[gid].en.setChecked(True)
 
@@ -3796,9 +4428,7 @@ class MainWindow(QMainWindow):
         self._auto_save()
         # Brief visual feedback
         chain.name_edit.setStyleSheet("font-weight:600;font-size:13px;color:#00ff88;border:1px solid #00ff88;border-radius:4px;background:#00ff8815;padding:1px 4px;")
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(800, lambda: chain.name_edit.setStyleSheet(
-            "font-weight:600;font-size:13px;color:#ffaa00;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px;"))
+        QTimer.singleShot(800, lambda: chain.name_edit.setStyleSheet(""))
 
     def _save_morse_chain_to_lib(self, chain):
         """Save a morse chain to the library."""
@@ -3814,9 +4444,7 @@ class MainWindow(QMainWindow):
         self._auto_save()
         # Brief visual feedback
         chain.name_edit.setStyleSheet("font-weight:600;font-size:13px;color:#00ff88;border:1px solid #00ff88;border-radius:4px;background:#00ff8815;padding:1px 4px;")
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(800, lambda: chain.name_edit.setStyleSheet(
-            "font-weight:600;font-size:13px;color:#ff8844;border:1px solid transparent;border-radius:4px;background:transparent;padding:1px 4px;"))
+        QTimer.singleShot(800, lambda: chain.name_edit.setStyleSheet(""))
 
     def _load_saved_chain(self, index):
         """Load a saved gesture chain from the dropdown."""
@@ -3911,44 +4539,85 @@ class MainWindow(QMainWindow):
         dlg.exec()
 
     def _logit(self,gn,at,kb='',macro='',mode_tag=''):
-        ts=datetime.now().strftime('%H:%M:%S')
         if at=='none': return
         if at=='key': desc=f"Key: {kb}"
         elif at=='macro': desc=f"Macro: {macro[:30]}"
         else: desc=at
         if mode_tag: desc=f"[{mode_tag}] {desc}"
-        self.alog.appendleft(f'<span style="color:#555570;">{ts}</span> <span style="color:#00d4ff;">{gn}</span> \u2192 <span style="color:#00ff88;">{desc} \u2714</span>')
-        self.logl.setText('<br>'.join(list(self.alog)[:8]))
+        # Lines logged during one frame (or any other event) reach the list in a single flush
+        if not self._log_pending: QTimer.singleShot(0, self._flush_log)
+        self._log_pending.append(f"{datetime.now():%H:%M:%S}  {gn} \u2192 {desc} \u2714")
+
+    def _flush_log(self):
+        rows = self._log_pending[:-ACTION_LOG_MAX-1:-1]; self._log_pending = []  # newest first
+        if not rows: return
+        if self._log_empty: self.logl.clear(); self._log_empty = False
+        # Fixed pool of ACTION_LOG_MAX rows: once full, the oldest item is retexted and moved to the top
+        lst = self.logl; lst.setUpdatesEnabled(False)
+        for text in reversed(rows):
+            if lst.count() < ACTION_LOG_MAX: lst.insertItem(0, text); continue
+            it = lst.takeItem(ACTION_LOG_MAX - 1); it.setText(text); lst.insertItem(0, it)
+        lst.setUpdatesEnabled(True)
 
     def _exp(self):
         cfg = self._get_cfg()
         p,_=QFileDialog.getSaveFileName(self,"Export","gestures_config.json","JSON (*.json)")
         if p:
-            with open(p,'w') as f: json.dump(cfg,f,indent=2)
+            # cfg is a fresh snapshot, so serialising and writing it can leave the UI thread
+            self._io_pool.submit(_write_json, p, cfg, "Export")
             self._auto_save()
 
     def _imp(self):
         p,_=QFileDialog.getOpenFileName(self,"Import","","JSON (*.json)")
         if not p: return
         try:
-            with open(p) as f: cfg=json.load(f)
-            self._apply_cfg(cfg)
+            cfg=_load_json(p)
+            self._with_cards_muted(partial(self._apply_cfg, cfg))
             self._auto_save()
         except Exception as e: print(f"Import error: {e}")
 
     def _rst(self):
-        # Remove all chains
-        for ch in list(self.chains): self._remove_chain(ch)
-        for ch in list(self.morse_chains): self._remove_morse_chain(ch)
-        for c in self.cards.values(): c.reset_def()
+        self._with_cards_muted(self._reset_cards)
         self.sms.setValue(12); self.cds.setValue(650); self.hds.setValue(200); self.pcs.setValue(35)
         self.zs.setValue(100); self.pxs.setValue(0); self.pys.setValue(0)
         self._reset_cam_settings(); self.res_cb.setCurrentIndex(1)
         self._pt_clear(); self.pt_panel.en.setChecked(False)
         self._auto_save()
 
+    def _reset_cards(self):
+        self._clear_chains()
+        for c in self.cards.values(): c.reset_def()
+
+    def _with_cards_muted(self, fn):
+        """Run a bulk edit with every card's changed signal blocked, then rebuild the caches once."""
+        cards = tuple(self.cards.values())
+        for c in cards: c.blockSignals(True)
+        try: fn()
+        finally:
+            for c in cards: c.blockSignals(False)
+            self._recompute_caches()
+
+    def _recompute_caches(self):
+        """One pass over every card: sensitivity / dead-zone arrays, trigger tuples and kernel mirrors,
+        plus the chain / morse indexes and the card-count labels."""
+        for gid, card in self.cards.items():
+            self._set_sens(gid, card.ss.value()); self._set_dz(gid, card.dzs.value()); self._cache_card(card)
+        self._chain_waiters = None; self._morse_mask = None
+        self._update_lr_filter(); self._update_active_lbl()
+
+    def _clear_chains(self):
+        """Drop every chain and morse chain in one pass, then release their gestures once each."""
+        gids = set()
+        for ch in self.chains + self.morse_chains:
+            gids |= self._untrack_chain(ch); ch.hide(); ch.deleteLater()
+        self.chains = []; self.morse_chains = []
+        self._chain_waiters = None; self._morse_mask = None
+        for d in (self._mc_hs, self._mc_code, self._mc_last, self._mc_active): d.clear()
+        for gid in gids: self._on_gesture_released(gid)
+        self._update_no_chains_label()
+
     def _get_cfg(self):
-        return {'version':'0.7.0','gestures':{gid:c.get_state() for gid,c in self.cards.items()},
+        return {'version':'0.8.0','gestures':{gid:c.get_state() for gid,c in self.cards.items()},
              'chains':[c.get_state() for c in self.chains],
              'morse_chains':[c.get_state() for c in self.morse_chains],
              'saved_chains_lib': dict(self.saved_chains_lib),
@@ -3960,12 +4629,12 @@ class MainWindow(QMainWindow):
              'global':{'smoothing':self.sms.value(),'cooldown':self.cds.value(),'holdTime':self.hds.value(),'tiltComp':self.pcs.value(),'zoom':self.zs.value(),'panX':self.pxs.value(),'panY':self.pys.value()}}
 
     def _apply_cfg(self, cfg):
+        if _profile_version(cfg) < MACRO_ESCAPE_VERSION: cfg = _migrate_cfg_macros(cfg)
         if 'gestures' in cfg:
             for gid,s in cfg['gestures'].items():
                 if gid in self.cards: self.cards[gid].set_state(s)
         # Remove existing chains first
-        for ch in list(self.chains): self._remove_chain(ch)
-        for ch in list(self.morse_chains): self._remove_morse_chain(ch)
+        self._clear_chains()
         if 'chains' in cfg:
             for cs in cfg['chains']:
                 self._add_chain()
@@ -3996,25 +4665,28 @@ class MainWindow(QMainWindow):
             self.pxs.setValue(g.get('panX',0)); self.pys.setValue(g.get('panY',0))
 
     def _auto_save(self):
-        try:
-            cfg = self._get_cfg()
-            with open(self._auto_profile, 'w') as f: json.dump(cfg, f, indent=2)
+        try: self._io_pool.submit(_write_json, self._auto_profile, self._get_cfg(), "Auto-save")
         except Exception as e: print(f"Auto-save error: {e}")
 
     def _auto_load(self):
         if os.path.exists(self._auto_profile):
             try:
-                with open(self._auto_profile) as f: cfg = json.load(f)
-                self._apply_cfg(cfg)
+                self._with_cards_muted(partial(self._apply_cfg, _load_json(self._auto_profile)))
             except Exception as e: print(f"Auto-load error: {e}")
 
-    def closeEvent(self,e): self._auto_save(); self._release_all_holds(); self._stop(); VirtualGamepad.destroy(); e.accept()
+    def closeEvent(self,e):
+        if not self._card_queue: self._auto_save()  # never save a profile from a half-built card grid
+        self._release_all_holds(); self._stop()
+        self._action_pool.shutdown(wait=False)
+        self._hold_pool.shutdown(wait=True)  # the queued releases must run before the gamepad is destroyed
+        self._io_pool.shutdown(wait=True)  # let the final profile write land before exit
+        VirtualGamepad.destroy(); e.accept()
 
 # ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â ENTRY ÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚ÂÃƒÂ¢Ã¢â‚¬Â¢Ã‚Â
 
 if __name__ == '__main__':
     try:
-        app=QApplication(sys.argv); app.setStyleSheet(SS)
+        app=QApplication(sys.argv); install_stylesheet(app)
         w=MainWindow(); w.show(); sys.exit(app.exec())
     except Exception:
         import traceback; traceback.print_exc()
@@ -13,7 +13,7 @@ cd /d "%~dp0"
 title FaceCommand
 echo.
 echo  Installing dependencies...
-py -3.12 -m pip install PyQt6 opencv-python==4.10.0.84 mediapipe==0.10.31 numpy==1.26.4 vgamepad --quiet
+py -3.12 -m pip install PyQt6 opencv-python==4.10.0.84 mediapipe==0.10.31 numpy==1.26.4 numba orjson vgamepad --quiet
 echo.
 echo  NOTE: Virtual gamepad requires ViGEmBus driver.
 echo  Download from: https://github.com/nefarius/ViGEmBus/releases